@@ -0,0 +1,96 @@
+"""
+Startup benchmark based on ``python -X importtime``
+
+Runs each entry point in a fresh interpreter several times and reports the
+median wall time, the total import time and the slowest top-level imports.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs N] [--top K] [--output results.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# Name and interpreter arguments of every measured entry point
+TARGETS = (
+    ("import cli", ["-c", "import github_showcase.cli"]),
+    ("--help", ["-m", "github_showcase", "--help"]),
+    ("import fetch stack", ["-c", "import github_showcase.utils.github_api"]),
+    ("import everything", ["-c", "import github_showcase.cli, github_showcase.core.batch, "
+                                 "github_showcase.core.sharding"]),
+)
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    Parse ``-X importtime`` output.
+
+    Returns:
+        List[Tuple[str, int, int]]: Module, self and cumulative microseconds of each top-level import
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below the module importing them
+        if not name[1:].startswith(" "):
+            imports.append((name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+def measure(args: List[str], runs: int) -> Dict:
+    """Run one entry point ``runs`` times and summarise its startup cost."""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    walls, totals, runs_imports = [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-X", "importtime", *args], env=env,
+                                   capture_output=True, text=True)
+        walls.append(time.perf_counter() - start)
+        if completed.returncode != 0:
+            raise Exception(f"{' '.join(args)} failed:\n{completed.stderr[-2000:]}")
+        imports = parse_importtime(completed.stderr)
+        totals.append(sum(cumulative for _, _, cumulative in imports))
+        runs_imports.append(imports)
+
+    # Slowest top-level imports of the median run
+    median_run = runs_imports[totals.index(sorted(totals)[len(totals) // 2])]
+    return {
+        'wall_ms': round(statistics.median(walls) * 1000, 2),
+        'import_ms': round(statistics.median(totals) / 1000, 2),
+        'modules': len(median_run),
+        'slowest': sorted(((name, round(cumulative / 1000, 2)) for name, _, cumulative in median_run),
+                          key=lambda item: -item[1]),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="Interpreter launches per entry point")
+    parser.add_argument("--top", type=int, default=5, help="Slowest top-level imports listed per entry point")
+    parser.add_argument("--output", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    baseline = measure(["-c", "pass"], args.runs)
+    results = {'interpreter': {'wall_ms': baseline['wall_ms'], 'import_ms': baseline['import_ms']}}
+    print(f"bare interpreter: {baseline['wall_ms']:.1f} ms wall, {baseline['import_ms']:.1f} ms imports")
+    for name, target in TARGETS:
+        result = measure(target, args.runs)
+        result['slowest'] = result['slowest'][:args.top]
+        results[name] = result
+        print(f"{name}: {result['wall_ms']:.1f} ms wall, {result['import_ms']:.1f} ms imports")
+        for module, cumulative in result['slowest']:
+            print(f"   {cumulative:8.2f} ms  {module}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
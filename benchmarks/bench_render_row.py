@@ -0,0 +1,46 @@
+"""
+Micro-benchmark for the per-row cost of the showcase page template
+
+Usage:
+    python benchmarks/bench_render_row.py [--rows N] [--repeat R]
+"""
+import argparse
+import timeit
+from github_showcase.config.settings import TECH_FILTERS
+from github_showcase.core.tag_index import get_tag_index
+from github_showcase.core.templates import render_filters, render_row
+from github_showcase.utils.repo import Repo, repo_from_api
+
+def make_repo(index: int) -> Repo:
+    """Build a synthetic repository with typical field sizes."""
+    return repo_from_api({
+        'name': f"project-{index}",
+        'full_name': f"someone/project-{index}",
+        'description': f"Sample project {index} showing <Docker> & \"Kubernetes\" deployments on AWS",
+        'homepage': f"https://example.com/project-{index}" if index % 2 else None,
+        'html_url': f"https://github.com/someone/project-{index}",
+        'topics': ["aws", "docker", "k8s", "terraform", "ci-cd"][:index % 6],
+        'pushed_at': "2024-01-01T00:00:00Z",
+    })
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="Rows rendered per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements")
+    args = parser.parse_args()
+
+    repos = [make_repo(i) for i in range(args.rows)]
+    tags = get_tag_index(TECH_FILTERS)
+
+    def sidebar():
+        masks = [tags.mask(repo.topics) for repo in repos]
+        return render_filters(TECH_FILTERS, tags.counts(masks))
+
+    row_times = timeit.repeat(lambda: [render_row(repo) for repo in repos], number=1, repeat=args.repeat)
+    sidebar_times = timeit.repeat(sidebar, number=1, repeat=args.repeat)
+
+    print(f"render_row: {min(row_times) / args.rows * 1e6:.2f} us/row (best of {args.repeat}, {args.rows} rows)")
+    print(f"filter masks and sidebar: {min(sidebar_times) / args.rows * 1e6:.2f} us/row")
+
+if __name__ == "__main__":
+    main()
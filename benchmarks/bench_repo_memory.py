@@ -0,0 +1,98 @@
+"""
+Memory benchmark comparing raw API repository dicts with Repo records
+
+Usage:
+    python benchmarks/bench_repo_memory.py [--repos N]
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+from github_showcase.utils.repo import repo_from_api
+
+URL_FIELDS = (
+    "forks", "keys", "collaborators", "teams", "hooks", "issue_events", "events", "assignees",
+    "branches", "tags", "blobs", "git_tags", "git_refs", "trees", "statuses", "languages",
+    "stargazers", "contributors", "subscribers", "subscription", "commits", "git_commits",
+    "comments", "issue_comment", "contents", "compare", "merges", "archive", "downloads",
+    "issues", "pulls", "milestones", "notifications", "labels", "releases", "deployments",
+)
+
+def make_payload(index: int) -> dict:
+    """Build a repository as returned by GET /users/{user}/repos, with every field it carries."""
+    api = f"https://api.github.com/repos/someone/project-{index}"
+    payload = {
+        'id': 100000 + index,
+        'node_id': f"R_kgDOH{index:08d}",
+        'name': f"project-{index}",
+        'full_name': f"someone/project-{index}",
+        'private': False,
+        'owner': {
+            'login': "someone", 'id': 1, 'node_id': "MDQ6VXNlcjE=",
+            'avatar_url': "https://avatars.githubusercontent.com/u/1?v=4", 'gravatar_id': "",
+            'url': "https://api.github.com/users/someone", 'html_url': "https://github.com/someone",
+            'type': "User", 'site_admin': False,
+        },
+        'html_url': f"https://github.com/someone/project-{index}",
+        'description': f"Sample project {index} showing Docker & Kubernetes deployments on AWS",
+        'fork': False,
+        'url': api,
+        'created_at': "2023-01-01T00:00:00Z",
+        'updated_at': "2024-01-01T00:00:00Z",
+        'pushed_at': "2024-01-01T00:00:00Z",
+        'git_url': f"git://github.com/someone/project-{index}.git",
+        'ssh_url': f"git@github.com:someone/project-{index}.git",
+        'clone_url': f"https://github.com/someone/project-{index}.git",
+        'svn_url': f"https://github.com/someone/project-{index}",
+        'homepage': f"https://example.com/project-{index}" if index % 2 else None,
+        'size': 1024, 'stargazers_count': index % 50, 'watchers_count': index % 50,
+        'language': "Python", 'has_issues': True, 'has_projects': True, 'has_downloads': True,
+        'has_wiki': True, 'has_pages': False, 'has_discussions': False, 'forks_count': 0,
+        'mirror_url': None, 'archived': False, 'disabled': False, 'open_issues_count': 0,
+        'license': {'key': "mit", 'name': "MIT License", 'spdx_id': "MIT",
+                    'url': "https://api.github.com/licenses/mit", 'node_id': "MDc6TGljZW5zZTEz"},
+        'allow_forking': True, 'is_template': False, 'web_commit_signoff_required': False,
+        'topics': ["aws", "docker", "kubernetes", "terraform", "ci-cd"][:index % 6],
+        'visibility': "public", 'forks': 0, 'open_issues': 0, 'watchers': index % 50,
+        'default_branch': "main",
+    }
+    for field in URL_FIELDS:
+        payload[f"{field}_url"] = f"{api}/{field}"
+    return payload
+
+def measure(build) -> int:
+    """Return the bytes still allocated by the object ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repos", type=int, default=10000, help="Number of repositories")
+    args = parser.parse_args()
+
+    # Parsed from JSON like the real responses, so no strings are shared between repositories
+    text = json.dumps([make_payload(i) for i in range(args.repos)])
+
+    def raw():
+        return json.loads(text)
+
+    def slim():
+        payload = json.loads(text)
+        repos = [repo_from_api(repo) for repo in payload]
+        del payload
+        return repos
+
+    raw_bytes = measure(raw)
+    slim_bytes = measure(slim)
+    print(f"raw dicts:    {raw_bytes / args.repos:8.0f} bytes/repo ({raw_bytes / 2**20:.1f} MiB for {args.repos} repos)")
+    print(f"Repo records: {slim_bytes / args.repos:8.0f} bytes/repo ({slim_bytes / 2**20:.1f} MiB for {args.repos} repos)")
+    print(f"reduction:    {raw_bytes / slim_bytes:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+End-to-end benchmark suite against the local fake GitHub API
+
+Fetches, enriches and renders synthetic accounts of 100, 1k and 10k repositories and
+reports throughput, request latency percentiles, peak memory and output size
+per scenario. Results can be saved as a baseline and later runs compared to it.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 100 1000 10000] [--latency S] [--repeat R]
+                                     [--output results.json] [--save-baseline PATH]
+                                     [--baseline PATH] [--threshold PCT]
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+from fake_github import FakeGitHub
+
+# Metrics compared against the baseline; all of them are better when lower
+COMPARED_METRICS = ('seconds', 'p50_ms', 'p95_ms', 'p99_ms', 'peak_bytes', 'output_bytes')
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile, 0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+def account_name(size: int) -> str:
+    """Synthetic username holding ``size`` repositories."""
+    return f"bench{size}"
+
+def run_scenario(run: Callable[[], Tuple[int, Dict]], repeat: int, memory: bool) -> Dict:
+    """
+    Time a scenario ``repeat`` times and optionally measure its peak memory once more.
+
+    ``run`` returns the number of processed items and extra result fields.
+    """
+    from github_showcase.utils.instrumentation import metrics
+
+    best = None
+    latencies = []
+    extra = {}
+    for _ in range(repeat):
+        metrics.enable()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            items, extra = run()
+            elapsed = time.perf_counter() - start
+        latencies.extend(request['latency'] for request in metrics.report()['requests']['items'])
+        best = elapsed if best is None else min(best, elapsed)
+    metrics.enabled = False
+
+    result = {
+        'seconds': round(best, 6),
+        'items': items,
+        'items_per_second': round(items / best, 1) if best else 0.0,
+        'requests': len(latencies) // repeat,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+    }
+    if memory:
+        # Separate pass: tracemalloc slows allocation-heavy code down too much to time under it
+        tracemalloc.start()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            run()
+        result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    result.update(extra)
+    return result
+
+def run_suite(args: argparse.Namespace) -> Dict:
+    """Run every scenario for every account size."""
+    accounts = {account_name(size): size for size in args.sizes}
+    fake = FakeGitHub(accounts, latency=args.latency)
+    os.environ['GITHUB_API_URL'] = fake.start()
+    # The GraphQL backend insists on a token; the fake server never checks it
+    os.environ.setdefault('GITHUB_TOKEN', 'fake-github-token')
+
+    # Imported after GITHUB_API_URL is set, settings read it at import time
+    from github_showcase.core.pipeline import render_output
+    from github_showcase.utils.enrichment import EnrichmentCache, enrich_repositories
+    from github_showcase.utils.github_api import get_all_repositories
+    from github_showcase.utils.http_cache import HttpCache
+    from github_showcase.utils.rate_limit import RateLimitHandler
+
+    work_dir = tempfile.mkdtemp(prefix="showcase-bench-")
+    results = {}
+    try:
+        for size in args.sizes:
+            username = account_name(size)
+            fake.repos(username)  # Generate the account outside the timed runs
+            cache = HttpCache(os.path.join(work_dir, 'http'), 512 * 2**20)
+
+            def fetch(handler_cache=None, backend='rest', sources=None):
+                repos = get_all_repositories(RateLimitHandler(cache=handler_cache), concurrency=args.concurrency,
+                                             backend=backend, username=username, sources=sources)
+                return len(repos), {}
+
+            def fetch_cold():
+                shutil.rmtree(cache.cache_dir, ignore_errors=True)
+                os.makedirs(cache.cache_dir, exist_ok=True)
+                return fetch(cache)
+
+            results[f"fetch_rest/{size}"] = run_scenario(lambda: fetch(None), args.repeat, args.memory)
+            results[f"fetch_graphql/{size}"] = run_scenario(lambda: fetch(None, 'graphql'), args.repeat, args.memory)
+            # Listed as an organization, forks stay on the server
+            results[f"fetch_org_rest/{size}"] = run_scenario(
+                lambda: fetch(None, sources=[f"org:{username}"]), args.repeat, args.memory)
+            results[f"fetch_cache_cold/{size}"] = run_scenario(fetch_cold, args.repeat, args.memory)
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                fetch(cache)
+                repos = get_all_repositories(RateLimitHandler(), username=username)
+            results[f"fetch_cache_warm/{size}"] = run_scenario(lambda: fetch(cache), args.repeat, args.memory)
+
+            # Two requests per repository; cold refetches everything, warm finds every push cached
+            if size <= 1000:
+                enrichment_file = os.path.join(work_dir, f"{username}-enrichment.json")
+                enrich_cache_dir = os.path.join(work_dir, f"{username}-http")
+
+                def enrich(cold: bool):
+                    # Through the HTTP cache like the CLI, which stores both responses of every repository
+                    if cold:
+                        shutil.rmtree(enrich_cache_dir, ignore_errors=True)
+                        if os.path.exists(enrichment_file):
+                            os.remove(enrichment_file)
+                    handler = RateLimitHandler(cache=HttpCache(enrich_cache_dir, 512 * 2**20))
+                    return len(enrich_repositories(repos, handler, EnrichmentCache(enrichment_file))), {}
+
+                results[f"enrich_cold/{size}"] = run_scenario(lambda: enrich(True), args.repeat, args.memory)
+                results[f"enrich_warm/{size}"] = run_scenario(lambda: enrich(False), args.repeat, args.memory)
+
+            for mode in ('full', 'paged'):
+                output = os.path.join(work_dir, f"{username}-{mode}.html")
+
+                def render(mode=mode, output=output):
+                    rendered = render_output(repos, output, {'table_mode': mode})
+                    return len(repos), {'output_bytes': rendered['bytes']}
+
+                results[f"render_{mode}/{size}"] = run_scenario(render, args.repeat, args.memory)
+
+        # Secondary rate limits on every third request, answered with Retry-After: 0. Pages are
+        # fetched one by one so a retry never lands on the next limited slot.
+        fake.rate_limit_every = 3
+        fake.reset_counters()
+        size = min(args.sizes, key=lambda count: abs(count - 1000))
+        username = account_name(size)
+        results[f"fetch_rate_limited/{size}"] = run_scenario(
+            lambda: (len(get_all_repositories(RateLimitHandler(), concurrency=1, username=username)), {}),
+            1, False,
+        )
+        results[f"fetch_rate_limited/{size}"]['rate_limited'] = fake.counters['rate_limited']
+    finally:
+        fake.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'latency': args.latency,
+            'concurrency': args.concurrency,
+            'repeat': args.repeat,
+            'created': time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        'results': results,
+    }
+
+def print_results(report: Dict) -> None:
+    """Print one line per scenario."""
+    print(f"{'scenario':<26}{'seconds':>10}{'items/s':>12}{'req':>6}{'p50 ms':>9}{'p95 ms':>9}"
+          f"{'p99 ms':>9}{'peak MiB':>10}{'output KiB':>12}")
+    for name, result in report['results'].items():
+        peak = f"{result['peak_bytes'] / 2**20:.1f}" if 'peak_bytes' in result else '-'
+        output = f"{result['output_bytes'] / 1024:.0f}" if 'output_bytes' in result else '-'
+        print(f"{name:<26}{result['seconds']:>10.4f}{result['items_per_second']:>12.0f}{result['requests']:>6}"
+              f"{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}{result['p99_ms']:>9.2f}{peak:>10}{output:>12}")
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Print the change of every compared metric against the baseline.
+
+    Returns:
+        List[str]: ``scenario metric`` entries that got worse by more than ``threshold`` percent
+    """
+    regressions = []
+    print(f"\nCompared to baseline from {baseline['meta'].get('created', 'unknown')} "
+          f"(regression threshold {threshold:.0f}%):")
+    for name, result in report['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            print(f" {name}: not in baseline")
+            continue
+        changes = []
+        for metric in COMPARED_METRICS:
+            if metric not in result or not previous.get(metric):
+                continue
+            delta = (result[metric] - previous[metric]) / previous[metric] * 100
+            flag = ''
+            if delta > threshold:
+                flag = ' !'
+                regressions.append(f"{name} {metric}")
+            changes.append(f"{metric} {delta:+.1f}%{flag}")
+        print(f" {name}: {', '.join(changes)}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="Repositories per synthetic account")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the fake server adds per response")
+    parser.add_argument("--concurrency", type=int, default=4, help="Pages fetched in parallel")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario, the best one is kept")
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="Skip the tracemalloc pass measuring peak memory")
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the results as the new baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare the results against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Percent a metric may grow before it counts as a regression")
+    args = parser.parse_args()
+
+    report = run_suite(args)
+    print_results(report)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Local stand-in for the GitHub API used by the benchmarks
+
+Serves synthetic accounts through the endpoints the generator calls:
+``GET /users/{user}/repos`` and ``/orgs/{org}/repos`` (Link pagination, ETag / 304,
+rate-limit headers, ``type=sources`` leaving forks out), ``POST /graphql`` (honouring
+``isFork: false, isArchived: false``) and the enrichment endpoints
+``GET /repos/{owner}/{repo}/languages`` and ``/readme``, plus the event feeds
+``GET /users/{user}/events`` and ``/orgs/{org}/events`` (ETag / 304, X-Poll-Interval),
+fed by ``FakeGitHub.push``. Latency and secondary
+rate-limit 403s are configurable. Any account can be listed as a user or an organization.
+
+Usage:
+    python benchmarks/fake_github.py [--port P] [--latency S] [--rate-limit-every N] [--accounts user=count ...]
+
+Then point the generator at it with ``GITHUB_API_URL=http://127.0.0.1:P``.
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+TOPICS = ["aws", "docker", "kubernetes", "terraform", "python", "linux", "ci-cd", "grafana"]
+
+def make_repo_payload(owner: str, index: int) -> Dict:
+    """Build a repository in the shape of the REST API, with a spread of filterable flags."""
+    name = f"project-{index}"
+    api = f"https://api.github.com/repos/{owner}/{name}"
+    return {
+        'id': 100000 + index,
+        'node_id': f"R_kgDOH{index:08d}",
+        'name': name,
+        'full_name': f"{owner}/{name}",
+        'private': False,
+        'owner': {'login': owner, 'id': 1, 'type': "User", 'site_admin': False,
+                  'html_url': f"https://github.com/{owner}", 'url': f"https://api.github.com/users/{owner}"},
+        'html_url': f"https://github.com/{owner}/{name}",
+        'description': f"Sample project {index} showing <Docker> & Kubernetes deployments" if index % 5 else None,
+        'fork': index % 11 == 0,
+        'archived': index % 13 == 0,
+        'url': api,
+        'clone_url': f"https://github.com/{owner}/{name}.git",
+        'ssh_url': f"git@github.com:{owner}/{name}.git",
+        'homepage': f"https://example.com/{name}" if index % 3 == 0 else None,
+        'created_at': "2023-01-01T00:00:00Z",
+        'updated_at': "2024-06-01T00:00:00Z",
+        # Newer repositories are pushed more recently, reversed by the generator's sort
+        'pushed_at': time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(1700000000 + index * 60)),
+        'stargazers_count': index % 97,
+        'language': "Python",
+        'topics': [TOPICS[(index + offset) % len(TOPICS)] for offset in range(index % 4)],
+        'visibility': "public",
+        'default_branch': "main",
+        'issues_url': f"{api}/issues{{/number}}",
+        'pulls_url': f"{api}/pulls{{/number}}",
+        'releases_url': f"{api}/releases{{/id}}",
+    }
+
+def make_languages(index: int) -> Dict[str, int]:
+    """Language breakdown of a synthetic repository, in bytes of code."""
+    languages = {"Python": 5000 + index * 7, "Shell": 300 + index % 50 * 40}
+    if index % 3 == 0:
+        languages["HCL"] = 2000 + index % 17 * 500
+    return languages
+
+def make_readme(owner: str, index: int) -> Optional[str]:
+    """README of a synthetic repository, None for every fourth one."""
+    if index % 4 == 0:
+        return None
+    return (f"# project-{index}\n\n"
+            f"[![CI](https://github.com/{owner}/project-{index}/actions/workflows/ci.yml/badge.svg)](https://example.com)\n\n"
+            f"Automates the **deployment** of [service {index}](https://example.com/{index}) with Terraform "
+            f"and Kubernetes, including monitoring dashboards and alerting rules.\n\n"
+            f"## Setup\n\n```bash\nmake deploy\n```\n")
+
+class FakeGitHub:
+    """
+    Threaded fake GitHub API server.
+
+    Args:
+        accounts (Dict[str, int]): Number of repositories per username
+        latency (float): Seconds added before every response
+        rate_limit_every (int): Answer every N-th request with a secondary rate-limit 403, 0 to disable
+        retry_after (int): Retry-After seconds sent with the 403
+        poll_interval (int): X-Poll-Interval seconds sent with the event feeds, 0 to leave it out
+    """
+
+    def __init__(self, accounts: Dict[str, int], latency: float = 0.0,
+                 rate_limit_every: int = 0, retry_after: int = 0, poll_interval: int = 60):
+        self.accounts = dict(accounts)
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.poll_interval = poll_interval
+        self.counters = {'requests': 0, 'not_modified': 0, 'rate_limited': 0}
+        self._lock = threading.Lock()
+        self._repos: Dict[str, List[Dict]] = {}
+        self._pages: Dict[Tuple[str, int, int, bool], Tuple[bytes, str]] = {}
+        self._events: Dict[str, List[Dict]] = {}
+        self._next_event_id = 20000000000
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as GITHUB_API_URL."""
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def repos(self, username: str) -> List[Dict]:
+        """Get the synthetic repositories of an account, generated on first use."""
+        with self._lock:
+            if username not in self._repos:
+                self._repos[username] = [make_repo_payload(username, index)
+                                         for index in range(self.accounts.get(username, 0))]
+            return self._repos[username]
+
+    def listing(self, username: str, sources_only: bool = False) -> List[Dict]:
+        """Get the repositories of an account, without forks when ``sources_only`` is set."""
+        repos = self.repos(username)
+        return [repo for repo in repos if not repo['fork']] if sources_only else repos
+
+    def page(self, username: str, page: int, per_page: int, sources_only: bool = False) -> Tuple[bytes, str]:
+        """Get the encoded body and ETag of a REST page, encoded once and reused."""
+        key = (username, page, per_page, sources_only)
+        with self._lock:
+            cached = self._pages.get(key)
+        if cached is None:
+            repos = self.listing(username, sources_only)
+            body = json.dumps(repos[(page - 1) * per_page:page * per_page]).encode('utf-8')
+            cached = (body, '"' + hashlib.sha1(body).hexdigest() + '"')
+            with self._lock:
+                self._pages[key] = cached
+        return cached
+
+    def push(self, username: str, index: int) -> None:
+        """Simulate a push to one repository: bump its ``pushed_at`` and add a PushEvent to the feed."""
+        repo = self.repos(username)[index]
+        with self._lock:
+            repo['pushed_at'] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            self._pages = {key: page for key, page in self._pages.items() if key[0] != username}
+        self.add_event(username, 'PushEvent', repo['full_name'])
+
+    def add_event(self, username: str, event_type: str, repo_name: str) -> None:
+        """Add an event on a repository to the front of an account's feed."""
+        with self._lock:
+            self._next_event_id += 1
+            self._events.setdefault(username, []).insert(0, {
+                'id': str(self._next_event_id),
+                'type': event_type,
+                'actor': {'login': username},
+                'repo': {'name': repo_name},
+                'created_at': time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            })
+
+    def events(self, username: str, per_page: int) -> List[Dict]:
+        """Get the newest events of an account, newest first."""
+        with self._lock:
+            return list(self._events.get(username, [])[:per_page])
+
+    def count_request(self) -> bool:
+        """Count a request and tell whether it should be rate limited."""
+        with self._lock:
+            self.counters['requests'] += 1
+            limited = self.rate_limit_every > 0 and self.counters['requests'] % self.rate_limit_every == 0
+            if limited:
+                self.counters['rate_limited'] += 1
+            return limited
+
+    def reset_counters(self) -> None:
+        """Zero the request counters between scenarios."""
+        with self._lock:
+            self.counters = {key: 0 for key in self.counters}
+
+    def start(self) -> str:
+        """Start serving on a free local port in a daemon thread and return the base URL."""
+        handler = type('Handler', (_Handler,), {'fake': self})
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like api.github.com
+    # Headers and body are written separately; with Nagle on, small replies stall on delayed ACKs
+    disable_nagle_algorithm = True
+    fake: FakeGitHub = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b'', headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('X-RateLimit-Limit', '5000')
+        self.send_header('X-RateLimit-Remaining', '4999')
+        self.send_header('X-RateLimit-Reset', str(int(time.time()) + 3600))
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _begin(self) -> bool:
+        """Apply latency and rate limiting; returns False when the request was answered with a 403."""
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+        if self.fake.count_request():
+            body = json.dumps({'message': "You have exceeded a secondary rate limit."}).encode('utf-8')
+            self._send(403, body, {'Content-Type': 'application/json', 'Retry-After': str(self.fake.retry_after)})
+            return False
+        return True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = url.path.strip('/').split('/')
+        if len(parts) == 4 and parts[0] == 'repos' and parts[3] in ('languages', 'readme'):
+            self._repository(parts[1], parts[2], parts[3])
+            return
+        if len(parts) == 3 and parts[0] in ('users', 'orgs') and parts[2] == 'events':
+            self._events(parts[1], parse_qs(url.query))
+            return
+        if len(parts) != 3 or parts[0] not in ('users', 'orgs') or parts[2] != 'repos':
+            self._send(404, b'{"message": "Not Found"}', {'Content-Type': 'application/json'})
+            return
+        if not self._begin():
+            return
+
+        username = parts[1]
+        query = parse_qs(url.query)
+        page = int(query.get('page', ['1'])[0])
+        per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+        sources_only = parts[0] == 'orgs' and query.get('type', ['all'])[0] == 'sources'
+        body, etag = self.fake.page(username, page, per_page, sources_only)
+        if self.headers.get('If-None-Match') == etag:
+            with self.fake._lock:
+                self.fake.counters['not_modified'] += 1
+            self._send(304, headers={'ETag': etag})
+            return
+
+        headers = {'Content-Type': 'application/json; charset=utf-8', 'ETag': etag}
+        last = max((len(self.fake.listing(username, sources_only)) + per_page - 1) // per_page, 1)
+        base = f"{self.fake.url}{url.path}"
+        kind = '&type=sources' if sources_only else ''
+        links = []
+        if page < last:
+            links.append(f'<{base}?page={page + 1}&per_page={per_page}{kind}>; rel="next"')
+            links.append(f'<{base}?page={last}&per_page={per_page}{kind}>; rel="last"')
+        if page > 1:
+            links.append(f'<{base}?page=1&per_page={per_page}{kind}>; rel="first"')
+        if links:
+            headers['Link'] = ', '.join(links)
+        self._send(200, body, headers)
+
+    def _events(self, username: str, query: Dict[str, List[str]]) -> None:
+        """Answer an event feed, with a 304 while it has no new events."""
+        if not self._begin():
+            return
+        per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+        body = json.dumps(self.fake.events(username, per_page)).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers = {'ETag': etag}
+        if self.fake.poll_interval:
+            headers['X-Poll-Interval'] = str(self.fake.poll_interval)
+        if self.headers.get('If-None-Match') == etag:
+            with self.fake._lock:
+                self.fake.counters['not_modified'] += 1
+            self._send(304, headers=headers)
+            return
+        headers['Content-Type'] = 'application/json; charset=utf-8'
+        self._send(200, body, headers)
+
+    def _repository(self, owner: str, name: str, resource: str) -> None:
+        """Answer the per-repository enrichment endpoints."""
+        prefix, _, index = name.rpartition('-')
+        if prefix != 'project' or not index.isdigit() or int(index) >= len(self.fake.repos(owner)):
+            self._send(404, b'{"message": "Not Found"}', {'Content-Type': 'application/json'})
+            return
+        if not self._begin():
+            return
+        if resource == 'languages':
+            body = json.dumps(make_languages(int(index))).encode('utf-8')
+            self._send_validated(body, {'Content-Type': 'application/json; charset=utf-8'})
+            return
+        readme = make_readme(owner, int(index))
+        if readme is None:
+            self._send(404, b'{"message": "Not Found"}', {'Content-Type': 'application/json'})
+            return
+        self._send_validated(readme.encode('utf-8'), {'Content-Type': 'application/vnd.github.raw; charset=utf-8'})
+
+    def _send_validated(self, body: bytes, headers: Dict[str, str]) -> None:
+        """Send a body with its ETag, or a 304 when the request already holds it, like api.github.com."""
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            with self.fake._lock:
+                self.fake.counters['not_modified'] += 1
+            self._send(304, headers={'ETag': etag})
+            return
+        self._send(200, body, dict(headers, ETag=etag))
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if urlparse(self.path).path != '/graphql':
+            self._send(404, b'{"message": "Not Found"}', {'Content-Type': 'application/json'})
+            return
+        if not self._begin():
+            return
+
+        variables = request.get('variables', {})
+        query = request.get('query', '')
+        repos = self.fake.repos(variables.get('login', ''))
+        # Argument filters of the repositories connection, applied like the real API does
+        if 'isFork: false' in query:
+            repos = [repo for repo in repos if not repo['fork']]
+        if 'isArchived: false' in query:
+            repos = [repo for repo in repos if not repo['archived']]
+        if 'privacy: PUBLIC' in query:
+            repos = [repo for repo in repos if not repo['private']]
+        start = int(variables.get('cursor') or 0)
+        nodes = [{
+            'name': repo['name'],
+            'nameWithOwner': repo['full_name'],
+            'description': repo['description'],
+            'homepageUrl': repo['homepage'],
+            'url': repo['html_url'],
+            'pushedAt': repo['pushed_at'],
+            'stargazerCount': repo['stargazers_count'],
+            'isArchived': repo['archived'],
+            'isFork': repo['fork'],
+            'isPrivate': repo['private'],
+            'repositoryTopics': {'nodes': [{'topic': {'name': topic}} for topic in repo['topics']]},
+        } for repo in repos[start:start + 100]]
+        body = json.dumps({'data': {'repositoryOwner': {'repositories': {
+            'pageInfo': {'hasNextPage': start + 100 < len(repos), 'endCursor': str(start + 100)},
+            'nodes': nodes,
+        }}}}).encode('utf-8')
+        self._send(200, body, {'Content-Type': 'application/json'})
+
+def parse_accounts(values: List[str]) -> Dict[str, int]:
+    """Parse ``user=count`` arguments."""
+    accounts = {}
+    for value in values:
+        username, _, count = value.partition('=')
+        accounts[username] = int(count)
+    return accounts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="Answer every N-th request with a 403")
+    parser.add_argument("--retry-after", type=int, default=0, help="Retry-After seconds sent with the 403")
+    parser.add_argument("--accounts", nargs="*", default=["bench100=100", "bench1k=1000", "bench10k=10000"],
+                        help="Synthetic accounts as user=repository_count")
+    args = parser.parse_args()
+
+    fake = FakeGitHub(parse_accounts(args.accounts), args.latency, args.rate_limit_every, args.retry_after)
+    handler = type('Handler', (_Handler,), {'fake': fake})
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), handler)
+    fake._server = server
+    print(f"Serving {', '.join(args.accounts)} at {fake.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,15 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "requests>=2.31.0",
+        "python-dotenv>=1.0.0",
         "typing-extensions>=4.5.0",
     ],
+    entry_points={
+        "console_scripts": ["github-showcase=github_showcase.cli:main"],
+    },
+    extras_require={
+        "brotli": ["brotli>=1.0.9"],
+    },
     python_requires=">=3.8",
     author="Vijay Kumar Singh",
     author_email="vscit23@gmail.com",
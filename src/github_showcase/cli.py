@@ -0,0 +1,332 @@
+"""
+Command line interface for GitHub Showcase
+
+Only argparse and the settings are loaded up front. Each command imports the
+modules it needs when it runs, so ``--help`` and offline builds never pay for
+``requests`` and the HTTP stack.
+"""
+import argparse
+import os
+import sys
+from typing import Optional
+
+# Exit codes telling callers whether the published page needs a deploy
+EXIT_CHANGED = 0
+EXIT_FAILED = 1
+EXIT_UNCHANGED = 3
+
+COMMANDS = ("build", "batch", "watch")
+
+def load_environment() -> None:
+    """Load environment variables from the .env file before the settings read them."""
+    from dotenv import load_dotenv
+    load_dotenv(override=True)  # override=True ensures .env values take precedence
+
+def add_switch(parser: argparse.ArgumentParser, flag: str, default: bool, help: str) -> None:
+    """
+    Add an on/off option whose default comes from the settings, with a ``--no-`` form to turn it off.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the option to
+        flag (str): Option name, e.g. ``--minify``
+        default (bool): Value when neither form is given
+        help (str): Help text of the option
+    """
+    if hasattr(argparse, 'BooleanOptionalAction'):
+        parser.add_argument(flag, action=argparse.BooleanOptionalAction, default=default, help=help)
+        return
+    # Python 3.8 has no BooleanOptionalAction
+    dest = flag[2:].replace('-', '_')
+    parser.add_argument(flag, action="store_true", dest=dest, default=default, help=help)
+    parser.add_argument(f"--no-{flag[2:]}", action="store_false", dest=dest, help=argparse.SUPPRESS)
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Running without a subcommand is the same as ``build``.
+
+    Args:
+        argv: Argument list, defaults to sys.argv
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    from .config import settings
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv = ["build"] + argv
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk HTTP cache and always download full responses")
+    common.add_argument("--no-checkpoint", action="store_true",
+                        help="Do not save fetched pages for an interrupted run to resume from")
+    common.add_argument("--concurrency", type=int, default=settings.FETCH_CONCURRENCY,
+                        help="Maximum number of repository pages fetched in parallel (1 = sequential)")
+    common.add_argument("--backend", choices=["rest", "graphql"], default=settings.FETCH_BACKEND,
+                        help="API used to fetch repositories")
+    common.add_argument("--incremental", action="store_true",
+                        help=f"Skip rendering when nothing changed since the last run and exit with {EXIT_UNCHANGED}")
+    common.add_argument("--table-mode", choices=["full", "paged", "auto"], default=settings.TABLE_MODE,
+                        help="Render every row, page rows in the browser, or pick by repository count")
+    add_switch(common, "--minify", settings.MINIFY_OUTPUT,
+               "Minify the inline CSS/JS of the written page")
+    add_switch(common, "--inline-badges", settings.INLINE_BADGES,
+               "Embed the header badges as cached SVG data URIs")
+    add_switch(common, "--precompress", settings.PRECOMPRESS_OUTPUT,
+               "Write .gz (and .br if brotli is installed) next to the page")
+    add_switch(common, "--enrich", settings.ENRICH_REPOSITORIES,
+               "Add each repository's languages, README excerpt and star count, refetched only after a push")
+    common.add_argument("--offline", action="store_true",
+                        help="Render from the last saved repository snapshot without contacting GitHub")
+    common.add_argument("--profile", nargs="?", const=settings.PROFILE_FILE, metavar="PATH",
+                        help=f"Write a timing report of every stage and HTTP request "
+                             f"(default path {settings.PROFILE_FILE})")
+    common.add_argument("--cprofile", metavar="PATH",
+                        help="Also run under cProfile and dump the stats to PATH (read with pstats)")
+
+    # Options of the commands rendering the configured page
+    page = argparse.ArgumentParser(add_help=False)
+    page.add_argument("--source", action="append", dest="sources", metavar="OWNER",
+                      help="Owner whose repositories the page lists, a username or org:<name>; "
+                           "repeat for several (default GITHUB_SOURCES)")
+    page.add_argument("--shard", action="store_true",
+                      help="Write an index page plus one page per technology instead of a single page")
+    page.add_argument("--shard-dir", default=settings.SHARD_DIR,
+                      help="Directory receiving the sharded pages")
+    page.add_argument("--shard-size", type=int, default=settings.SHARD_PAGE_SIZE,
+                      help="Repositories per shard page (0 = one page per technology)")
+    page.add_argument("--shard-workers", type=int, default=settings.SHARD_WORKERS,
+                      help="Processes rendering shard pages (1 = render them one after another)")
+
+    parser = argparse.ArgumentParser(prog="github_showcase", description="Generate GitHub Showcase pages")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("build", parents=[common, page],
+                          help="Generate the page for the configured user (default)")
+    watch_parser = subparsers.add_parser("watch", parents=[common, page],
+                                         help="Keep the page up to date, rebuilding when GitHub shows new activity")
+    watch_parser.add_argument("--interval", type=float, default=settings.WATCH_INTERVAL,
+                              help="Seconds between polls of the owners' event feeds")
+    watch_parser.add_argument("--full-refresh", type=float, default=settings.WATCH_FULL_REFRESH,
+                              help="Seconds after which the page is refreshed without new events (0 = never)")
+    watch_parser.add_argument("--serve", action="store_true",
+                              help="Serve the output over HTTP with ETag and Cache-Control headers")
+    watch_parser.add_argument("--host", default=settings.SERVE_HOST, help="Address the preview server listens on")
+    watch_parser.add_argument("--port", type=int, default=settings.SERVE_PORT, help="Port of the preview server")
+    batch_parser = subparsers.add_parser("batch", parents=[common], help="Generate one page per user listed in a file")
+    batch_parser.add_argument("users_file",
+                              help="File with one page per line: a username or org:<name>, "
+                                   "optionally followed by more owners to list on the same page")
+    batch_parser.add_argument("--out-dir", default="site", help="Directory receiving <username>/index.html pages")
+    batch_parser.add_argument("--workers", type=int, default=settings.BATCH_WORKERS,
+                              help="Number of users processed in parallel")
+    batch_parser.add_argument("--engine", choices=["threads", "asyncio"], default=settings.BATCH_ENGINE,
+                              help="Process users on a thread pool or from one asyncio event loop")
+    return parser.parse_args(argv)
+
+def create_rate_limiter(args: argparse.Namespace):
+    """Create the request handler shared by everything a command fetches."""
+    from .config.settings import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES
+    from .utils.http_cache import HttpCache
+    from .utils.rate_limit import RateLimitHandler
+
+    cache = None if args.no_cache else HttpCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES)
+    return RateLimitHandler(cache=cache)
+
+def create_enrichment(args: argparse.Namespace):
+    """Open the enrichment cache when --enrich is set; offline runs find the enriched data in the snapshot."""
+    if not args.enrich or args.offline:
+        return None
+    from .config.settings import ENRICHMENT_FILE
+    from .utils.enrichment import EnrichmentCache
+
+    return EnrichmentCache(ENRICHMENT_FILE)
+
+def create_checkpoints(args: argparse.Namespace):
+    """Open the store of interrupted fetches unless --no-checkpoint is set."""
+    if args.no_checkpoint:
+        return None
+    from .config.settings import CHECKPOINT_DIR
+    from .utils.checkpoint import CheckpointStore
+
+    return CheckpointStore(CHECKPOINT_DIR)
+
+def render_options(args: argparse.Namespace) -> dict:
+    """Collect the render and post-processing options for render_output."""
+    return {
+        'table_mode': args.table_mode,
+        # Star counts come with the enrichment data, a plain build keeps the baseline page
+        'stars': args.enrich,
+        'minify': args.minify,
+        'badges': args.inline_badges,
+        'compress': args.precompress,
+    }
+
+def print_transport(rate_limiter) -> None:
+    """Print the HTTP transport statistics, unless nothing was fetched."""
+    if rate_limiter is not None:
+        print(f"HTTP transport: {rate_limiter.stats.summary()}")
+
+def build(args: argparse.Namespace, rate_limiter=None) -> int:
+    """
+    Generate the showcase page for the configured user and sources.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        rate_limiter: Handler to fetch through, created from ``args`` when None
+
+    Returns:
+        int: EXIT_CHANGED if the page content changed since the last run, else EXIT_UNCHANGED
+    """
+    from .config.settings import GITHUB_USERNAME, GITHUB_SOURCES, OUTPUT_FILE, FINGERPRINT_FILE, SNAPSHOT_DIR
+    from .core.fingerprint import FingerprintStore
+    from .core.pipeline import render_output
+    from .utils.snapshot import SnapshotStore, load_repositories
+
+    # Offline builds never touch the network, so the HTTP stack is not even loaded
+    if rate_limiter is None and not args.offline:
+        rate_limiter = create_rate_limiter(args)
+
+    # Fetch repositories, or load them from the last snapshot when offline
+    repos = load_repositories(GITHUB_USERNAME, rate_limiter, args.concurrency, args.backend,
+                              SnapshotStore(SNAPSHOT_DIR), args.offline, create_enrichment(args),
+                              checkpoints=create_checkpoints(args), sources=args.sources or GITHUB_SOURCES)
+
+    if args.shard:
+        return build_shards(args, repos, rate_limiter)
+
+    # Generate HTML and stream it to the output file
+    result = render_output(repos, OUTPUT_FILE, render_options(args),
+                           FingerprintStore(FINGERPRINT_FILE), args.incremental)
+    if result['status'] == 'unchanged':
+        print(f"No changes since the last run, {OUTPUT_FILE} left as is")
+        return EXIT_UNCHANGED
+
+    print(f"HTML table generated successfully at {OUTPUT_FILE} ({result['bytes']} bytes)")
+    print_transport(rate_limiter)
+    return EXIT_CHANGED if result['changed'] or not args.incremental else EXIT_UNCHANGED
+
+def build_shards(args: argparse.Namespace, repos: list, rate_limiter=None) -> int:
+    """
+    Write the sharded site for already fetched repositories.
+
+    Shards are always rendered incrementally; ``--incremental`` only decides
+    whether an untouched site is reported with EXIT_UNCHANGED.
+
+    Returns:
+        int: EXIT_CHANGED if any page was written or removed, else EXIT_UNCHANGED
+    """
+    from .config.settings import FINGERPRINT_FILE
+    from .core.fingerprint import FingerprintStore
+    from .core.sharding import render_shards
+
+    summary = render_shards(repos, args.shard_dir, args.shard_size, args.shard_workers,
+                            FingerprintStore(FINGERPRINT_FILE), render_options(args))
+    print_transport(rate_limiter)
+    if args.incremental and not (summary['written'] or summary['removed'] or summary['index_written']):
+        return EXIT_UNCHANGED
+    return EXIT_CHANGED
+
+def batch(args: argparse.Namespace) -> int:
+    """
+    Generate one showcase page per user listed in ``args.users_file``.
+
+    Returns:
+        int: EXIT_FAILED if any user failed, EXIT_UNCHANGED if no page changed, else EXIT_CHANGED
+    """
+    from .config.settings import FINGERPRINT_FILE, SNAPSHOT_DIR
+    from .core.batch import read_usernames, run_batch
+    from .core.fingerprint import FingerprintStore
+    from .utils.snapshot import SnapshotStore
+
+    rate_limiter = create_rate_limiter(args)
+    results = run_batch(read_usernames(args.users_file), args.out_dir, rate_limiter,
+                        workers=args.workers, concurrency=args.concurrency, backend=args.backend,
+                        fingerprints=FingerprintStore(FINGERPRINT_FILE), incremental=args.incremental,
+                        options=render_options(args), snapshots=SnapshotStore(SNAPSHOT_DIR),
+                        offline=args.offline, engine=args.engine, enrichment=create_enrichment(args),
+                        checkpoints=create_checkpoints(args))
+    print_transport(rate_limiter)
+
+    if any(result['status'] == 'error' for result in results):
+        return EXIT_FAILED
+    if args.incremental and all(result['status'] == 'unchanged' for result in results):
+        return EXIT_UNCHANGED
+    return EXIT_CHANGED
+
+def watch(args: argparse.Namespace) -> int:
+    """
+    Keep the configured page up to date until interrupted.
+
+    Pages are always rendered incrementally here: an unchanged page is not
+    rewritten, so its ETag stays valid for browsers and the preview server.
+
+    Returns:
+        int: EXIT_FAILED when started with --offline, else EXIT_CHANGED once stopped
+    """
+    from .config.settings import GITHUB_SOURCES, OUTPUT_FILE
+    from .core.watch import run_watch
+    from .utils.events import EventPoller
+    from .utils.owners import parse_owners
+
+    if args.offline:
+        print("watch polls GitHub for activity and cannot run with --offline")
+        return EXIT_FAILED
+    args.incremental = True
+    rate_limiter = create_rate_limiter(args)
+    poller = EventPoller(rate_limiter, parse_owners(args.sources or GITHUB_SOURCES))
+
+    server = None
+    if args.serve:
+        from .core.server import start_server
+        server = start_server(args.shard_dir if args.shard else os.path.dirname(OUTPUT_FILE) or '.',
+                              args.host, args.port)
+    try:
+        run_watch(lambda: build(args, rate_limiter) == EXIT_CHANGED, poller, args.interval, args.full_refresh)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+    finally:
+        if server is not None:
+            server.shutdown()
+    return EXIT_CHANGED
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Main function to generate the GitHub Showcase
+
+    Returns:
+        int: Process exit code
+    """
+    load_environment()
+    args = parse_args(argv)
+    command = {"batch": batch, "watch": watch}.get(args.command, build)
+
+    metrics = None
+    if args.profile:
+        from .utils.instrumentation import metrics
+        metrics.enable()
+    profiler = None
+    if args.cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        return command(args)
+    except Exception as e:
+        # Imported here so offline runs keep skipping the HTTP stack
+        from .utils.rate_limit import RateLimitExceeded
+        if not isinstance(e, RateLimitExceeded):
+            raise
+        print(e)
+        if not args.no_checkpoint:
+            print("Pages fetched so far are checkpointed; the next run resumes from them")
+        return EXIT_FAILED
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.cprofile)
+            print(f"cProfile stats written to {args.cprofile}")
+        if metrics is not None:
+            metrics.write_report(args.profile)
@@ -1,13 +1,48 @@
 """
 Configuration settings for GitHub Showcase
 """
+import os
 
 # GitHub Configuration
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
 GITHUB_USERNAME = "vsingh55"
 EXCLUDE_REPOS = ["vsingh55/vsingh55"]
+GITHUB_SOURCES = [GITHUB_USERNAME]  # Owners listed on the page: usernames, or "org:<name>" for organizations
 OUTPUT_FILE = "index.html"
+WRITE_BUFFER_SIZE = 64 * 1024  # Bytes buffered before the streamed page is flushed to disk
 BLOG_BASE_URL = "https://blogs.vijaysingh.cloud"
 
+# Fetch Configuration
+FETCH_BACKEND = "rest"  # "rest" or "graphql" (GraphQL needs GITHUB_TOKEN and downloads only the rendered fields)
+HTTP_POOL_SIZE = 10  # Keep-alive connections held open per host
+HTTP_CONNECT_TIMEOUT = 5  # Seconds to open a connection before the attempt fails and is retried
+HTTP_READ_TIMEOUT = 30  # Seconds a connection may stall while reading a response before it is retried
+FETCH_CONCURRENCY = 4  # Pages fetched in parallel once the page count is known; 1 fetches sequentially
+BATCH_WORKERS = 4  # Users processed in parallel by the batch command
+BATCH_ENGINE = "threads"  # "threads" or "asyncio"; asyncio drives all users from one event loop
+
+# Repository Enrichment
+ENRICH_REPOSITORIES = False  # Fetch the language breakdown and README of every repository (2 requests each)
+ENRICH_WORKERS = 8  # Repositories enriched in parallel
+README_EXCERPT_LENGTH = 200  # Characters of README text kept, shown when a repository has no description
+LANGUAGES_SHOWN = 3  # Most used languages listed per repository
+
+# Rate Limit Budget
+RATE_BUDGET_PACING_THRESHOLD = 0.5  # Start spreading requests once less than this share of the quota is left
+RATE_BUDGET_BURST = 10  # Requests allowed back-to-back while pacing
+MAX_RATE_LIMIT_WAIT = 15 * 60  # Seconds one request may wait for rate limits before the run gives up
+
+# HTTP Cache Configuration
+HTTP_CACHE_DIR = ".cache/http"
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024  # Least-recently-used entries are evicted above this size
+FINGERPRINT_FILE = ".cache/fingerprints.json"  # Content digests of written outputs for --incremental
+BADGE_CACHE_DIR = ".cache/badges"  # Downloaded badge SVGs for --inline-badges
+SNAPSHOT_DIR = ".cache/snapshots"  # Filtered repositories per user, rendered from by --offline
+PROFILE_FILE = ".cache/profile.json"  # Timing report written by --profile
+ENRICHMENT_FILE = ".cache/enrichment.json"  # Languages and README excerpts by repository and last push
+CHECKPOINT_DIR = ".cache/checkpoints"  # Pages of interrupted fetches, resumed by the next run
+CHECKPOINT_MAX_AGE = 6 * 60 * 60  # Seconds after which an interrupted fetch starts over instead of resuming
+
 # Technology Filters
 TECH_FILTERS = [
     "azure", "aws", "gcp", "docker", "kubernetes", "terraform",
@@ -17,6 +52,25 @@ TECH_FILTERS = [
     "shell-scripting"
 ]
 
+# Topics counted as one of the technology filters; matching also ignores case and "-", "_", "/" differences
+TAG_ALIASES = {
+    "cicd": "ci/cd",
+    "continuous-integration": "ci/cd",
+    "gh-actions": "github-actions",
+    "githubactions": "github-actions",
+    "k8s": "kubernetes",
+    "amazon-web-services": "aws",
+    "microsoft-azure": "azure",
+    "google-cloud": "gcp",
+    "elasticsearch": "elk",
+    "elastic-stack": "elk",
+    "python3": "python",
+    "bash": "shell-scripting",
+    "shell": "shell-scripting",
+    "shell-script": "shell-scripting",
+    "gitlab-ci": "gitlab",
+}
+
 # Blog Mapping Configuration
 BLOG_MAPPING = {
     # Add your blog mappings here
@@ -49,5 +103,27 @@ THEME_CONFIG = {
     }
 }
 
+# Table Rendering
+TABLE_MODE = "auto"  # "full" renders every row, "paged" renders pages in the browser, "auto" picks by size
+PAGED_ROW_THRESHOLD = 500  # Repositories above which "auto" switches to paged mode
+PAGE_SIZE = 50  # Rows per page in paged mode
+
+# Sharded Output
+SHARD_DIR = "site"  # Directory receiving index.html and tech/<technology>.html
+SHARD_PAGE_SIZE = 0  # Repositories per shard page, 0 keeps each technology on one page
+SHARD_WORKERS = 1  # Processes rendering shard pages, 1 renders them one after another
+
+# Output Post-processing
+MINIFY_OUTPUT = False  # Minify inline CSS/JS and whitespace between tags
+INLINE_BADGES = False  # Embed the shields.io badges as SVG data URIs
+PRECOMPRESS_OUTPUT = False  # Write .gz (and .br with brotli installed) next to the page
+
+# Watch Mode
+WATCH_INTERVAL = 5 * 60  # Seconds between polls of the owners' event feeds
+WATCH_FULL_REFRESH = 60 * 60  # Seconds after which the listing is refreshed anyway; topic and description edits raise no event
+SERVE_HOST = "127.0.0.1"  # Address the watch command's preview server listens on
+SERVE_PORT = 8000  # Port of the preview server
+SERVE_CACHE_CONTROL = "no-cache"  # Browsers revalidate every load and get a 304 until the page is rewritten
+
 # Messages
 NO_BLOG_MESSAGE = "Coming Soon" 
\ No newline at end of file
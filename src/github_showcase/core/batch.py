@@ -0,0 +1,229 @@
+"""
+Batch generation of showcase pages for many GitHub users in one process
+"""
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Optional
+from ..config.settings import HTTP_POOL_SIZE
+from ..utils.async_client import AsyncClient
+from ..utils.checkpoint import CheckpointStore
+from ..utils.enrichment import EnrichmentCache
+from ..utils.owners import parse_owners
+from ..utils.rate_limit import RateLimitHandler
+from ..utils.snapshot import SnapshotStore, load_repositories, load_repositories_async
+from .fingerprint import FingerprintStore
+from .pipeline import render_output
+
+def read_usernames(path: str) -> List[str]:
+    """
+    Read the pages to build from a file, one per line.
+
+    A line names the owners a page lists: a GitHub username or
+    ``org:<name>``, optionally followed by more owners, e.g.
+    ``alice org:acme``. The page, its directory and its snapshot are named
+    after the first one. Blank lines and lines starting with ``#`` are
+    ignored, and so are repeated lines.
+
+    Args:
+        path (str): Path of the users file
+
+    Returns:
+        List[str]: Owner specs per page in file order, without duplicates
+
+    Raises:
+        ValueError: If a line names an invalid owner, or two different lines name the same page
+    """
+    usernames = []
+    pages = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            username = ' '.join(line.split())
+            if not username or username.startswith('#') or username in usernames:
+                continue
+            # Page directories are compared like logins, case-insensitively
+            page = parse_owners(username)[0].login.lower()
+            if page in pages:
+                raise ValueError(f"{path}:{number}: '{username}' builds the same page as "
+                                 f"'{pages[page]}'; list all owners of that page on one line")
+            pages[page] = username
+            usernames.append(username)
+    return usernames
+
+def build_user_page(username: str, out_dir: str, rate_limiter: RateLimitHandler,
+                    concurrency: int, backend: str,
+                    fingerprints: Optional[FingerprintStore] = None,
+                    incremental: bool = False, options: Optional[Dict] = None,
+                    snapshots: Optional[SnapshotStore] = None, offline: bool = False,
+                    enrichment: Optional[EnrichmentCache] = None,
+                    checkpoints: Optional[CheckpointStore] = None) -> Dict:
+    """
+    Fetch one page's repositories and write it to ``out_dir/<login>/index.html``.
+
+    Args:
+        username (str): Owner specs of the page as read by read_usernames, the first one names it
+        out_dir (str): Root output directory
+        rate_limiter (RateLimitHandler): Handler shared by all users
+        concurrency (int): Maximum number of pages fetched at once for this user
+        backend (str): Name of the fetch backend
+        fingerprints (Optional[FingerprintStore]): Store recording what each page was built from
+        incremental (bool): Skip pages whose fingerprint matches the stored one
+        options (Optional[Dict]): Render options, see render_output
+        snapshots (Optional[SnapshotStore]): Store of the users' repository snapshots
+        offline (bool): Render from the snapshots without contacting GitHub
+        enrichment (Optional[EnrichmentCache]): Cache of languages and READMEs, None to skip enrichment
+        checkpoints (Optional[CheckpointStore]): Store of interrupted fetches to resume
+
+    Returns:
+        Dict: Timing summary for the user
+    """
+    sources = [username]
+    username = parse_owners(username)[0].login
+    output_file = os.path.join(out_dir, username, 'index.html')
+    result = {'username': username, 'output': output_file, 'status': 'ok',
+              'repos': 0, 'bytes': 0, 'fetch_time': 0.0, 'render_time': 0.0}
+    start = time.perf_counter()
+    try:
+        repos = load_repositories(username, rate_limiter, concurrency, backend, snapshots, offline,
+                                  enrichment, checkpoints=checkpoints, sources=sources)
+        result['repos'] = len(repos)
+        result['fetch_time'] = round(time.perf_counter() - start, 4)
+
+        rendered = render_output(repos, output_file, options, fingerprints, incremental)
+        result['status'] = rendered['status']
+        result['bytes'] = rendered['bytes']
+        result['render_time'] = rendered['render_time']
+    except Exception as e:
+        print(f"Error generating page for {username}: {str(e)}")
+        result['status'] = 'error'
+        result['error'] = str(e)
+    return result
+
+async def build_user_page_async(username: str, out_dir: str, client: AsyncClient,
+                                concurrency: int, backend: str,
+                                fingerprints: Optional[FingerprintStore] = None,
+                                incremental: bool = False, options: Optional[Dict] = None,
+                                snapshots: Optional[SnapshotStore] = None, offline: bool = False,
+                                enrichment: Optional[EnrichmentCache] = None,
+                                checkpoints: Optional[CheckpointStore] = None) -> Dict:
+    """
+    Asynchronous counterpart of build_user_page fetching through an AsyncClient.
+
+    Rendering is CPU-bound and runs on the loop's default executor so the
+    other users keep fetching meanwhile.
+
+    Args:
+        username (str): Owner specs of the page as read by read_usernames, the first one names it
+        out_dir (str): Root output directory
+        client (AsyncClient): Client shared by all users
+        concurrency (int): Maximum number of pages fetched at once for this user
+        backend (str): Name of the fetch backend
+        fingerprints (Optional[FingerprintStore]): Store recording what each page was built from
+        incremental (bool): Skip pages whose fingerprint matches the stored one
+        options (Optional[Dict]): Render options, see render_output
+        snapshots (Optional[SnapshotStore]): Store of the users' repository snapshots
+        offline (bool): Render from the snapshots without contacting GitHub
+        enrichment (Optional[EnrichmentCache]): Cache of languages and READMEs, None to skip enrichment
+        checkpoints (Optional[CheckpointStore]): Store of interrupted fetches to resume
+
+    Returns:
+        Dict: Timing summary for the user
+    """
+    sources = [username]
+    username = parse_owners(username)[0].login
+    output_file = os.path.join(out_dir, username, 'index.html')
+    result = {'username': username, 'output': output_file, 'status': 'ok',
+              'repos': 0, 'bytes': 0, 'fetch_time': 0.0, 'render_time': 0.0}
+    start = time.perf_counter()
+    try:
+        repos = await load_repositories_async(username, client, concurrency, backend, snapshots, offline,
+                                              enrichment, checkpoints=checkpoints, sources=sources)
+        result['repos'] = len(repos)
+        result['fetch_time'] = round(time.perf_counter() - start, 4)
+
+        rendered = await asyncio.get_running_loop().run_in_executor(
+            None, partial(render_output, repos, output_file, options, fingerprints, incremental))
+        result['status'] = rendered['status']
+        result['bytes'] = rendered['bytes']
+        result['render_time'] = rendered['render_time']
+    except Exception as e:
+        print(f"Error generating page for {username}: {str(e)}")
+        result['status'] = 'error'
+        result['error'] = str(e)
+    return result
+
+async def _run_users_async(usernames: List[str], out_dir: str, rate_limiter: RateLimitHandler,
+                           workers: int, concurrency: int, backend: str, **kwargs) -> List[Dict]:
+    """Build the pages of all users from one event loop, at most ``workers`` at a time."""
+    limit = asyncio.Semaphore(max(workers, 1))
+    async with AsyncClient(rate_limiter, max_in_flight=HTTP_POOL_SIZE) as client:
+        async def build(username: str) -> Dict:
+            async with limit:
+                return await build_user_page_async(username, out_dir, client, concurrency, backend, **kwargs)
+        return await asyncio.gather(*(build(username) for username in usernames))
+
+def run_batch(usernames: List[str], out_dir: str, rate_limiter: RateLimitHandler,
+              workers: int, concurrency: int, backend: str,
+              fingerprints: Optional[FingerprintStore] = None,
+              incremental: bool = False, options: Optional[Dict] = None,
+              snapshots: Optional[SnapshotStore] = None, offline: bool = False,
+              engine: str = 'threads', enrichment: Optional[EnrichmentCache] = None,
+              checkpoints: Optional[CheckpointStore] = None) -> List[Dict]:
+    """
+    Generate pages for many users in parallel and write ``out_dir/timings.json``.
+
+    All users share ``rate_limiter`` and with it the HTTP connection pool, the
+    on-disk cache and the rate-limit budget. A failing user is reported in the
+    summary without stopping the others.
+
+    With the ``threads`` engine every user in progress holds a thread, also
+    while it sleeps on backoff or rate limits. The ``asyncio`` engine drives
+    all users from one event loop, where waiting is free, so ``workers`` can
+    be in the hundreds.
+
+    Args:
+        usernames (List[str]): Owner specs per page, see read_usernames
+        out_dir (str): Root output directory
+        rate_limiter (RateLimitHandler): Handler shared by all users
+        workers (int): Number of users processed at once
+        concurrency (int): Maximum number of pages fetched at once per user
+        backend (str): Name of the fetch backend
+        fingerprints (Optional[FingerprintStore]): Store recording what each page was built from
+        incremental (bool): Skip pages whose fingerprint matches the stored one
+        options (Optional[Dict]): Render options, see render_output
+        snapshots (Optional[SnapshotStore]): Store of the users' repository snapshots
+        offline (bool): Render from the snapshots without contacting GitHub
+        engine (str): ``threads`` or ``asyncio``
+        enrichment (Optional[EnrichmentCache]): Cache of languages and READMEs shared by all users
+        checkpoints (Optional[CheckpointStore]): Store of interrupted fetches; a rerun resumes failed users
+
+    Returns:
+        List[Dict]: Timing summary per user, in input order
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if engine == 'asyncio':
+        results = asyncio.run(_run_users_async(
+            usernames, out_dir, rate_limiter, workers, concurrency, backend,
+            fingerprints=fingerprints, incremental=incremental, options=options,
+            snapshots=snapshots, offline=offline, enrichment=enrichment, checkpoints=checkpoints,
+        ))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda username: build_user_page(username, out_dir, rate_limiter, concurrency, backend,
+                                                fingerprints, incremental, options, snapshots, offline, enrichment,
+                                                checkpoints),
+                usernames,
+            ))
+
+    with open(os.path.join(out_dir, 'timings.json'), 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    print("\nBatch summary:")
+    for result in results:
+        print(f" - {result['username']}: {result['status']}, {result['repos']} repos, "
+              f"fetch {result['fetch_time']:.2f}s, render {result['render_time']:.2f}s, {result['bytes']} bytes")
+    return results
@@ -0,0 +1,97 @@
+"""
+Content fingerprints for incremental regeneration
+"""
+import functools
+import hashlib
+import json
+import os
+import threading
+from typing import List, Dict, Optional
+from ..config.settings import (
+    TECH_FILTERS, TAG_ALIASES, BLOG_MAPPING, BLOG_BASE_URL, THEME_CONFIG,
+    LANGUAGES_SHOWN, PAGED_ROW_THRESHOLD, PAGE_SIZE
+)
+from ..utils.repo import Repo
+
+# Repository fields that end up in the rendered page
+FINGERPRINT_FIELDS = ('name', 'full_name', 'description', 'homepage', 'topics', 'html_url',
+                      'blog_url', 'languages', 'readme')
+# Only rendered with the ``stars`` option, so a new star elsewhere leaves the page alone
+STAR_FIELDS = ('stargazers_count',)
+
+# Sources outside core/ that shape the page: the Repo record and the settings
+GENERATOR_SOURCES = (os.path.join('utils', 'repo.py'), os.path.join('config', 'settings.py'))
+
+@functools.lru_cache(maxsize=None)
+def _generator_digest() -> str:
+    """Hash the generator sources so template changes invalidate old fingerprints, once per process."""
+    core_dir = os.path.dirname(os.path.abspath(__file__))
+    package_dir = os.path.dirname(core_dir)
+    paths = [os.path.join(core_dir, name) for name in sorted(os.listdir(core_dir)) if name.endswith('.py')]
+    paths.extend(os.path.join(package_dir, source) for source in GENERATOR_SOURCES)
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def compute_fingerprint(repos: List[Repo], options: Optional[Dict] = None) -> str:
+    """
+    Compute a digest of everything that affects the rendered page.
+
+    ``pushed_at`` is left out on purpose: a push changes the page only through
+    the row order, which the ordered repository list already captures. Star
+    counts only count when the ``stars`` option shows them.
+
+    Args:
+        repos (List[Repo]): Filtered repositories in render order
+        options (Optional[Dict]): Render and post-processing options the page is built with
+
+    Returns:
+        str: Hex digest
+    """
+    options = options or {}
+    fields = FINGERPRINT_FIELDS + STAR_FIELDS if options.get('stars') else FINGERPRINT_FIELDS
+    content = {
+        'repos': [[getattr(repo, field) for field in fields] for repo in repos],
+        'tech_filters': TECH_FILTERS,
+        'tag_aliases': TAG_ALIASES,
+        'blog_mapping': BLOG_MAPPING,
+        'blog_base_url': BLOG_BASE_URL,
+        'theme': THEME_CONFIG,
+        'languages_shown': LANGUAGES_SHOWN,
+        'paged_row_threshold': PAGED_ROW_THRESHOLD,
+        'page_size': PAGE_SIZE,
+        'options': options,
+        'generator': _generator_digest(),
+    }
+    encoded = json.dumps(content, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+class FingerprintStore:
+    """Fingerprints of the last written outputs, persisted as JSON keyed by output path."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._fingerprints = json.load(f)
+        except (OSError, ValueError):
+            self._fingerprints = {}
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the stored fingerprint for an output, None if never written."""
+        return self._fingerprints.get(key)
+
+    def set(self, key: str, fingerprint: str) -> None:
+        """Record the fingerprint of a freshly written output and save the store."""
+        with self._lock:
+            self._fingerprints[key] = fingerprint
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._fingerprints, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
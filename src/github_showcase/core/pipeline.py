@@ -0,0 +1,54 @@
+"""
+Render stage shared by the build and batch commands
+"""
+import os
+import time
+from typing import List, Dict, Optional
+from ..utils.instrumentation import metrics
+from ..utils.repo import Repo
+from .fingerprint import FingerprintStore, compute_fingerprint
+from .html_generator import iter_html_table
+from .postprocess import postprocess_file
+from .writer import write_chunks
+
+def render_output(repos: List[Repo], output_file: str, options: Optional[Dict] = None,
+                  fingerprints: Optional[FingerprintStore] = None,
+                  incremental: bool = False, nav: str = '') -> Dict:
+    """
+    Render a page for the given repositories and write it to ``output_file``.
+
+    Args:
+        repos (List[Repo]): Filtered repositories in render order
+        output_file (str): Path of the page to write
+        options (Optional[Dict]): ``table_mode``, ``stars``, ``minify``, ``badges`` and ``compress``
+        fingerprints (Optional[FingerprintStore]): Store recording what each page was built from
+        incremental (bool): Skip the page if its fingerprint matches the stored one
+        nav (str): Navigation markup placed below the table
+
+    Returns:
+        Dict: ``status`` ("ok" or "unchanged"), ``changed``, ``bytes``, ``render_time`` and ``sizes``
+    """
+    options = options or {}
+    fingerprint = compute_fingerprint(repos, dict(options, nav=nav) if nav else options)
+    changed = fingerprints is None or fingerprints.get(output_file) != fingerprint
+    result = {'status': 'ok', 'changed': changed, 'bytes': 0, 'render_time': 0.0, 'sizes': {}}
+    if incremental and not changed and os.path.exists(output_file):
+        result['status'] = 'unchanged'
+        return result
+
+    start = time.perf_counter()
+    # The page is streamed to disk, so this span includes the nested 'write' time
+    with metrics.span('render', output=output_file, repos=len(repos)):
+        chunks = iter_html_table(repos, options.get('table_mode'), nav, options.get('stars', False))
+        result['bytes'] = write_chunks(output_file, chunks)
+    if options.get('minify') or options.get('badges') or options.get('compress'):
+        with metrics.span('postprocess', output=output_file):
+            result['sizes'] = postprocess_file(output_file, minify=options.get('minify', False),
+                                               badges=options.get('badges', False),
+                                               compress=options.get('compress', False))
+        result['bytes'] = os.path.getsize(output_file)
+    result['render_time'] = round(time.perf_counter() - start, 4)
+
+    if fingerprints is not None:
+        fingerprints.set(output_file, fingerprint)
+    return result
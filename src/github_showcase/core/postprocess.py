@@ -0,0 +1,179 @@
+"""
+Output post-processing: minification, badge inlining and precompression
+"""
+import base64
+import gzip
+import hashlib
+import os
+import re
+from html import unescape
+from typing import Dict, Optional
+from ..config.settings import BADGE_CACHE_DIR
+from .writer import write_chunks
+
+try:
+    import brotli
+except ImportError:  # Optional dependency, .br siblings are skipped without it
+    brotli = None
+
+STYLE_RE = re.compile(r'(<style>)(.*?)(</style>)', re.S)
+SCRIPT_RE = re.compile(r'(<script>)(.*?)(</script>)', re.S)
+BADGE_RE = re.compile(r'<img src="(https://img\.shields\.io/[^"]+)"')
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,>])\s*')
+CSS_COLON_RE = re.compile(r':\s+')
+TAG_GAP_RE = re.compile(r'>\s*\n\s*<')
+
+def minify_css(css: str) -> str:
+    """
+    Minify a stylesheet by dropping comments and insignificant whitespace.
+
+    Args:
+        css (str): Stylesheet source
+
+    Returns:
+        str: Minified stylesheet
+    """
+    css = CSS_COMMENT_RE.sub('', css)
+    css = ' '.join(css.split())
+    css = CSS_PUNCTUATION_RE.sub(r'\1', css)
+    css = CSS_COLON_RE.sub(':', css)
+    return css.replace(';}', '}')
+
+def minify_js(js: str) -> str:
+    """
+    Minify a script by dropping indentation, blank lines and whole-line comments.
+
+    Line breaks are kept so automatic semicolon insertion is unaffected.
+
+    Args:
+        js (str): Script source
+
+    Returns:
+        str: Minified script
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+def minify_html(html: str) -> str:
+    """
+    Minify the inline CSS and JavaScript of a page and the whitespace between tags.
+
+    JSON script blocks are left untouched.
+
+    Args:
+        html (str): Page source
+
+    Returns:
+        str: Minified page
+    """
+    html = STYLE_RE.sub(lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), html)
+    html = SCRIPT_RE.sub(lambda m: m.group(1) + minify_js(m.group(2)) + m.group(3), html)
+    html = re.sub(r'<!--.*?-->', '', html, flags=re.S)
+    return TAG_GAP_RE.sub('><', html)
+
+def fetch_badge(url: str, cache_dir: str = BADGE_CACHE_DIR) -> Optional[bytes]:
+    """
+    Fetch a badge SVG, keeping a copy on disk so later runs skip the download.
+
+    Args:
+        url (str): Badge image URL
+        cache_dir (str): Directory holding cached badges
+
+    Returns:
+        Optional[bytes]: SVG document, None if it could not be fetched
+    """
+    path = os.path.join(cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.svg')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return f.read()
+    # Imported here so pages without badge inlining never load the HTTP stack
+    import requests
+    try:
+        response = requests.get(url, timeout=10)
+    except requests.exceptions.RequestException as e:
+        print(f"Could not fetch badge {url}: {str(e)}")
+        return None
+    if response.status_code != 200 or 'svg' not in response.headers.get('Content-Type', ''):
+        print(f"Could not fetch badge {url}: status {response.status_code}")
+        return None
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(response.content)
+    return response.content
+
+def inline_badges(html: str, cache_dir: str = BADGE_CACHE_DIR) -> str:
+    """
+    Replace shields.io badge images with SVG data URIs.
+
+    Badges that cannot be fetched keep their original URL.
+
+    Args:
+        html (str): Page source
+        cache_dir (str): Directory holding cached badges
+
+    Returns:
+        str: Page with badges inlined
+    """
+    def replace(match):
+        svg = fetch_badge(unescape(match.group(1)), cache_dir)
+        if svg is None:
+            return match.group(0)
+        return f'<img src="data:image/svg+xml;base64,{base64.b64encode(svg).decode("ascii")}"'
+    return BADGE_RE.sub(replace, html)
+
+def precompress(path: str) -> Dict[str, int]:
+    """
+    Write ``.gz`` and, when brotli is installed, ``.br`` siblings of a file.
+
+    Args:
+        path (str): File to compress
+
+    Returns:
+        Dict[str, int]: Size in bytes per written sibling extension
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    sizes = {}
+    # mtime=0 keeps the archive identical between runs with the same content
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    with open(f"{path}.gz", 'wb') as f:
+        f.write(compressed)
+    sizes['gz'] = len(compressed)
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        with open(f"{path}.br", 'wb') as f:
+            f.write(compressed)
+        sizes['br'] = len(compressed)
+    else:
+        print("brotli is not installed, skipping .br output")
+    return sizes
+
+def postprocess_file(path: str, minify: bool = False, badges: bool = False,
+                     compress: bool = False) -> Dict[str, int]:
+    """
+    Post-process a generated page in place and report its size at each step.
+
+    Args:
+        path (str): Generated page
+        minify (bool): Minify inline CSS/JS and whitespace between tags
+        badges (bool): Inline shields.io badges as SVG data URIs
+        compress (bool): Write precompressed siblings
+
+    Returns:
+        Dict[str, int]: Byte sizes keyed by step
+    """
+    sizes = {'original': os.path.getsize(path)}
+    if minify or badges:
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        if badges:
+            html = inline_badges(html)
+        if minify:
+            html = minify_html(html)
+        sizes['processed'] = write_chunks(path, [html])
+    if compress:
+        sizes.update(precompress(path))
+
+    print(f"Output size for {path}: " + ', '.join(f"{step} {size} bytes" for step, size in sizes.items()))
+    return sizes
@@ -0,0 +1,126 @@
+"""
+Local preview server for the generated pages
+"""
+import email.utils
+import mimetypes
+import os
+import posixpath
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import unquote, urlparse
+from ..config.settings import SERVE_HOST, SERVE_PORT, SERVE_CACHE_CONTROL
+
+# Only generated files are served; the output directory may be the project root
+SERVED_EXTENSIONS = ('.html', '.css', '.js', '.json', '.svg', '.png', '.ico')
+
+# Precompressed siblings written by --precompress, preferred in this order
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+
+class PageRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves files below ``root`` with validators and a Cache-Control header.
+
+    Every response carries an ETag built from the file's modification time
+    and size, so a browser revalidating an unchanged page gets an empty 304.
+    When the client accepts it and a ``.br`` or ``.gz`` sibling exists, the
+    precompressed file is sent instead. Hidden paths and files not produced
+    by the generator are answered with 404.
+    """
+    protocol_version = "HTTP/1.1"
+    root = '.'
+    cache_control = SERVE_CACHE_CONTROL
+
+    def log_message(self, format, *args):
+        print(f"[serve] {self.address_string()} {format % args}")
+
+    def resolve(self) -> Optional[str]:
+        """Map the request path to a servable file, None if there is none."""
+        path = posixpath.normpath(unquote(urlparse(self.path).path))
+        parts = [part for part in path.split('/') if part]
+        if any(part.startswith('.') for part in parts):
+            return None
+        file_path = os.path.join(self.root, *parts)
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, 'index.html')
+        if not file_path.endswith(SERVED_EXTENSIONS) or not os.path.isfile(file_path):
+            return None
+        return file_path
+
+    def negotiate(self, file_path: str) -> Tuple[str, Optional[str]]:
+        """Pick the precompressed variant of a file the client accepts, if one was written."""
+        accepted = self.headers.get('Accept-Encoding', '')
+        for encoding, suffix in PRECOMPRESSED:
+            variant = file_path + suffix
+            # A variant older than the page was left behind by an earlier build
+            if (encoding in accepted and os.path.isfile(variant) and
+                    os.path.getmtime(variant) >= os.path.getmtime(file_path)):
+                return variant, encoding
+        return file_path, None
+
+    def send_file(self, head_only: bool) -> None:
+        """Answer a GET or HEAD request, with a 304 when the client's ETag still matches."""
+        file_path = self.resolve()
+        if file_path is None:
+            body = b'Not Found'
+            self.send_response(404)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if not head_only:
+                self.wfile.write(body)
+            return
+
+        sent_path, encoding = self.negotiate(file_path)
+        # Stat the open file: the generator replaces pages atomically, this keeps headers and body consistent
+        with open(sent_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+            not_modified = etag in self.headers.get('If-None-Match', '')
+
+            self.send_response(304 if not_modified else 200)
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', email.utils.formatdate(stat.st_mtime, usegmt=True))
+            self.send_header('Cache-Control', self.cache_control)
+            self.send_header('Vary', 'Accept-Encoding')
+            if not_modified:
+                self.end_headers()
+                return
+            content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+            if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+                content_type += '; charset=utf-8'
+            self.send_header('Content-Type', content_type)
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.send_header('Content-Length', str(stat.st_size))
+            self.end_headers()
+            if not head_only:
+                shutil.copyfileobj(f, self.wfile, 64 * 1024)
+
+    def do_GET(self):
+        self.send_file(head_only=False)
+
+    def do_HEAD(self):
+        self.send_file(head_only=True)
+
+def start_server(root: str, host: str = SERVE_HOST, port: int = SERVE_PORT,
+                 cache_control: str = SERVE_CACHE_CONTROL) -> ThreadingHTTPServer:
+    """
+    Serve a directory of generated pages from a daemon thread.
+
+    Args:
+        root (str): Directory to serve
+        host (str): Address to listen on
+        port (int): Port to listen on, 0 picks a free one
+        cache_control (str): Cache-Control header sent with every file
+
+    Returns:
+        ThreadingHTTPServer: Running server, stopped with ``shutdown()``
+    """
+    handler = type('Handler', (PageRequestHandler,), {'root': root, 'cache_control': cache_control})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving {os.path.abspath(root)} at http://{host}:{server.server_port}/")
+    return server
@@ -0,0 +1,222 @@
+"""
+Sharded output: an index page plus one page per technology filter
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
+from ..config.settings import TECH_FILTERS
+from ..utils.repo import Repo
+from .fingerprint import FingerprintStore
+from .pipeline import render_output
+from .postprocess import inline_badges, minify_html, precompress
+from .tag_index import get_tag_index
+from .templates import format_tech_name, render_shard_index, render_shard_nav
+from .writer import write_chunks
+
+SHARD_SUBDIR = 'tech'
+OTHER_SHARD = 'other'  # Repositories matching none of the technology filters
+
+def shard_slug(tech: str) -> str:
+    """
+    Get the file name stem of a technology's shard.
+
+    Args:
+        tech (str): Technology filter
+
+    Returns:
+        str: File name stem, e.g. ``ci-cd`` for ``ci/cd``
+    """
+    return tech.lower().replace('/', '-')
+
+def group_by_technology(repos: List[Repo]) -> Dict[str, List[Repo]]:
+    """
+    Group repositories by technology filter, keeping render order within each group.
+
+    A repository with several matching topics lands in each of their groups,
+    one with none lands in the ``other`` group. Topics match through the
+    shared TagIndex, so aliases count too.
+
+    Args:
+        repos (List[Repo]): Filtered repositories in render order
+
+    Returns:
+        Dict[str, List[Repo]]: Repositories per technology, in TECH_FILTERS order
+    """
+    groups = {tech: [] for tech in TECH_FILTERS}
+    groups[OTHER_SHARD] = []
+    tags = get_tag_index(TECH_FILTERS)
+    for repo in repos:
+        mask = tags.mask(repo.topics)
+        if not mask:
+            groups[OTHER_SHARD].append(repo)
+            continue
+        for bit, tech in enumerate(TECH_FILTERS):
+            if mask & (1 << bit):
+                groups[tech].append(repo)
+    return groups
+
+def plan_shards(repos: List[Repo], page_size: int = 0) -> List[Dict]:
+    """
+    Split repositories into shard pages.
+
+    Technologies without repositories get no page.
+
+    Args:
+        repos (List[Repo]): Filtered repositories in render order
+        page_size (int): Repositories per page, 0 for one page per technology
+
+    Returns:
+        List[Dict]: ``tech``, ``file`` (relative to the output directory), ``repos`` and ``nav`` per page
+    """
+    shards = []
+    for tech, group in group_by_technology(repos).items():
+        if not group:
+            continue
+        size = page_size if page_size > 0 else len(group)
+        chunks = [group[start:start + size] for start in range(0, len(group), size)]
+        names = [f"{shard_slug(tech)}.html" if number == 1 else f"{shard_slug(tech)}-{number}.html"
+                 for number in range(1, len(chunks) + 1)]
+        for number, chunk in enumerate(chunks):
+            links = [('../index.html', '← All technologies')]
+            if number > 0:
+                links.append((names[number - 1], '‹ Previous'))
+            if number < len(chunks) - 1:
+                links.append((names[number + 1], 'Next ›'))
+            shards.append({
+                'tech': tech,
+                'file': f"{SHARD_SUBDIR}/{names[number]}",
+                'repos': chunk,
+                'nav': render_shard_nav(links),
+            })
+    return shards
+
+def _index_entries(shards: List[Dict]) -> List[Tuple[str, str, int]]:
+    """Link the first page of every technology with its total repository count."""
+    entries = {}
+    for shard in shards:
+        if shard['tech'] in entries:
+            href, label, count = entries[shard['tech']]
+            entries[shard['tech']] = (href, label, count + len(shard['repos']))
+        else:
+            label = 'Other' if shard['tech'] == OTHER_SHARD else format_tech_name(shard['tech'])
+            entries[shard['tech']] = (shard['file'], label, len(shard['repos']))
+    return list(entries.values())
+
+def _remove_stale_shards(out_dir: str, keep: List[str]) -> List[str]:
+    """Delete shard pages (and their compressed siblings) left over from earlier runs."""
+    shard_dir = os.path.join(out_dir, SHARD_SUBDIR)
+    if not os.path.isdir(shard_dir):
+        return []
+    keep = {os.path.basename(path) for path in keep}
+    removed = []
+    for name in sorted(os.listdir(shard_dir)):
+        page = name[:-3] if name.endswith(('.gz', '.br')) else name
+        if page.endswith('.html') and page not in keep:
+            os.remove(os.path.join(shard_dir, name))
+            removed.append(name)
+    return removed
+
+class _PageFingerprint:
+    """Stand-in for the FingerprintStore holding one page's fingerprint inside a worker process."""
+
+    def __init__(self, key: str, fingerprint: Optional[str]):
+        self.key = key
+        self.fingerprint = fingerprint
+
+    def get(self, key: str) -> Optional[str]:
+        return self.fingerprint if key == self.key else None
+
+    def set(self, key: str, fingerprint: str) -> None:
+        self.fingerprint = fingerprint
+
+def _render_shard(repos: List[Repo], path: str, options: Optional[Dict], nav: str,
+                  fingerprint: Optional[str]) -> Tuple[Dict, Optional[str]]:
+    """Render one shard in a worker process, returning the result and the page's new fingerprint."""
+    store = _PageFingerprint(path, fingerprint)
+    result = render_output(repos, path, options, store, incremental=True, nav=nav)
+    return result, store.fingerprint
+
+def write_index_page(out_dir: str, shards: List[Dict], options: Optional[Dict] = None) -> bool:
+    """
+    Write ``out_dir/index.html`` linking to the shards, unless it is already up to date.
+
+    Args:
+        out_dir (str): Output directory
+        shards (List[Dict]): Shard pages, see plan_shards
+        options (Optional[Dict]): Render options, see render_output
+
+    Returns:
+        bool: Whether the page was written
+    """
+    options = options or {}
+    html = render_shard_index(_index_entries(shards))
+    if options.get('badges'):
+        html = inline_badges(html)
+    if options.get('minify'):
+        html = minify_html(html)
+
+    path = os.path.join(out_dir, 'index.html')
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == html:
+                return False
+    except OSError:
+        pass
+    write_chunks(path, [html])
+    if options.get('compress'):
+        precompress(path)
+    return True
+
+def render_shards(repos: List[Repo], out_dir: str, page_size: int, workers: int,
+                  fingerprints: FingerprintStore, options: Optional[Dict] = None) -> Dict:
+    """
+    Write the index page and one page per technology (and per ``page_size`` repositories).
+
+    A shard is only rewritten when its fingerprint changed, so adding a
+    repository touches the pages of its technologies and leaves the rest of
+    the site alone. Rendering is pure-Python work holding the GIL, so threads
+    do not help; with more than one worker the shards are rendered in a
+    process pool and their fingerprints recorded here. Render spans of worker
+    processes do not reach the profile.
+
+    Args:
+        repos (List[Repo]): Filtered repositories in render order
+        out_dir (str): Output directory
+        page_size (int): Repositories per shard page, 0 for one page per technology
+        workers (int): Processes rendering shards, 1 renders them in this process
+        fingerprints (FingerprintStore): Store recording what each page was built from
+        options (Optional[Dict]): Render options, see render_output
+
+    Returns:
+        Dict: ``written``, ``unchanged`` and ``removed`` page paths, ``index_written`` and ``render_time``
+    """
+    start = time.perf_counter()
+    shards = plan_shards(repos, page_size)
+    paths = [os.path.join(out_dir, shard['file']) for shard in shards]
+
+    if workers > 1 and len(shards) > 1:
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_render_shard, shard['repos'], path, options, shard['nav'],
+                                       fingerprints.get(path))
+                       for shard, path in zip(shards, paths)]
+            for path, future in zip(paths, futures):
+                result, fingerprint = future.result()
+                if result['status'] == 'ok':
+                    fingerprints.set(path, fingerprint)
+                results.append(result)
+    else:
+        results = [render_output(shard['repos'], path, options, fingerprints, incremental=True, nav=shard['nav'])
+                   for shard, path in zip(shards, paths)]
+
+    summary = {
+        'written': [path for path, result in zip(paths, results) if result['status'] == 'ok'],
+        'unchanged': [path for path, result in zip(paths, results) if result['status'] == 'unchanged'],
+        'removed': _remove_stale_shards(out_dir, paths),
+        'index_written': write_index_page(out_dir, shards, options),
+    }
+    summary['render_time'] = round(time.perf_counter() - start, 4)
+    print(f"Shards in {out_dir}: {len(summary['written'])} written, {len(summary['unchanged'])} unchanged, "
+          f"{len(summary['removed'])} removed, index {'written' if summary['index_written'] else 'unchanged'}")
+    return summary
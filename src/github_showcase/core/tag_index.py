@@ -0,0 +1,106 @@
+"""
+Topic normalization and matching against the technology filters
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
+from ..config.settings import TECH_FILTERS, TAG_ALIASES
+
+_SEPARATORS = re.compile(r'[\s_/.]+')
+
+def normalize_tag(tag: str) -> str:
+    """
+    Reduce a topic or filter name to the form they are compared in.
+
+    GitHub topics are lowercase words joined by hyphens, so ``CI/CD``,
+    ``ci_cd`` and ``ci-cd`` all become ``ci-cd``.
+
+    Args:
+        tag (str): Topic or filter name
+
+    Returns:
+        str: Normalized tag
+    """
+    return _SEPARATORS.sub('-', tag.strip().lower()).strip('-')
+
+class TagIndex:
+    """
+    Maps repository topics to the technology filters they match.
+
+    A topic matches a filter when both normalize to the same tag, or when the
+    topic is an alias of the filter. The filter bits of every topic seen are
+    memoized, so each distinct topic is resolved once per run.
+
+    Args:
+        tech_filters (Sequence[str]): Technologies offered as filter checkboxes, bit ``i`` is ``tech_filters[i]``
+        aliases (Dict[str, str]): Alternative topic names per filter, e.g. ``{"k8s": "kubernetes"}``
+    """
+
+    def __init__(self, tech_filters: Sequence[str], aliases: Dict[str, str]):
+        self.tech_filters = tuple(tech_filters)
+        self._bits: Dict[str, int] = {}
+        for bit, tech in enumerate(self.tech_filters):
+            self._bits[normalize_tag(tech)] = self._bits.get(normalize_tag(tech), 0) | 1 << bit
+        for alias, tech in aliases.items():
+            bits = self._bits.get(normalize_tag(tech), 0)
+            if bits:
+                key = normalize_tag(alias)
+                self._bits[key] = self._bits.get(key, 0) | bits
+        self._topic_masks: Dict[str, int] = {}
+
+    def topic_mask(self, topic: str) -> int:
+        """Get the bitmask of filters a single topic matches."""
+        mask = self._topic_masks.get(topic)
+        if mask is None:
+            mask = self._topic_masks[topic] = self._bits.get(normalize_tag(topic), 0)
+        return mask
+
+    def mask(self, topics: Iterable[str]) -> int:
+        """
+        Get the bitmask of filters any of the topics matches.
+
+        Args:
+            topics (Iterable[str]): Repository topics
+
+        Returns:
+            int: Filter bitmask
+        """
+        mask = 0
+        for topic in topics:
+            mask |= self.topic_mask(topic)
+        return mask
+
+    def counts(self, masks: Iterable[int]) -> List[int]:
+        """
+        Count the repositories matching each filter.
+
+        Args:
+            masks (Iterable[int]): Filter bitmask per repository
+
+        Returns:
+            List[int]: Repository count per filter, in filter order
+        """
+        counts = [0] * len(self.tech_filters)
+        for mask in masks:
+            while mask:
+                low = mask & -mask
+                counts[low.bit_length() - 1] += 1
+                mask ^= low
+        return counts
+
+@lru_cache(maxsize=None)
+def _tag_index(tech_filters: Tuple[str, ...], aliases: Tuple[Tuple[str, str], ...]) -> TagIndex:
+    return TagIndex(tech_filters, dict(aliases))
+
+def get_tag_index(tech_filters: Sequence[str] = TECH_FILTERS, aliases: Dict[str, str] = TAG_ALIASES) -> TagIndex:
+    """
+    Get the tag index for a set of filters, built on first use and shared for the process.
+
+    Args:
+        tech_filters (Sequence[str]): Technologies offered as filter checkboxes
+        aliases (Dict[str, str]): Alternative topic names per filter
+
+    Returns:
+        TagIndex: Shared index
+    """
+    return _tag_index(tuple(tech_filters), tuple(sorted(aliases.items())))
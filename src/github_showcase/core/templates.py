@@ -0,0 +1,822 @@
+"""
+Precompiled page templates for GitHub Showcase
+
+The page is split into static segments, the filter sidebar rendered with the
+repository count of each filter, and a per-row template filled in for each
+repository.
+"""
+from html import escape
+import json
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+from ..config.settings import LANGUAGES_SHOWN
+from ..utils.repo import Repo
+
+DOCUMENT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>GH RepoHub</title>
+    <style>
+        :root {
+            --bg-color: #f5f6fa;
+            --text-color: #23272f;
+            --header-bg: linear-gradient(270deg, #4e54c8, #8f94fb);
+            --card-bg: #fff;
+            --border-color: #e0e0e0;
+            --tag-bg: #e3eafc;
+            --table-bg: #fff;
+            --filter-bg: #f0f2f7;
+            --search-border: #4e54c8;
+            --table-header-bg: #f0f2f7;
+            --table-row-hover: #f5f5f5;
+            --accent: #4e54c8;
+        }
+        [data-theme="dark"] {
+            --bg-color: #181A20;
+            --text-color: #F1F1F1;
+            --header-bg: linear-gradient(270deg, #23286b, #1e7d34, #4b2d7f);
+            --card-bg: #23242b;
+            --border-color: #23242b;
+            --tag-bg: #232d3b;
+            --table-bg: #23242b;
+            --filter-bg: #23242b;
+            --search-border: #8f94fb;
+            --table-header-bg: #232d3b;
+            --table-row-hover: #232d3b;
+            --accent: #8f94fb;
+        }
+        html {
+            font-size: 18px;
+        }
+        body {
+            max-width: 100vw;
+            overflow-x: hidden;
+            font-size: 1rem;
+            margin: 0;
+            padding: 0.3rem;
+            background-color: var(--bg-color);
+            color: var(--text-color);
+            font-family: 'Inter', 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
+            transition: background-color 0.3s, color 0.3s;
+        }
+        .page-title {
+            background: linear-gradient(90deg, #ff9966, #ff5e62, #36d1c4, #5b86e5, #36d1c4, #ff9966);
+            background-size: 200% 200%;
+            animation: gradient-move 8s ease-in-out infinite;
+            color: white;
+            padding: 0.6rem 1rem 0.6rem 1rem;
+            text-align: center;
+            border-radius: 12px;
+            margin-bottom: 0.5rem;
+            width: 100%;
+            font-size: 2.8rem;
+            font-weight: 900;
+            letter-spacing: 1px;
+            box-shadow: 0 4px 24px 0 rgba(0,0,0,0.10);
+            position: relative;
+        }
+        @keyframes gradient-move {
+            0% { background-position: 0% 50%; }
+            50% { background-position: 100% 50%; }
+            100% { background-position: 0% 50%; }
+        }
+        .page-title .animated-text {
+            display: inline-block;
+            background: linear-gradient(90deg, #ff9966, #36d1c4, #5b86e5, #ff5e62);
+            background-size: 400% 400%;
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            animation: text-gradient-move 6s ease-in-out infinite;
+        }
+        @keyframes text-gradient-move {
+            0% { background-position: 0% 50%; }
+            50% { background-position: 100% 50%; }
+            100% { background-position: 0% 50%; }
+        }
+        .badge-container {
+            width: 100%;
+            margin-left: auto;
+            margin-top: 1rem;
+            margin-bottom: 1rem;
+            display: flex;
+            gap: 0.75rem;
+            flex-wrap: wrap;
+            justify-content: flex-end;
+        }
+        .badge-container img {
+            height: 1.6rem;
+            transition: transform 0.2s ease;
+        }
+        .badge-container img:hover {
+            transform: translateY(-2px) scale(1.08);
+        }
+        .theme-toggle {
+            position: fixed;
+            bottom: 1.5rem;
+            right: 1.5rem;
+            padding: 0.75rem 1.2rem;
+            border-radius: 24px;
+            border: none;
+            background: var(--card-bg);
+            color: var(--text-color);
+            cursor: pointer;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.12);
+            z-index: 1000;
+            font-weight: 600;
+        }
+        .main-container {
+            display: flex;
+            flex-direction: row;
+            gap: 2rem;
+            width: 100vw;
+            max-width: none;
+            margin: 0;
+            padding: 0 0.5rem 2rem 0.5rem;
+            align-items: flex-start;
+        }
+        .filter-section {
+            min-width: 220px;
+            background: var(--filter-bg);
+            padding: 1.5rem 1rem 1rem 1rem;
+            border-radius: 12px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.10);
+            height: fit-content;
+            color: var(--text-color);
+            font-size: 1.05rem;
+            font-weight: 500;
+            border-right: 1px solid var(--border-color);
+            flex-shrink: 0;
+            position: sticky;
+            top: 1.5rem;
+            z-index: 10;
+            max-height: 90vh;
+            overflow-y: auto;
+        }
+        .content-section {
+            flex: 1 1 0%;
+            background: var(--card-bg);
+            border-radius: 12px;
+            box-shadow: 0 2px 12px rgba(0,0,0,0.10);
+            padding: 2rem 2rem 2rem 2rem;
+            min-width: 0;
+        }
+        .info-banner, #searchInput {
+            max-width: 900px;
+            margin: 0 auto 1.2rem auto;
+            display: block;
+        }
+        table {
+            table-layout: auto;
+            width: 100%;
+            overflow-x: auto;
+            font-size: 1rem;
+            border-collapse: collapse;
+            margin-top: 1.2rem;
+            background: var(--table-bg);
+            box-shadow: 0 1px 6px rgba(0,0,0,0.08);
+            border-radius: 8px;
+        }
+        th, td {
+            font-size: 1rem;
+            padding: 0.8rem 0.6rem;
+            text-align: left;
+            border-bottom: 1px solid var(--border-color);
+            color: var(--text-color);
+        }
+        th {
+            background-color: var(--table-header-bg);
+            position: sticky;
+            top: 0;
+            z-index: 1;
+            font-weight: 700;
+            letter-spacing: 0.5px;
+        }
+        tr:hover {
+            background-color: var(--table-row-hover);
+        }
+        .info-banner {
+            background-color: var(--accent);
+            border: 1px solid var(--accent);
+            border-radius: 8px;
+            padding: 1rem 1.2rem;
+            margin-bottom: 1.2rem;
+            color: #fff;
+            font-size: 1.08rem;
+            font-weight: 500;
+            box-shadow: 0 1px 6px rgba(0,0,0,0.08);
+        }
+        [data-theme="dark"] .info-banner {
+            background-color: var(--accent);
+            border: 1px solid var(--accent);
+            color: #181A20;
+        }
+        .filter-group {
+            margin: 0.7rem 0;
+        }
+        .filter-group label {
+            display: flex;
+            align-items: center;
+            gap: 0.6rem;
+            cursor: pointer;
+            color: var(--text-color);
+            font-size: 1rem;
+        }
+        .filter-count {
+            margin-left: auto;
+            opacity: 0.7;
+            font-size: 0.9rem;
+        }
+        input[type="text"] {
+            padding: 0.7rem;
+            width: 100%;
+            margin-bottom: 1.2rem;
+            border: 2px solid var(--search-border);
+            border-radius: 6px;
+            background: var(--card-bg);
+            color: var(--text-color);
+            font-size: 1rem;
+        }
+        input[type="text"]:focus {
+            outline: none;
+            border-color: var(--accent);
+        }
+        a {
+            color: var(--accent);
+            text-decoration: none;
+            font-weight: 500;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+        .tag {
+            display: inline-block;
+            background-color: var(--tag-bg);
+            padding: 0.4rem 0.8rem;
+            margin: 2px;
+            border-radius: 4px;
+            font-size: 0.95rem;
+            color: var(--text-color);
+            font-weight: 500;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.04);
+        }
+        .stars {
+            white-space: nowrap;
+            opacity: 0.8;
+            font-size: 0.9rem;
+        }
+        .languages {
+            margin-top: 0.4rem;
+            opacity: 0.7;
+            font-size: 0.9rem;
+        }
+        .pager {
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            gap: 1rem;
+            margin-top: 1.2rem;
+        }
+        .pager[hidden] {
+            display: none;
+        }
+        .pager button {
+            padding: 0.5rem 1rem;
+            border: 2px solid var(--accent);
+            border-radius: 6px;
+            background: var(--card-bg);
+            color: var(--text-color);
+            cursor: pointer;
+            font-weight: 600;
+        }
+        .pager button:disabled {
+            opacity: 0.4;
+            cursor: default;
+        }
+        .shard-nav {
+            display: flex;
+            gap: 1rem;
+            flex-wrap: wrap;
+            margin-top: 1.2rem;
+        }
+        .shard-list {
+            list-style: none;
+            padding: 0;
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(220px, 1fr));
+            gap: 0.8rem;
+        }
+        .shard-list li {
+            background: var(--filter-bg);
+            border-radius: 8px;
+            padding: 0.8rem 1rem;
+        }
+        .shard-count {
+            float: right;
+            opacity: 0.7;
+        }
+        th:nth-child(1), td:nth-child(1) {
+            min-width: 120px;
+            width: 13%;
+        }
+        th:nth-child(4), td:nth-child(4) {
+            min-width: 260px;
+            width: 28%;
+        }
+        th:nth-child(2), td:nth-child(2) {
+            min-width: 300px;
+            width: 35%;
+        }
+        @media (max-width: 900px) {
+            html {
+                font-size: 14px;
+            }
+            .main-container {
+                flex-direction: column;
+                gap: 0;
+                padding: 0 0.5rem;
+                align-items: stretch;
+            }
+            .content-section, .filter-section {
+                padding: 0.8rem 0.2rem;
+            }
+            .filter-section {
+                min-width: 0;
+                border-right: none;
+                border-bottom: 1px solid var(--border-color);
+            }
+            th:nth-child(1), td:nth-child(1) {
+                min-width: 100px;
+                width: 18%;
+            }
+            th:nth-child(4), td:nth-child(4) {
+                min-width: 120px;
+                width: 25%;
+            }
+        }
+        @media (max-width: 600px) {
+            html {
+                font-size: 15px;
+            }
+            .page-title {
+                font-size: 1.2rem;
+                padding: 1rem 0.2rem;
+            }
+            th, td {
+                font-size: 0.95rem;
+                padding: 0.5rem 0.2rem;
+            }
+        }
+        @media (min-width: 1800px) {
+            .main-container {
+                max-width: 1700px;
+                margin: 0 auto;
+            }
+        }
+    </style>
+</head>
+<body>
+    <!-- Title Section -->
+    <h1 class="page-title"><span class="animated-text">My GitHub Portfolio</span></h1>
+
+    <!-- Badges Container -->
+    <div class="badge-container">
+        <a href="https://vijaysingh.cloud" target="_blank">
+            <img src="https://img.shields.io/badge/visit_my_Portfolio-%23000000.svg?style=for-the-badge&logo=firefox&logoColor=#FF7139" alt="Portfolio">
+        </a>
+        <a href="https://www.linkedin.com/in/vsingh55/" target="_blank">
+            <img src="https://img.shields.io/badge/Let's_connect_🤝-%230077B5.svg?style=for-the-badge&logo=linkedin&logoColor=white" alt="LinkedIn">
+        </a>
+        <a href="https://blogs.vijaysingh.cloud/" target="_blank">
+            <img src="https://img.shields.io/badge/-Visit_my_Blogs-034efc?style=for-the-badge&logo=hashnode&logoColor=white" alt="Blog">
+        </a>
+        <a href="https://x.com/vsingh_55" target="_blank">
+            <img src="https://img.shields.io/badge/-@Follow_me-1DA1F2?style=for-the-badge&logo=twitter&logoColor=white" alt="Twitter">
+        </a>
+        <a href="mailto:vscit23@gmail.com">
+            <img src="https://img.shields.io/badge/-mail_me_-a284e8?style=for-the-badge&logo=gmail&logoColor=white" alt="Email">
+        </a>
+    </div>
+
+"""
+
+SIDEBAR_HEAD = """    <!-- Main Content -->
+    <div class="main-container">
+        <div class="filter-section">
+            <h3>Filter by Technology:</h3>
+"""
+
+PAGE_HEAD = DOCUMENT_HEAD + SIDEBAR_HEAD
+
+FILTER_TEMPLATE = '            <div class="filter-group"><label><input type="checkbox" value="{tech}" data-bit="{bit}"> {label} <span class="filter-count">{count}</span></label></div>\n'
+
+TABLE_HEAD = """
+        </div>
+
+        <div class="content-section">
+            <div class="info-banner">
+                💡 Click on project names to view their respective GH repositories. Each project includes detailed documentation, code, setup guide & visit Blog page to detailed implementation steps.
+            </div>
+
+            <input type="text" id="searchInput" placeholder="Search across all content..." oninput="searchTable()">
+
+            <table>
+                <thead>
+                    <tr>
+                        <th>Name</th>
+                        <th>Description</th>
+                        <th>Website</th>
+                        <th>Tags</th>
+                        <th>Blog</th>
+                    </tr>
+                </thead>
+                <tbody>
+"""
+
+TABLE_CLOSE = """                </tbody>
+            </table>
+"""
+
+CONTENT_TAIL = """
+            <!-- Pagination, only shown when rows are rendered from the row index -->
+            <div class="pager" id="pager" hidden>
+                <button type="button" id="pagerPrev" onclick="changePage(-1)">&larr; Previous</button>
+                <span id="pagerStatus"></span>
+                <button type="button" id="pagerNext" onclick="changePage(1)">Next &rarr;</button>
+            </div>
+        </div>
+    </div>
+
+    <!-- Theme Toggle -->
+    <button class="theme-toggle" onclick="toggleTheme()">🌓 Toggle Theme</button>
+
+"""
+
+ROW_INDEX_TEMPLATE = """    <script id="row-index" type="application/json">{}</script>
+
+"""
+
+THEME_SCRIPT = """        // Theme Management
+        function toggleTheme() {
+            const body = document.body;
+            const currentTheme = body.getAttribute('data-theme');
+            const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+            body.setAttribute('data-theme', newTheme);
+            localStorage.setItem('theme', newTheme);
+        }
+
+        // Initialize theme
+        const savedTheme = localStorage.getItem('theme') || 'light';
+        document.body.setAttribute('data-theme', savedTheme);
+"""
+
+PAGE_TAIL = "    <script>\n" + THEME_SCRIPT + """
+        // Row index built at generation time: a lowercased search string and a
+        // bitmask of matching technology filters per row (maskWords 32-bit words each).
+        // In paged mode it also carries the row data and the table body starts empty.
+        const rowIndex = JSON.parse(document.getElementById('row-index').textContent);
+        const searchIndex = rowIndex.text;
+        const maskWords = rowIndex.words;
+        const rowMasks = Uint32Array.from(rowIndex.masks);
+        const selectedMask = new Uint32Array(maskWords);
+        const pagedRows = rowIndex.rows || null;
+        const pageSize = rowIndex.pageSize || 0;
+        const tableRows = pagedRows ? [] : Array.from(document.querySelectorAll('tbody tr'));
+        let searchTimer = null;
+        let matches = [];
+        let currentPage = 0;
+
+        // Search functionality
+        function searchTable() {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(applyFilters, 120);
+        }
+
+        function rowVisible(i, searchTerm, anySelected) {
+            if (searchTerm && !searchIndex[i].includes(searchTerm)) {
+                return false;
+            }
+            if (!anySelected) {
+                return true;
+            }
+            for (let w = 0, base = i * maskWords; w < maskWords; w++) {
+                if (rowMasks[base + w] & selectedMask[w]) {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        // Combine the technology filter and the search term in one pass
+        function applyFilters() {
+            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+            const anySelected = selectedMask.some(word => word !== 0);
+
+            if (pagedRows) {
+                matches = [];
+                for (let i = 0; i < searchIndex.length; i++) {
+                    if (rowVisible(i, searchTerm, anySelected)) {
+                        matches.push(i);
+                    }
+                }
+                currentPage = 0;
+                renderPage();
+                return;
+            }
+
+            const displays = tableRows.map((row, i) => rowVisible(i, searchTerm, anySelected) ? '' : 'none');
+
+            // Write all visibility changes in one frame, touching only rows that change
+            requestAnimationFrame(() => {
+                tableRows.forEach((row, i) => {
+                    if (row.style.display !== displays[i]) {
+                        row.style.display = displays[i];
+                    }
+                });
+            });
+        }
+
+        // Paged mode: only the current page of matching rows is in the DOM
+        function makeLink(href, text, title) {
+            const link = document.createElement('a');
+            link.href = href;
+            link.target = '_blank';
+            link.textContent = text;
+            if (title) {
+                link.title = title;
+            }
+            return link;
+        }
+
+        function buildRow(data) {
+            const [name, url, description, homepage, tags, blogUrl, stars, languages] = data;
+            const row = document.createElement('tr');
+            const cells = Array.from({length: 5}, () => row.appendChild(document.createElement('td')));
+            cells[0].appendChild(makeLink(url, name, 'View GitHub Repository'));
+            if (stars) {
+                cells[0].appendChild(document.createTextNode(' '));
+                const span = cells[0].appendChild(document.createElement('span'));
+                span.className = 'stars';
+                span.title = 'Stars';
+                span.textContent = `★ ${stars}`;
+            }
+            cells[1].textContent = description;
+            if (languages.length) {
+                const div = cells[1].appendChild(document.createElement('div'));
+                div.className = 'languages';
+                div.textContent = languages.join(' · ');
+            }
+            if (homepage) {
+                cells[2].appendChild(makeLink(homepage, 'Website'));
+            }
+            tags.forEach(tag => {
+                const span = cells[3].appendChild(document.createElement('span'));
+                span.className = 'tag';
+                span.textContent = tag;
+            });
+            if (blogUrl) {
+                cells[4].appendChild(makeLink(blogUrl, 'Read Blog'));
+            } else {
+                cells[4].textContent = 'Coming Soon';
+            }
+            return row;
+        }
+
+        function renderPage() {
+            const pageCount = Math.max(Math.ceil(matches.length / pageSize), 1);
+            const start = currentPage * pageSize;
+            const fragment = document.createDocumentFragment();
+            matches.slice(start, start + pageSize).forEach(i => fragment.appendChild(buildRow(pagedRows[i])));
+
+            requestAnimationFrame(() => {
+                document.querySelector('tbody').replaceChildren(fragment);
+                document.getElementById('pagerStatus').textContent =
+                    `Page ${currentPage + 1} of ${pageCount} (${matches.length} repositories)`;
+                document.getElementById('pagerPrev').disabled = currentPage === 0;
+                document.getElementById('pagerNext').disabled = currentPage >= pageCount - 1;
+            });
+        }
+
+        function changePage(delta) {
+            const pageCount = Math.max(Math.ceil(matches.length / pageSize), 1);
+            const page = Math.min(Math.max(currentPage + delta, 0), pageCount - 1);
+            if (page !== currentPage) {
+                currentPage = page;
+                renderPage();
+            }
+        }
+
+        // Filter functionality
+        const filterInputs = Array.from(document.querySelectorAll('.filter-section input'));
+
+        function readSelectedFilters() {
+            selectedMask.fill(0);
+            filterInputs.forEach(checkbox => {
+                if (checkbox.checked) {
+                    const bit = Number(checkbox.dataset.bit);
+                    selectedMask[bit >>> 5] |= 1 << (bit & 31);
+                }
+            });
+        }
+
+        filterInputs.forEach(checkbox => {
+            checkbox.addEventListener('change', () => {
+                readSelectedFilters();
+                applyFilters();
+            });
+        });
+
+        // Browsers may restore checkbox state on reload
+        readSelectedFilters();
+        if (pagedRows) {
+            document.getElementById('pager').hidden = false;
+            applyFilters();
+        } else if (selectedMask.some(word => word !== 0)) {
+            applyFilters();
+        }
+    </script>
+</body>
+</html>"""
+
+ROW_TEMPLATE = """                    <tr>
+                        <td><a href="{html_url}" target="_blank" title="View GitHub Repository">{name}</a>{stars}</td>
+                        <td>{description}{languages}</td>
+                        <td>{website}</td>
+                        <td>{tags}</td>
+                        <td>{blog}</td>
+                    </tr>
+"""
+
+SHARD_NAV_TEMPLATE = """            <nav class="shard-nav">{links}</nav>
+"""
+
+SHARD_INDEX_TEMPLATE = """    <!-- Technology Index -->
+    <div class="main-container">
+        <div class="content-section">
+            <div class="info-banner">
+                💡 Pick a technology to browse its projects. Each page lists the matching GH repositories with their documentation, website & blog links.
+            </div>
+
+            <ul class="shard-list">
+{items}            </ul>
+        </div>
+    </div>
+
+    <!-- Theme Toggle -->
+    <button class="theme-toggle" onclick="toggleTheme()">🌓 Toggle Theme</button>
+
+    <script>
+{theme_script}    </script>
+</body>
+</html>"""
+
+SHARD_ITEM_TEMPLATE = '                <li><a href="{href}">{label}</a> <span class="shard-count">{count}</span></li>\n'
+
+# Bound format methods skip the attribute lookup on every row
+_format_row = ROW_TEMPLATE.format
+_format_website = '<a href="{}" target="_blank">Website</a>'.format
+_format_blog = '<a href="{}" target="_blank">Read Blog</a>'.format
+_format_tag = '<span class="tag">{}</span>'.format
+_format_stars = ' <span class="stars" title="Stars">★ {}</span>'.format
+_format_languages = '<div class="languages">{}</div>'.format
+
+def format_tech_name(tech: str) -> str:
+    """
+    Format technology name for display.
+    
+    Args:
+        tech (str): Technology name
+        
+    Returns:
+        str: Formatted technology name
+    """
+    replacements = {
+        'ci/cd': 'CI/CD',
+        'devsecops': 'DevSecOps',
+        'github-actions': 'GitHub Actions',
+        'shell-scripting': 'Shell Scripting'
+    }
+    return replacements.get(tech, tech.replace('-', ' ').title())
+
+class StaticSegments(NamedTuple):
+    """Static markup of the showcase page, in document order around the dynamic parts."""
+    head: str  # Up to and including the opening filter section
+    table_head: str  # Closes the filter section and opens the table body
+    table_close: str  # Closes the table body; navigation links may follow
+    content_tail: str  # Pager, end of the content section and theme toggle
+    page_tail: str  # Page script after the row index
+
+STATIC_SEGMENTS = StaticSegments(PAGE_HEAD, TABLE_HEAD, TABLE_CLOSE, CONTENT_TAIL, PAGE_TAIL)
+
+def render_filters(tech_filters: Sequence[str], counts: Sequence[int]) -> str:
+    """
+    Render the technology filter checkboxes with the number of matching repositories.
+
+    Filters no repository matches are left out; the others keep their bit so
+    they line up with the row index masks.
+
+    Args:
+        tech_filters (Sequence[str]): Technologies offered as filter checkboxes
+        counts (Sequence[int]): Repositories matching each filter, see TagIndex.counts
+
+    Returns:
+        str: Filter markup
+    """
+    return ''.join(FILTER_TEMPLATE.format(tech=tech, bit=bit, label=format_tech_name(tech), count=count)
+                   for bit, (tech, count) in enumerate(zip(tech_filters, counts)) if count)
+
+def render_row(repo: Repo, stars: bool = False) -> str:
+    """
+    Render the table row for a repository.
+    
+    Args:
+        repo (Repo): Repository record
+        stars (bool): Show the star count next to the name
+        
+    Returns:
+        str: Row markup
+    """
+    return _format_row(
+        html_url=repo.html_url,
+        name=repo.name_html,
+        stars=_format_stars(repo.stargazers_count) if stars and repo.stargazers_count else '',
+        description=repo.summary_html,
+        languages=_format_languages(' · '.join(repo.languages_html)) if repo.languages_html else '',
+        website=_format_website(repo.homepage_html) if repo.homepage else '',
+        tags=''.join([_format_tag(tag) for tag in repo.topics_html]),
+        # Only show 'Read Blog' if the repo is explicitly mapped in BLOG_MAPPING
+        blog=_format_blog(repo.blog_url) if repo.blog_url else 'Coming Soon',
+    )
+
+def row_data(repo: Repo, stars: bool = False) -> List:
+    """
+    Build the compact row record the page renders itself in paged mode.
+    
+    Values are left unescaped; the page inserts them as text nodes.
+    
+    Args:
+        repo (Repo): Repository record
+        stars (bool): Include the star count, otherwise it is sent as 0 and not shown
+        
+    Returns:
+        List: Name, URL, description, homepage, topics, blog URL, stars and shown languages
+    """
+    return [repo.name, repo.html_url, repo.summary, repo.homepage, list(repo.topics), repo.blog_url,
+            repo.stargazers_count if stars else 0, list(repo.languages[:LANGUAGES_SHOWN])]
+
+def render_row_index(texts: List[str], masks: List[int], filter_count: int,
+                     rows: Optional[List[List]] = None, page_size: int = 0) -> str:
+    """
+    Render the per-row search texts and filter bitmasks as an embedded JSON script block.
+    
+    Each mask is split into 32-bit words so the page can load all of them into
+    one Uint32Array. When ``rows`` is given the page runs in paged mode and
+    builds ``page_size`` rows at a time from them.
+    
+    Args:
+        texts (List[str]): Search text per row, in row order
+        masks (List[int]): Filter bitmask per row, in row order
+        filter_count (int): Number of technology filters
+        rows (Optional[List[List]]): Row records from row_data for paged mode
+        page_size (int): Rows per page in paged mode
+        
+    Returns:
+        str: Script element holding the index
+    """
+    words = max((filter_count + 31) // 32, 1)
+    flat_masks = [(mask >> (32 * word)) & 0xFFFFFFFF for mask in masks for word in range(words)]
+    index = {'text': texts, 'words': words, 'masks': flat_masks}
+    if rows is not None:
+        index['rows'] = rows
+        index['pageSize'] = page_size
+    payload = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    # '<' is escaped so a description can never close the script element
+    return ROW_INDEX_TEMPLATE.format(payload.replace('<', '\\u003c'))
+
+def render_shard_nav(links: Sequence[Tuple[str, str]]) -> str:
+    """
+    Render the navigation bar of a shard page.
+    
+    Args:
+        links (Sequence[Tuple[str, str]]): Link targets and labels
+        
+    Returns:
+        str: Navigation markup
+    """
+    return SHARD_NAV_TEMPLATE.format(
+        links=''.join(f'<a href="{escape(href)}">{escape(label)}</a>' for href, label in links)
+    )
+
+def render_shard_index(entries: Sequence[Tuple[str, str, int]]) -> str:
+    """
+    Render the landing page linking to the per-technology shards.
+    
+    Args:
+        entries (Sequence[Tuple[str, str, int]]): Link target, label and repository count per shard
+        
+    Returns:
+        str: Page markup
+    """
+    items = ''.join(SHARD_ITEM_TEMPLATE.format(href=escape(href), label=escape(label), count=count)
+                    for href, label, count in entries)
+    return DOCUMENT_HEAD + SHARD_INDEX_TEMPLATE.format(items=items, theme_script=THEME_SCRIPT)
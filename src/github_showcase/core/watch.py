@@ -0,0 +1,64 @@
+"""
+Long-running refresh loop driven by the owners' event feeds
+"""
+import time
+from typing import Callable, Optional
+from ..config.settings import WATCH_INTERVAL, WATCH_FULL_REFRESH
+from ..utils.events import EventPoller
+from ..utils.rate_limit import RateLimitExceeded
+
+def run_watch(refresh: Callable[[], bool], poller: EventPoller, interval: float = WATCH_INTERVAL,
+              full_refresh: float = WATCH_FULL_REFRESH, cycles: Optional[int] = None,
+              sleep: Callable[[float], None] = time.sleep) -> None:
+    """
+    Keep the output up to date, refreshing only when the owners had relevant activity.
+
+    Every ``interval`` seconds (or the longer X-Poll-Interval GitHub asks
+    for) the event feeds are polled. A refresh runs when they show new
+    events worth one, or when ``full_refresh`` seconds passed since the last
+    refresh, which picks up edits that raise no event. ``refresh`` is
+    expected to fetch through the HTTP cache and render incrementally, so an
+    unchanged listing costs only 304s and leaves the output untouched.
+
+    A failed poll or refresh is reported and retried on the next cycle, with
+    the events seen so far still pending; an exhausted rate limit postpones
+    the next cycle until it resets.
+
+    Args:
+        refresh (Callable[[], bool]): Fetches and renders, returns whether the output changed
+        poller (EventPoller): Poller of the owners' event feeds
+        interval (float): Seconds between polls
+        full_refresh (float): Seconds after which a refresh runs without new events, 0 to never force one
+        cycles (Optional[int]): Number of polls before returning, None to run until interrupted
+        sleep (Callable[[float], None]): Function waiting between polls
+    """
+    # The feeds are read before the first refresh, so events arriving during it are seen by the next poll
+    poller.poll()
+    refresh()
+    last_refresh = time.monotonic()
+
+    pending = []
+    cycle = 0
+    while cycles is None or cycle < cycles:
+        cycle += 1
+        delay = max(interval, poller.poll_interval)
+        try:
+            sleep(delay)
+            pending.extend(poller.poll())
+            stale = full_refresh > 0 and time.monotonic() - last_refresh >= full_refresh
+            if not pending and not stale:
+                print(f"No new activity, next poll in {delay:.0f}s")
+                continue
+            reason = f"{len(pending)} new events" if pending else f"no refresh for {full_refresh:.0f}s"
+            print(f"Refreshing: {reason}")
+            for change in pending[:10]:
+                print(f" - {change}")
+            changed = refresh()
+            pending = []
+            last_refresh = time.monotonic()
+            print("Output updated" if changed else "Output unchanged")
+        except RateLimitExceeded as e:
+            print(f"{e}; pausing until it resets")
+            sleep(max(e.reset_at - time.time(), 0))
+        except Exception as e:
+            print(f"Refresh failed, retrying next cycle: {str(e)}")
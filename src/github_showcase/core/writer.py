@@ -0,0 +1,40 @@
+"""
+Buffered output writer for generated pages
+"""
+import os
+import time
+from typing import Iterable
+from ..config.settings import WRITE_BUFFER_SIZE
+from ..utils.instrumentation import metrics
+
+def write_chunks(path: str, chunks: Iterable[str], buffer_size: int = WRITE_BUFFER_SIZE) -> int:
+    """
+    Stream chunks of text to a file without joining them in memory.
+    
+    The chunks go to a temporary sibling first, which replaces ``path`` only
+    once everything was written, so a failed render never leaves a truncated page.
+    
+    Args:
+        path (str): Output file path
+        chunks (Iterable[str]): Pieces of the document in order
+        buffer_size (int): Write buffer size in bytes
+        
+    Returns:
+        int: Size of the written file in bytes
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    # Time spent in file I/O only; producing the chunks is timed by the caller
+    write_time = 0.0
+    with open(tmp_path, 'w', encoding='utf-8', buffering=buffer_size) as f:
+        for chunk in chunks:
+            start = time.perf_counter()
+            f.write(chunk)
+            write_time += time.perf_counter() - start
+        start = time.perf_counter()
+    os.replace(tmp_path, path)
+    write_time += time.perf_counter() - start
+    metrics.add_span('write', write_time, output=path)
+    return os.path.getsize(path)
@@ -0,0 +1,196 @@
+"""
+Asyncio front end for fetching repositories of many accounts from one event loop
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Optional, Sequence
+import requests
+from ..config.settings import HTTP_POOL_SIZE, FETCH_CONCURRENCY, FETCH_BACKEND
+from .checkpoint import CheckpointStore, FetchCheckpoint
+from .github_api import RestListing, fetch_steps, repos_url
+from .graphql_api import GRAPHQL_URL, GraphQLListing
+from .instrumentation import metrics
+from .owners import Owner
+from .rate_limit import RateLimitHandler, WAIT
+from .repo import Repo
+
+class AsyncClient:
+    """
+    Asynchronous API client sharing a RateLimitHandler with the blocking code.
+
+    Requests follow RateLimitHandler.request_steps, so retries, backoff, the
+    HTTP cache and the shared rate budget behave exactly as in make_request,
+    but every wait is an ``asyncio.sleep``. Only requests actually on the wire
+    occupy a thread: they are sent on a pool of ``max_in_flight`` threads
+    through the handler's keep-alive session, so a single loop can keep
+    hundreds of accounts in flight while most of them are waiting.
+    """
+
+    def __init__(self, rate_limiter: Optional[RateLimitHandler] = None, max_in_flight: int = HTTP_POOL_SIZE):
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimitHandler()
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='github-http')
+
+    async def __aenter__(self) -> 'AsyncClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the request threads."""
+        self._executor.shutdown(wait=False)
+
+    async def request(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
+        """
+        Make an API request with rate limit handling and retries without blocking the loop.
+
+        Args:
+            url: API endpoint URL
+            method: HTTP method
+            **kwargs: Additional arguments for requests
+
+        Returns:
+            Response object
+
+        Raises:
+            Exception: If request fails after all retries
+        """
+        loop = asyncio.get_running_loop()
+        steps = self.rate_limiter.request_steps(url, method, **kwargs)
+        value, error = None, None
+        while True:
+            try:
+                action, argument = steps.send(value) if error is None else steps.throw(error)
+            except StopIteration as done:
+                return done.value
+            value, error = None, None
+            if action == WAIT:
+                await asyncio.sleep(argument)
+                continue
+            try:
+                value = await loop.run_in_executor(
+                    self._executor, partial(self.rate_limiter.session.request, method, url, **argument))
+            except requests.exceptions.RequestException as e:
+                error = e
+
+    async def fetch_page(self, owner: Owner, page: int) -> List[Dict]:
+        """
+        Fetch a single page of repositories.
+
+        Args:
+            owner (Owner): User or organization whose repositories are listed
+            page (int): Page number
+
+        Returns:
+            List[Dict]: Repositories on that page
+        """
+        print(f"\nFetching page {page} for {owner}...")
+        response = await self.request(repos_url(owner, page))
+        batch = response.json()
+        print(f"Page {page}: {len(batch)} repositories")
+        return batch
+
+    async def fetch_rest_repositories(self, owner: Owner, concurrency: int = FETCH_CONCURRENCY,
+                                      checkpoint: Optional[FetchCheckpoint] = None) -> List[Dict]:
+        """
+        Fetch all repositories of a user or organization through the REST API.
+
+        Pages are planned, saved and merged by the same RestListing as in the
+        blocking backend; at most ``concurrency`` pages are requested at once.
+        When a page fails, pages already in flight still complete and are
+        saved before the first error is raised.
+
+        Args:
+            owner (Owner): User or organization whose repositories are listed
+            concurrency (int): Maximum number of pages fetched at once
+            checkpoint (Optional[FetchCheckpoint]): Checkpoint to resume from and save pages to
+
+        Returns:
+            List[Dict]: Unfiltered repository data in page order
+        """
+        listing = RestListing(owner, checkpoint)
+        if listing.needs_first_page():
+            print(f"\nFetching page 1 for {owner}...")
+            listing.add_first_page(await self.request(repos_url(owner, 1)))
+
+        limit = asyncio.Semaphore(max(concurrency, 1))
+        errors = []
+
+        async def fetch_limited(page: int) -> None:
+            async with limit:
+                # Once a page failed, pages not started yet are left for the next run
+                if errors:
+                    return
+                try:
+                    batch = await self.fetch_page(owner, page)
+                except Exception as e:
+                    errors.append(e)
+                    return
+            listing.add_page(page, batch)
+
+        # Pages in flight when another one fails still complete and are saved
+        await asyncio.gather(*(fetch_limited(page) for page in listing.remaining()))
+        if errors:
+            raise errors[0]
+        return listing.repositories()
+
+    async def fetch_graphql_repositories(self, owner: Owner, concurrency: int = 1,
+                                         checkpoint: Optional[FetchCheckpoint] = None) -> List[Dict]:
+        """
+        Fetch all repositories of a user or organization through the GraphQL API, one cursor page after another.
+
+        Args:
+            owner (Owner): User or organization whose repositories are listed
+            concurrency (int): Unused, accepted for backend compatibility
+            checkpoint (Optional[FetchCheckpoint]): Checkpoint to resume from and save pages to
+
+        Returns:
+            List[Dict]: Unfiltered repository data in REST shape
+
+        Raises:
+            Exception: If no token is configured or the API returns errors
+        """
+        listing = GraphQLListing(owner, checkpoint)
+        query = listing.next_query()
+        while query is not None:
+            response = await self.request(GRAPHQL_URL, method='POST', json=query)
+            listing.add_page(response.json())
+            query = listing.next_query()
+        return listing.repositories()
+
+    async def get_all_repositories(self, username: str, concurrency: int = FETCH_CONCURRENCY,
+                                   backend: str = FETCH_BACKEND,
+                                   checkpoints: Optional[CheckpointStore] = None,
+                                   sources: Optional[Sequence[str]] = None) -> List[Repo]:
+        """
+        Fetch all public repositories for a page.
+
+        Owners, checkpoints and filtering follow the same fetch_steps as the
+        blocking get_all_repositories.
+
+        Args:
+            username (str): GitHub user the page belongs to
+            concurrency (int): Maximum number of pages fetched at once
+            backend (str): ``rest`` or ``graphql``
+            checkpoints (Optional[CheckpointStore]): Store of interrupted fetches
+            sources (Optional[Sequence[str]]): Owner specs, usernames or ``org:<name>``; defaults to ``username``
+
+        Returns:
+            List[Repo]: Repositories, most recently pushed first
+        """
+        backends = {'rest': self.fetch_rest_repositories, 'graphql': self.fetch_graphql_repositories}
+        steps = fetch_steps(username, backend, checkpoints, sources)
+        batch, error = None, None
+        while True:
+            try:
+                owner, checkpoint = steps.send(batch) if error is None else steps.throw(error)
+            except StopIteration as done:
+                return done.value
+            batch, error = None, None
+            try:
+                with metrics.span('fetch', username=owner.login, owner=owner.kind, backend=backend,
+                                  engine='asyncio'):
+                    batch = await backends[backend](owner, concurrency, checkpoint)
+            except Exception as e:
+                error = e
@@ -0,0 +1,155 @@
+"""
+Checkpoints of partially fetched repository listings
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Dict, List
+from ..config.settings import CHECKPOINT_DIR, CHECKPOINT_MAX_AGE
+from .repo import RAW_FIELDS
+
+CHECKPOINT_VERSION = 1
+
+# Payload fields the filter and the Repo record need; the rest of each repository is not kept
+PAGE_FIELDS = RAW_FIELDS + ('archived', 'private', 'fork')
+
+class FetchCheckpoint:
+    """
+    Pages of one user's repository listing, saved as they arrive.
+
+    Every page is its own file next to ``meta.json``, which holds the
+    pagination state (the REST last page or the GraphQL cursor), so saving a
+    page costs one small write however far the fetch got. A checkpoint older
+    than ``max_age`` is started over rather than resumed, as the listing may
+    have shifted too much in the meantime, and so is one saved for another
+    ``query``.
+
+    Args:
+        path (str): Directory of this checkpoint
+        max_age (float): Seconds an interrupted fetch stays resumable
+        query (str): Request identifying the listing, e.g. its first page URL
+    """
+
+    def __init__(self, path: str, max_age: float = CHECKPOINT_MAX_AGE, query: str = ''):
+        self.path = path
+        self.max_age = max_age
+        self.query = query
+        self.meta: Dict = {}
+        self._lock = threading.Lock()
+
+    def _write(self, name: str, data: Dict) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, name)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def resume(self) -> Dict[int, List[Dict]]:
+        """
+        Load the pages of an interrupted fetch, or start a new checkpoint.
+
+        Returns:
+            Dict[int, List[Dict]]: Saved repositories by page number, empty when starting over
+        """
+        try:
+            with open(os.path.join(self.path, 'meta.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+        if (meta.get('version') != CHECKPOINT_VERSION or meta.get('query', '') != self.query or
+                time.time() - meta.get('started', 0) > self.max_age):
+            self.clear()
+            self.meta = {'version': CHECKPOINT_VERSION, 'started': time.time(), 'query': self.query}
+            self._write('meta.json', self.meta)
+            return {}
+
+        self.meta = meta
+        pages = {}
+        for name in os.listdir(self.path):
+            if not (name.startswith('page-') and name.endswith('.json')):
+                continue
+            try:
+                with open(os.path.join(self.path, name), 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+            except (OSError, ValueError):
+                continue
+            pages[saved['page']] = saved['repos']
+        return pages
+
+    def update(self, **state) -> None:
+        """Record pagination state, e.g. ``last_page`` or ``cursor``."""
+        with self._lock:
+            self.meta.update(state)
+            self._write('meta.json', self.meta)
+
+    def add_page(self, page: int, batch: List[Dict]) -> None:
+        """
+        Save a fetched page.
+
+        Args:
+            page (int): Page number
+            batch (List[Dict]): Repositories on the page as returned by the API
+        """
+        repos = [{field: repo.get(field) for field in PAGE_FIELDS} for repo in batch]
+        self._write(f"page-{page:05d}.json", {'page': page, 'repos': repos})
+
+    def clear(self) -> None:
+        """Delete the checkpoint once the fetch completed."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+class CheckpointStore:
+    """
+    Fetch checkpoints per listing under ``<checkpoint_dir>/<username>-<backend>-<query digest>/``.
+
+    The digest of the listing query keeps fetches of the same owner with
+    different filters, e.g. a user and an organization listing, apart.
+    """
+
+    def __init__(self, checkpoint_dir: str = CHECKPOINT_DIR, max_age: float = CHECKPOINT_MAX_AGE):
+        self.checkpoint_dir = checkpoint_dir
+        self.max_age = max_age
+
+    def open(self, username: str, backend: str, query: str) -> FetchCheckpoint:
+        """
+        Get the checkpoint of a listing fetched through a backend.
+
+        Args:
+            username (str): Owner whose repositories are listed
+            backend (str): Fetch backend name
+            query (str): Request identifying the listing, see the backends' ``listing_query``
+
+        Returns:
+            FetchCheckpoint: Checkpoint of that listing
+        """
+        digest = hashlib.sha256(query.encode('utf-8')).hexdigest()[:12]
+        path = os.path.join(self.checkpoint_dir, f"{username}-{backend}-{digest}")
+        return FetchCheckpoint(path, self.max_age, query)
+
+def merge_pages(pages: Dict[int, List[Dict]], last_page: int) -> List[Dict]:
+    """
+    Join saved and fetched pages in page order.
+
+    A repository can move to another page between an interrupted run and the
+    one resuming it; only its first occurrence is kept.
+
+    Args:
+        pages (Dict[int, List[Dict]]): Repositories by page number
+        last_page (int): Number of the last page of the listing
+
+    Returns:
+        List[Dict]: Repositories in page order
+    """
+    repos = []
+    seen = set()
+    for page in sorted(pages):
+        if page > last_page:
+            continue
+        for repo in pages[page]:
+            if repo['full_name'] not in seen:
+                seen.add(repo['full_name'])
+                repos.append(repo)
+    return repos
@@ -0,0 +1,262 @@
+"""
+Per-repository enrichment: language breakdown and README excerpt
+"""
+import asyncio
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from ..config.settings import GITHUB_API_URL, ENRICHMENT_FILE, ENRICH_WORKERS, README_EXCERPT_LENGTH
+from .instrumentation import metrics
+from .repo import Repo, replace_raw
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+    from .rate_limit import RateLimitHandler
+
+LANGUAGES_URL = GITHUB_API_URL + "/repos/{full_name}/languages"
+README_URL = GITHUB_API_URL + "/repos/{full_name}/readme"
+# Ask for the file itself instead of base64 wrapped in JSON
+README_HEADERS = {'Accept': 'application/vnd.github.raw+json'}
+
+ENRICHMENT_VERSION = 1
+
+_IMAGE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+_LINK = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_EMPHASIS = re.compile(r'\*\*|__|\*|`|~~')
+_SPACES = re.compile(r'\s+')
+
+def parse_languages(payload: Dict[str, int]) -> Tuple[str, ...]:
+    """
+    Order the languages of a ``/languages`` response by bytes of code.
+
+    Args:
+        payload (Dict[str, int]): Bytes of code per language
+
+    Returns:
+        Tuple[str, ...]: Language names, most used first
+    """
+    return tuple(name for name, _ in sorted(payload.items(), key=lambda item: -item[1]))
+
+def readme_excerpt(text: str, length: int = README_EXCERPT_LENGTH) -> str:
+    """
+    Extract the first prose paragraph of a Markdown README as plain text.
+
+    Headings, badges, HTML blocks, tables and code blocks are skipped, links
+    are reduced to their text and the result is cut at a word boundary.
+
+    Args:
+        text (str): README content
+        length (int): Maximum number of characters kept
+
+    Returns:
+        str: Excerpt, empty if the README has no prose
+    """
+    paragraph = []
+    in_code = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith(('```', '~~~')):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        if stripped and set(stripped) <= set('=-'):
+            # Underline of a setext heading (drop the heading), or a horizontal rule
+            if len(paragraph) == 1:
+                paragraph = []
+            elif paragraph:
+                break
+            continue
+        if not stripped or stripped.startswith(('#', '<', '![', '[![', '|')):
+            if paragraph:
+                break
+            continue
+        paragraph.append(stripped)
+
+    excerpt = ' '.join(paragraph)
+    excerpt = _LINK.sub(r'\1', _IMAGE.sub('', excerpt))
+    excerpt = _SPACES.sub(' ', _EMPHASIS.sub('', excerpt)).strip()
+    if len(excerpt) > length:
+        excerpt = excerpt[:length].rsplit(' ', 1)[0].rstrip('.,;:') + '…'
+    return excerpt
+
+class EnrichmentCache:
+    """
+    Languages and README excerpts per repository, persisted as JSON.
+
+    An entry stays valid as long as the repository's ``pushed_at`` is
+    unchanged, so a run only refetches repositories pushed since the last one.
+    """
+
+    def __init__(self, path: str = ENRICHMENT_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self._entries = data.get('repos', {}) if data.get('version') == ENRICHMENT_VERSION else {}
+
+    def get(self, repo: Repo, allow_stale: bool = False) -> Optional[Tuple[Tuple[str, ...], str]]:
+        """
+        Get the cached languages and README excerpt of a repository.
+
+        Args:
+            repo (Repo): Repository record
+            allow_stale (bool): Also return an entry recorded for an older push
+
+        Returns:
+            Optional[Tuple[Tuple[str, ...], str]]: Languages and excerpt, None if not cached
+        """
+        entry = self._entries.get(repo.full_name)
+        if entry is None or not (allow_stale or (repo.pushed_at and entry[0] == repo.pushed_at)):
+            return None
+        return tuple(entry[1]), entry[2]
+
+    def set(self, repo: Repo, languages: Tuple[str, ...], readme: str) -> None:
+        """Record the languages and README excerpt fetched for a repository's current push."""
+        with self._lock:
+            self._entries[repo.full_name] = [repo.pushed_at, list(languages), readme]
+
+    def save(self) -> None:
+        """Write the cache to disk."""
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': ENRICHMENT_VERSION, 'repos': self._entries}, f,
+                          ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+
+def fetch_enrichment(rate_limiter: 'RateLimitHandler', repo: Repo) -> Tuple[Tuple[str, ...], str]:
+    """
+    Fetch the languages and README excerpt of a repository.
+
+    Args:
+        rate_limiter (RateLimitHandler): Handler to send the requests through
+        repo (Repo): Repository record
+
+    Returns:
+        Tuple[Tuple[str, ...], str]: Languages, most used first, and README excerpt
+    """
+    languages = rate_limiter.make_request(LANGUAGES_URL.format(full_name=repo.full_name)).json()
+    # A repository without README answers 404, which is not worth retrying
+    readme = rate_limiter.make_request(README_URL.format(full_name=repo.full_name),
+                                       headers=README_HEADERS, ok_statuses=(404,))
+    return parse_languages(languages), readme_excerpt(readme.text) if readme.status_code == 200 else ''
+
+def _plan(repos: List[Repo], cache: EnrichmentCache) -> Tuple[List[Repo], List[int]]:
+    """Apply the cached entries and list the indexes of repositories that need fetching."""
+    enriched = list(repos)
+    stale = []
+    for index, repo in enumerate(repos):
+        cached = cache.get(repo)
+        if cached is None:
+            stale.append(index)
+        else:
+            enriched[index] = replace_raw(repo, languages=cached[0], readme=cached[1])
+    print(f"Enriching {len(stale)} of {len(repos)} repositories, {len(repos) - len(stale)} unchanged since the last run")
+    return enriched, stale
+
+def _finish(enriched: List[Repo], stale: List[int], results: List[Optional[Tuple[Tuple[str, ...], str]]],
+            cache: EnrichmentCache) -> None:
+    """Store the fetched results, fall back to the last known entry for failed ones and save the cache."""
+    failures = 0
+    for index, result in zip(stale, results):
+        repo = enriched[index]
+        if result is None:
+            failures += 1
+            result = cache.get(repo, allow_stale=True)
+        else:
+            cache.set(repo, *result)
+        if result is not None:
+            enriched[index] = replace_raw(repo, languages=result[0], readme=result[1])
+    if failures:
+        print(f"Enrichment incomplete: {failures} repositories keep their last known languages and README")
+    cache.save()
+
+def enrich_repositories(repos: List[Repo], rate_limiter: 'RateLimitHandler', cache: EnrichmentCache,
+                        workers: int = ENRICH_WORKERS) -> List[Repo]:
+    """
+    Add languages and README excerpts to repositories, fetching only those pushed since they were cached.
+
+    Requests run on a pool of ``workers`` threads sharing the handler's rate
+    budget. After the first failure, usually an exhausted rate limit, the
+    remaining repositories are not requested; they keep their last known
+    values and are retried on the next run.
+
+    Args:
+        repos (List[Repo]): Repositories in render order
+        rate_limiter (RateLimitHandler): Handler to send requests through
+        cache (EnrichmentCache): Entries from earlier runs, updated and saved
+        workers (int): Maximum number of repositories enriched at once
+
+    Returns:
+        List[Repo]: Enriched repositories in the same order
+    """
+    with metrics.span('enrich', repos=len(repos)):
+        enriched, stale = _plan(repos, cache)
+        failed = threading.Event()
+
+        def fetch(index: int) -> Optional[Tuple[Tuple[str, ...], str]]:
+            if failed.is_set():
+                return None
+            try:
+                return fetch_enrichment(rate_limiter, repos[index])
+            except Exception as e:
+                if not failed.is_set():
+                    failed.set()
+                    print(f"Error enriching {repos[index].full_name}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            results = list(executor.map(fetch, stale))
+        _finish(enriched, stale, results, cache)
+    return enriched
+
+async def enrich_repositories_async(repos: List[Repo], client: 'AsyncClient', cache: EnrichmentCache,
+                                    workers: int = ENRICH_WORKERS) -> List[Repo]:
+    """
+    Asynchronous counterpart of enrich_repositories sending requests through an AsyncClient.
+
+    Args:
+        repos (List[Repo]): Repositories in render order
+        client (AsyncClient): Client to send requests through
+        cache (EnrichmentCache): Entries from earlier runs, updated and saved
+        workers (int): Maximum number of repositories enriched at once
+
+    Returns:
+        List[Repo]: Enriched repositories in the same order
+    """
+    with metrics.span('enrich', repos=len(repos), engine='asyncio'):
+        enriched, stale = _plan(repos, cache)
+        limit = asyncio.Semaphore(max(workers, 1))
+        failed = False
+
+        async def fetch(index: int) -> Optional[Tuple[Tuple[str, ...], str]]:
+            nonlocal failed
+            repo = repos[index]
+            async with limit:
+                if failed:
+                    return None
+                try:
+                    languages = await client.request(LANGUAGES_URL.format(full_name=repo.full_name))
+                    readme = await client.request(README_URL.format(full_name=repo.full_name),
+                                                  headers=README_HEADERS, ok_statuses=(404,))
+                except Exception as e:
+                    if not failed:
+                        failed = True
+                        print(f"Error enriching {repo.full_name}: {str(e)}")
+                    return None
+            return (parse_languages(languages.json()),
+                    readme_excerpt(readme.text) if readme.status_code == 200 else '')
+
+        results = await asyncio.gather(*(fetch(index) for index in stale))
+        _finish(enriched, stale, results, cache)
+    return enriched
@@ -0,0 +1,78 @@
+"""
+Change detection through the GitHub events API
+"""
+from typing import Dict, List
+from ..config.settings import GITHUB_API_URL
+from .owners import Owner
+from .rate_limit import RateLimitHandler
+
+EVENTS_PAGE_SIZE = 30
+USER_EVENTS_URL = GITHUB_API_URL + "/users/{login}/events?per_page=" + str(EVENTS_PAGE_SIZE)
+ORG_EVENTS_URL = GITHUB_API_URL + "/orgs/{login}/events?per_page=" + str(EVENTS_PAGE_SIZE)
+
+# Event types that can change what the page shows: pushes reorder it, creating,
+# deleting or publishing repositories changes the listing. A WatchEvent in a
+# user's feed is that user starring someone else's repository, so it is left
+# out; star counts catch up on the periodic full refresh.
+REFRESH_EVENTS = frozenset({'PushEvent', 'CreateEvent', 'DeleteEvent', 'PublicEvent'})
+
+def events_url(owner: Owner) -> str:
+    """Get the URL of the newest events of a user or organization."""
+    url = ORG_EVENTS_URL if owner.kind == 'org' else USER_EVENTS_URL
+    return url.format(login=owner.login)
+
+class EventPoller:
+    """
+    Tells whether owners had activity affecting their page since the last poll.
+
+    Each poll is one request per owner for the newest page of its event feed.
+    With the handler's HTTP cache the request is conditional, so a feed
+    without new events answers 304, which does not count against the rate
+    limit. Only events newer than the last seen id on repositories of a
+    watched owner count; a user's feed also lists what they did elsewhere.
+    The first poll just records where the feeds are.
+
+    Args:
+        rate_limiter (RateLimitHandler): Handler to send requests through
+        owners (List[Owner]): Users and organizations to watch
+    """
+
+    def __init__(self, rate_limiter: RateLimitHandler, owners: List[Owner]):
+        self.rate_limiter = rate_limiter
+        self.owners = list(owners)
+        self._logins = {owner.login.lower() for owner in self.owners}
+        self.last_seen: Dict[str, int] = {}
+        # Minimum seconds between polls the API asks for through X-Poll-Interval
+        self.poll_interval = 0
+
+    def _is_watched(self, event: Dict) -> bool:
+        """Whether an event concerns a repository of one of the watched owners."""
+        repo_owner = event.get('repo', {}).get('name', '').split('/', 1)[0]
+        return repo_owner.lower() in self._logins
+
+    def poll(self) -> List[str]:
+        """
+        Fetch the newest events of every owner.
+
+        Returns:
+            List[str]: Descriptions of the new events worth a refresh, empty if there are none
+        """
+        changes = []
+        for owner in self.owners:
+            response = self.rate_limiter.make_request(events_url(owner))
+            self.poll_interval = max(self.poll_interval, int(response.headers.get('X-Poll-Interval', 0) or 0))
+            events = response.json()
+            ids = [int(event['id']) for event in events]
+            last = self.last_seen.get(owner.login)
+            self.last_seen[owner.login] = max(ids + [last or 0])
+            if last is None:
+                continue
+            changes.extend(
+                f"{event['type']} {event.get('repo', {}).get('name', owner.login)}"
+                for event, event_id in zip(events, ids)
+                if event_id > last and event['type'] in REFRESH_EVENTS and self._is_watched(event)
+            )
+            # A full page of unseen events may hide older relevant ones
+            if len(ids) >= EVENTS_PAGE_SIZE and min(ids) > last:
+                changes.append(f"more than {EVENTS_PAGE_SIZE} new events for {owner}")
+        return changes
@@ -1,52 +1,334 @@
 """
 GitHub API utility for fetching repository data
 """
-from typing import List, Dict
-from ..config.settings import GITHUB_USERNAME, EXCLUDE_REPOS
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Generator, List, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlparse, parse_qs
+import requests
+from ..config.settings import (
+    GITHUB_API_URL, GITHUB_USERNAME, EXCLUDE_REPOS, FETCH_CONCURRENCY, FETCH_BACKEND
+)
+from .checkpoint import CheckpointStore, FetchCheckpoint, merge_pages
+from .graphql_api import fetch_graphql_repositories, listing_query as graphql_listing_query
+from .instrumentation import metrics
+from .owners import Owner, parse_owners
 from .rate_limit import RateLimitHandler
+from .repo import Repo, repo_from_api
 
-def get_all_repositories() -> List[Dict]:
+# Users can only be listed by ownership; organizations can leave their forks out server-side
+REPOS_URL = GITHUB_API_URL + "/users/{login}/repos?type=owner&page={page}&per_page=100"
+ORG_REPOS_URL = GITHUB_API_URL + "/orgs/{login}/repos?type=sources&page={page}&per_page=100"
+
+def filter_repositories(batch: List[Dict]) -> List[Dict]:
     """
-    Fetch all public repositories for the configured GitHub user.
-    
+    Drop archived, private, forked and excluded repositories.
+
+    The backends already ask the API to leave out what it can filter; this
+    catches the rest, e.g. forks and archived repositories in REST listings.
+
+    Args:
+        batch (List[Dict]): Repository data as returned by the API
+
     Returns:
-        List[Dict]: List of repository data
+        List[Dict]: Repositories to show
     """
-    repos = []
-    page = 1
-    rate_limiter = RateLimitHandler()
-    
-    while True:
-        print(f"\nFetching page {page}...")
-        url = f"https://api.github.com/users/{GITHUB_USERNAME}/repos?page={page}&per_page=100"
-        
+    return [
+        repo for repo in batch
+        if not repo['archived'] and
+           not repo['private'] and
+           not repo['fork'] and
+           repo['full_name'] not in EXCLUDE_REPOS
+    ]
+
+def get_last_page(response: requests.Response) -> int:
+    """
+    Read the last page number from the Link header of a paginated response.
+
+    Args:
+        response: Response for the first page
+
+    Returns:
+        int: Last page number, 1 if the response is not paginated
+    """
+    last = response.links.get('last')
+    if not last:
+        return 1
+    page = parse_qs(urlparse(last['url']).query).get('page')
+    return int(page[0]) if page else 1
+
+def repos_url(owner: Owner, page: int) -> str:
+    """
+    Get the REST URL of one page of an owner's repositories.
+
+    Organizations are listed with ``type=sources``, which leaves forks out on
+    the server; the users endpoint has no such filter.
+
+    Args:
+        owner (Owner): User or organization whose repositories are listed
+        page (int): Page number
+
+    Returns:
+        str: Page URL
+    """
+    url = ORG_REPOS_URL if owner.kind == 'org' else REPOS_URL
+    return url.format(login=owner.login, page=page)
+
+def listing_query(owner: Owner) -> str:
+    """
+    Identify an owner's REST listing for its fetch checkpoint.
+
+    Args:
+        owner (Owner): User or organization whose repositories are listed
+
+    Returns:
+        str: URL of the first page, which carries the endpoint and its filters
+    """
+    return repos_url(owner, 1)
+
+class RestListing:
+    """
+    Sans-I/O state of one owner's REST listing, shared by the blocking and asyncio drivers.
+
+    It resumes saved pages from the checkpoint, tells which pages are still
+    to be fetched once the first page revealed the last one, saves pages as
+    they arrive and merges them; the drivers only send the requests.
+
+    Args:
+        owner (Owner): User or organization whose repositories are listed
+        checkpoint (Optional[FetchCheckpoint]): Checkpoint to resume from and save pages to
+    """
+
+    def __init__(self, owner: Owner, checkpoint: Optional[FetchCheckpoint] = None):
+        self.owner = owner
+        self.checkpoint = checkpoint
+        self.pages = checkpoint.resume() if checkpoint is not None else {}
+        self.last_page = checkpoint.meta.get('last_page') if checkpoint is not None else None
+        if not self.needs_first_page():
+            print(f"\nResuming {owner} from checkpoint: {len(self.pages)} of {self.last_page} pages already fetched")
+
+    def needs_first_page(self) -> bool:
+        """Whether the first page, which tells the number of pages, still has to be fetched."""
+        return not (1 in self.pages and self.last_page)
+
+    def add_first_page(self, response: requests.Response) -> None:
+        """
+        Record the first page and the last page number from its Link header.
+
+        Args:
+            response: Response for ``repos_url(owner, 1)``
+        """
+        self.last_page = get_last_page(response)
+        self.add_page(1, response.json())
+        print(f"Page 1: {len(self.pages[1])} repositories")
+        if self.checkpoint is not None:
+            self.checkpoint.update(last_page=self.last_page)
+
+    def remaining(self) -> List[int]:
+        """Get the numbers of the pages still to be fetched."""
+        return [page for page in range(2, self.last_page + 1) if page not in self.pages]
+
+    def add_page(self, page: int, batch: List[Dict]) -> None:
+        """
+        Record a fetched page and save it to the checkpoint; safe to call from several threads.
+
+        Args:
+            page (int): Page number
+            batch (List[Dict]): Repositories on the page
+        """
+        self.pages[page] = batch
+        if self.checkpoint is not None:
+            self.checkpoint.add_page(page, batch)
+
+    def repositories(self) -> List[Dict]:
+        """Get the repositories of every page in page order."""
+        return merge_pages(self.pages, self.last_page)
+
+def fetch_page(rate_limiter: RateLimitHandler, owner: Owner, page: int) -> List[Dict]:
+    """
+    Fetch a single page of repositories.
+
+    Args:
+        rate_limiter (RateLimitHandler): Handler to send the request through
+        owner (Owner): User or organization whose repositories are listed
+        page (int): Page number
+
+    Returns:
+        List[Dict]: Repositories on that page
+    """
+    print(f"\nFetching page {page} for {owner}...")
+    batch = rate_limiter.make_request(repos_url(owner, page)).json()
+    print(f"Page {page}: {len(batch)} repositories")
+    return batch
+
+def fetch_rest_repositories(rate_limiter: RateLimitHandler, owner: Owner,
+                            concurrency: int = FETCH_CONCURRENCY,
+                            checkpoint: Optional[FetchCheckpoint] = None) -> List[Dict]:
+    """
+    Fetch all repositories of a user or organization through the REST API.
+
+    The first page is fetched on its own; its ``Link: rel="last"`` header tells
+    how many pages remain, and those are fetched on a pool of ``concurrency``
+    threads. With ``concurrency`` of 1 pages are fetched one by one.
+
+    With a ``checkpoint`` every page is saved as it arrives, and pages an
+    interrupted run already saved are not fetched again. When a page fails,
+    pages already in flight still complete and are saved.
+
+    Args:
+        rate_limiter (RateLimitHandler): Handler to send requests through
+        owner (Owner): User or organization whose repositories are listed
+        concurrency (int): Maximum number of pages fetched at once
+        checkpoint (Optional[FetchCheckpoint]): Checkpoint to resume from and save pages to
+
+    Returns:
+        List[Dict]: Unfiltered repository data in page order
+    """
+    listing = RestListing(owner, checkpoint)
+    if listing.needs_first_page():
+        print(f"\nFetching page 1 for {owner}...")
+        listing.add_first_page(rate_limiter.make_request(repos_url(owner, 1)))
+
+    def fetch(page: int) -> None:
+        listing.add_page(page, fetch_page(rate_limiter, owner, page))
+
+    remaining = listing.remaining()
+    if concurrency > 1 and len(remaining) > 1:
+        print(f"Fetching {len(remaining)} pages with {concurrency} workers")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(fetch, page) for page in remaining]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # Pages not started yet are left for the next run
+                for future in futures:
+                    future.cancel()
+                raise
+    else:
+        for page in remaining:
+            fetch(page)
+    return listing.repositories()
+
+# Fetch backends by name; each returns unfiltered repositories in REST shape
+FETCH_BACKENDS = {
+    'rest': fetch_rest_repositories,
+    'graphql': fetch_graphql_repositories,
+}
+
+# Listing identity per backend, keying the fetch checkpoints
+LISTING_QUERIES = {
+    'rest': listing_query,
+    'graphql': graphql_listing_query,
+}
+
+def open_checkpoint(checkpoints: Optional[CheckpointStore], owner: Owner, backend: str) -> Optional[FetchCheckpoint]:
+    """Open the checkpoint of an owner's listing through a backend, None without a store."""
+    if checkpoints is None:
+        return None
+    return checkpoints.open(owner.login, backend, LISTING_QUERIES[backend](owner))
+
+def fetch_steps(username: str, backend: str, checkpoints: Optional[CheckpointStore] = None,
+                sources: Optional[Sequence[str]] = None
+                ) -> Generator[Tuple[Owner, Optional[FetchCheckpoint]], List[Dict], List[Repo]]:
+    """
+    Sans-I/O steps of fetching a page's repositories, shared by the blocking and asyncio drivers.
+
+    Yields every owner in ``sources`` with the checkpoint of its listing, and
+    expects the owner's unfiltered repositories to be sent back. An error
+    fetching an owner is thrown in, reported and re-raised. Checkpoints are
+    only cleared once every owner is fetched, so a retry resumes all of them.
+
+    Args:
+        username (str): GitHub user the page belongs to
+        backend (str): Name of the fetch backend in FETCH_BACKENDS
+        checkpoints (Optional[CheckpointStore]): Store of interrupted fetches
+        sources (Optional[Sequence[str]]): Owner specs, usernames or ``org:<name>``; defaults to ``username``
+
+    Returns:
+        List[Repo]: Repositories of all owners, most recently pushed first
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend not in FETCH_BACKENDS:
+        raise ValueError(f"Unknown fetch backend '{backend}', expected one of {sorted(FETCH_BACKENDS)}")
+
+    batch = []
+    fetched = []
+    for owner in parse_owners(sources or username):
+        checkpoint = open_checkpoint(checkpoints, owner, backend)
         try:
-            response = rate_limiter.make_request(url)
-            batch = response.json()
-            
-            if not batch:
-                print("No more repositories found")
-                break
-
-            print(f"Found {len(batch)} repositories in this batch")
-            valid_repos = [
-                repo for repo in batch
-                if not repo['archived'] and 
-                   not repo['private'] and 
-                   not repo['fork'] and
-                   repo['full_name'] not in EXCLUDE_REPOS
-            ]
-            print(f"After filtering: {len(valid_repos)} valid repositories")
-            repos.extend(valid_repos)
-            page += 1
-            
+            batch.extend((yield owner, checkpoint))
         except Exception as e:
-            print(f"Error fetching repositories: {str(e)}")
+            print(f"Error fetching repositories of {owner}: {str(e)}")
             raise
+        fetched.append(checkpoint)
+    for checkpoint in fetched:
+        if checkpoint is not None:
+            checkpoint.clear()
+    return prepare_repositories(batch, username)
+
+def get_all_repositories(rate_limiter: Optional[RateLimitHandler] = None,
+                         concurrency: int = FETCH_CONCURRENCY,
+                         backend: str = FETCH_BACKEND,
+                         username: str = GITHUB_USERNAME,
+                         checkpoints: Optional[CheckpointStore] = None,
+                         sources: Optional[Sequence[str]] = None) -> List[Repo]:
+    """
+    Fetch all public repositories for a page, the configured user's by default.
+
+    The page lists the repositories of every owner in ``sources``, fetched one
+    owner after another and sorted together. The API payload is reduced to
+    Repo records right after filtering, so only the fields the generator uses
+    outlive this call. With ``checkpoints`` a failed fetch keeps the pages it
+    got, and the next call resumes from them.
+
+    Args:
+        rate_limiter (Optional[RateLimitHandler]): Handler to send requests through
+        concurrency (int): Maximum number of pages fetched at once
+        backend (str): Name of the fetch backend in FETCH_BACKENDS
+        username (str): GitHub user the page belongs to
+        checkpoints (Optional[CheckpointStore]): Store of interrupted fetches
+        sources (Optional[Sequence[str]]): Owner specs, usernames or ``org:<name>``; defaults to ``username``
+
+    Returns:
+        List[Repo]: Repositories, most recently pushed first
+    """
+    if rate_limiter is None:
+        rate_limiter = RateLimitHandler()
 
-    repos.sort(key=lambda r: r.get('pushed_at', ''), reverse=True)
+    steps = fetch_steps(username, backend, checkpoints, sources)
+    batch, error = None, None
+    while True:
+        try:
+            owner, checkpoint = steps.send(batch) if error is None else steps.throw(error)
+        except StopIteration as done:
+            return done.value
+        batch, error = None, None
+        try:
+            with metrics.span('fetch', username=owner.login, owner=owner.kind, backend=backend):
+                batch = FETCH_BACKENDS[backend](rate_limiter, owner, concurrency, checkpoint)
+        except Exception as e:
+            error = e
+
+def prepare_repositories(batch: List[Dict], username: str) -> List[Repo]:
+    """
+    Filter and sort the raw repositories of a fetch backend and build their Repo records.
+
+    Args:
+        batch (List[Dict]): Unfiltered repositories in REST shape
+        username (str): GitHub user the repositories belong to
+
+    Returns:
+        List[Repo]: Repositories, most recently pushed first
+    """
+    with metrics.span('filter', username=username):
+        repos = filter_repositories(batch)
+        repos.sort(key=lambda r: r.get('pushed_at', ''), reverse=True)
+    print(f"After filtering: {len(repos)} of {len(batch)} repositories")
     debug_print_repos(repos)
-    return repos
+    with metrics.span('model', username=username):
+        return [repo_from_api(repo) for repo in repos]
 
 def debug_print_repos(repos: List[Dict]) -> None:
     """
@@ -57,4 +339,4 @@ def debug_print_repos(repos: List[Dict]) -> None:
     """
     print("\nFetched Repositories:")
     for repo in repos:
-        print(f" - {repo['name']} (Fork: {repo['fork']}, Archived: {repo['archived']}, Private: {repo['private']})") 
\ No newline at end of file
+        print(f" - {repo['name']} (Fork: {repo['fork']}, Archived: {repo['archived']}, Private: {repo['private']})")
@@ -0,0 +1,218 @@
+"""
+GitHub GraphQL API backend for fetching repository data
+"""
+import json
+import os
+from typing import List, Dict, Optional, Tuple
+from ..config.settings import GITHUB_API_URL
+from .checkpoint import FetchCheckpoint, merge_pages
+from .owners import Owner
+from .rate_limit import RateLimitHandler
+
+GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+# Only the fields the page renders plus the ones needed for filtering. repositoryOwner
+# resolves users and organizations alike, and forks, archived and private
+# repositories are left out by the server instead of being downloaded.
+REPOSITORIES_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER,
+                 isFork: false, isArchived: false, privacy: PUBLIC) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        nameWithOwner
+        description
+        homepageUrl
+        url
+        pushedAt
+        stargazerCount
+        isArchived
+        isFork
+        isPrivate
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+      }
+    }
+  }
+}
+"""
+
+def node_to_repo(node: Dict) -> Dict:
+    """
+    Convert a GraphQL repository node to the REST repository shape.
+
+    Args:
+        node (Dict): Repository node from the GraphQL response
+
+    Returns:
+        Dict: Repository data with the REST field names used by the generator
+    """
+    return {
+        'name': node['name'],
+        'full_name': node['nameWithOwner'],
+        'description': node['description'],
+        'homepage': node['homepageUrl'],
+        'html_url': node['url'],
+        'pushed_at': node['pushedAt'],
+        'stargazers_count': node['stargazerCount'],
+        'topics': [topic['topic']['name'] for topic in node['repositoryTopics']['nodes']],
+        'archived': node['isArchived'],
+        'fork': node['isFork'],
+        'private': node['isPrivate'],
+    }
+
+def page_query(owner: Owner, cursor: Optional[str]) -> Dict:
+    """
+    Build the request body for one page of an owner's repositories.
+
+    Args:
+        owner (Owner): User or organization whose repositories are listed
+        cursor (Optional[str]): End cursor of the previous page, None for the first
+
+    Returns:
+        Dict: JSON body of the GraphQL request
+    """
+    return {'query': REPOSITORIES_QUERY, 'variables': {'login': owner.login, 'cursor': cursor}}
+
+def listing_query(owner: Owner) -> str:
+    """
+    Identify an owner's GraphQL listing for its fetch checkpoint.
+
+    Args:
+        owner (Owner): User or organization whose repositories are listed
+
+    Returns:
+        str: Endpoint and body of the first page request
+    """
+    return f"{GRAPHQL_URL} {json.dumps(page_query(owner, None), sort_keys=True)}"
+
+def parse_page(payload: Dict) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Extract the repositories and the next cursor from a GraphQL response.
+
+    Args:
+        payload (Dict): Decoded response body
+
+    Returns:
+        Tuple[List[Dict], Optional[str]]: Repositories in REST shape and the cursor of the next page, None on the last
+
+    Raises:
+        Exception: If the API returned errors
+    """
+    if payload.get('errors'):
+        messages = '; '.join(error.get('message', str(error)) for error in payload['errors'])
+        raise Exception(f"GraphQL query failed: {messages}")
+
+    owner = payload['data']['repositoryOwner']
+    if owner is None:
+        raise Exception("GraphQL query failed: repository owner not found")
+    connection = owner['repositories']
+    batch = [node_to_repo(node) for node in connection['nodes']]
+    cursor = connection['pageInfo']['endCursor'] if connection['pageInfo']['hasNextPage'] else None
+    return batch, cursor
+
+def resume_cursor(checkpoint: Optional[FetchCheckpoint]) -> Tuple[Dict[int, List[Dict]], Optional[str], int]:
+    """
+    Get the pages, cursor and next page number to continue an interrupted GraphQL fetch from.
+
+    Args:
+        checkpoint (Optional[FetchCheckpoint]): Checkpoint of the fetch, None to start from the first page
+
+    Returns:
+        Tuple[Dict[int, List[Dict]], Optional[str], int]: Saved pages, cursor and number of the next page
+    """
+    if checkpoint is None:
+        return {}, None, 1
+    pages = checkpoint.resume()
+    page = checkpoint.meta.get('next_page', 1)
+    if page > 1:
+        print(f"\nResuming from checkpoint: {page - 1} GraphQL pages already fetched")
+    return {number: batch for number, batch in pages.items() if number < page}, checkpoint.meta.get('cursor'), page
+
+class GraphQLListing:
+    """
+    Sans-I/O state of one owner's GraphQL listing, shared by the blocking and asyncio drivers.
+
+    It resumes the cursor from the checkpoint, builds the body of each page
+    request, parses and saves the responses and merges the pages; the
+    drivers only send the requests.
+
+    Args:
+        owner (Owner): User or organization whose repositories are listed
+        checkpoint (Optional[FetchCheckpoint]): Checkpoint to resume from and save pages to
+
+    Raises:
+        Exception: If no token is configured
+    """
+
+    def __init__(self, owner: Owner, checkpoint: Optional[FetchCheckpoint] = None):
+        if not os.getenv('GITHUB_TOKEN'):
+            raise Exception("The GraphQL backend requires the GITHUB_TOKEN environment variable.")
+        self.owner = owner
+        self.checkpoint = checkpoint
+        self.pages, self.cursor, self.page = resume_cursor(checkpoint)
+
+    def next_query(self) -> Optional[Dict]:
+        """
+        Get the request body of the next page.
+
+        Returns:
+            Optional[Dict]: JSON body to POST to GRAPHQL_URL, None once the last page is in
+        """
+        # Only the first page goes out without a cursor; a resumed fetch without one had already finished
+        if self.page > 1 and self.cursor is None:
+            return None
+        print(f"\nFetching GraphQL page {self.page} for {self.owner}...")
+        return page_query(self.owner, self.cursor)
+
+    def add_page(self, payload: Dict) -> None:
+        """
+        Record the response to the last query and save it to the checkpoint.
+
+        Args:
+            payload (Dict): Decoded response body
+
+        Raises:
+            Exception: If the API returned errors
+        """
+        batch, self.cursor = parse_page(payload)
+        self.pages[self.page] = batch
+        print(f"Page {self.page}: {len(batch)} repositories")
+        if self.checkpoint is not None:
+            self.checkpoint.add_page(self.page, batch)
+            self.checkpoint.update(cursor=self.cursor, next_page=self.page + 1)
+        self.page += 1
+
+    def repositories(self) -> List[Dict]:
+        """Get the repositories of every page in page order."""
+        return merge_pages(self.pages, self.page - 1)
+
+def fetch_graphql_repositories(rate_limiter: RateLimitHandler, owner: Owner,
+                               concurrency: int = 1,
+                               checkpoint: Optional[FetchCheckpoint] = None) -> List[Dict]:
+    """
+    Fetch all repositories of a user or organization through the GraphQL API.
+
+    Pages are linked by cursor, so they are always fetched one after another
+    and ``concurrency`` is ignored. With a ``checkpoint`` the cursor is saved
+    after every page, so an interrupted fetch continues after the last one.
+
+    Args:
+        rate_limiter (RateLimitHandler): Handler to send requests through
+        owner (Owner): User or organization whose repositories are listed
+        concurrency (int): Unused, accepted for backend compatibility
+        checkpoint (Optional[FetchCheckpoint]): Checkpoint to resume from and save pages to
+
+    Returns:
+        List[Dict]: Unfiltered repository data in REST shape
+
+    Raises:
+        Exception: If no token is configured or the API returns errors
+    """
+    listing = GraphQLListing(owner, checkpoint)
+    query = listing.next_query()
+    while query is not None:
+        listing.add_page(rate_limiter.make_request(GRAPHQL_URL, method='POST', json=query).json())
+        query = listing.next_query()
+    return listing.repositories()
@@ -0,0 +1,162 @@
+"""
+On-disk HTTP cache for conditional GitHub API requests
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+import requests
+
+class HttpCache:
+    """
+    Persistent cache of response bodies keyed by URL.
+
+    Each entry keeps the ETag / Last-Modified validators so the request can be
+    replayed as a conditional request; a 304 reply is then answered from disk.
+    Entries are evicted least-recently-used first once the total size on disk
+    exceeds ``max_bytes``.
+
+    The size and recency of every entry are read from the directory once, on
+    first use, and tracked in memory afterwards, so storing or replaying a
+    response never rescans the cache.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Entry path -> size on disk, least recently used first; loaded by _entries()
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _entries(self) -> "OrderedDict[str, int]":
+        """Get the LRU index, scanning the directory the first time. Call with the lock held."""
+        if self._index is None:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((path, size) for _, path, size in entries)
+            self._total = sum(self._index.values())
+        return self._index
+
+    def _load(self, url: str) -> Optional[Dict]:
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get('url') == url else None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Get the validator headers to send for a cached URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since headers, empty if not cached
+        """
+        entry = self._load(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """
+        Rebuild a response from the cached entry for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Optional[requests.Response]: Cached response with status 200, None if not cached
+        """
+        entry = self._load(url)
+        if not entry:
+            return None
+        path = self._path(url)
+        with self._lock:
+            index = self._entries()
+            if path in index:
+                index.move_to_end(path)
+        # Touch the entry so the next run's scan sees it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers.update(entry.get('headers', {}))
+        response._content = entry['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.from_cache = True
+        return response
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """
+        Store a successful response if it carries a validator.
+
+        Args:
+            url: Request URL
+            response: Response with status 200
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'headers': {
+                key: value for key, value in response.headers.items()
+                if key.lower() in ('content-type', 'link', 'etag', 'last-modified')
+            },
+            'body': response.text,
+        }
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        size = os.path.getsize(tmp_path)
+        with self._lock:
+            os.replace(tmp_path, path)
+            index = self._entries()
+            self._total += size - index.pop(path, 0)
+            index[path] = size
+            if self._total > self.max_bytes:
+                self._evict(index)
+
+    def _evict(self, index: "OrderedDict[str, int]") -> None:
+        """Remove least-recently-used entries until the cache fits in max_bytes. Call with the lock held."""
+        while self._total > self.max_bytes and index:
+            path, size = index.popitem(last=False)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self._total -= size
@@ -0,0 +1,121 @@
+"""
+Pooled HTTP session with connection timing for GitHub API requests
+"""
+import threading
+import time
+from typing import Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from ..config.settings import HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+
+# (connect, read) seconds applied to every request that does not pass its own timeout
+DEFAULT_TIMEOUT = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+class TransportStats:
+    """
+    Thread-safe counters splitting request time into handshake, wait and transfer.
+
+    Handshake time is spent opening new TCP/TLS connections, wait time runs
+    until the response headers arrive, and transfer time covers reading the body.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        self.handshake_time = 0.0
+        self.wait_time = 0.0
+        self.transfer_time = 0.0
+
+    def record_connect(self, seconds: float) -> None:
+        """Record a newly opened connection."""
+        with self._lock:
+            self.connections += 1
+            self.handshake_time += seconds
+
+    def record_request(self, total: float, until_headers: float) -> None:
+        """
+        Record a completed request.
+
+        Args:
+            total: Wall time of the whole request in seconds
+            until_headers: Time until the response headers were parsed
+        """
+        with self._lock:
+            self.requests += 1
+            self.wait_time += until_headers
+            self.transfer_time += max(total - until_headers, 0.0)
+
+    def summary(self) -> Dict[str, float]:
+        """Get a snapshot of the counters."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'connections': self.connections,
+                'reused_connections': max(self.requests - self.connections, 0),
+                'handshake_time': round(self.handshake_time, 4),
+                # Headers time includes the handshake of requests that opened a connection
+                'wait_time': round(max(self.wait_time - self.handshake_time, 0.0), 4),
+                'transfer_time': round(self.transfer_time, 4),
+            }
+
+def _timed_connection(connection_cls, stats: TransportStats):
+    class TimedConnection(connection_cls):
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                super().connect()
+            finally:
+                stats.record_connect(time.perf_counter() - start)
+    return TimedConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools report handshake time to a TransportStats.
+
+    Requests sent without a timeout get ``timeout``, so a stalled keep-alive
+    connection raises ``requests.Timeout`` instead of blocking its caller forever.
+    """
+
+    def __init__(self, stats: TransportStats, timeout: Tuple[float, float] = DEFAULT_TIMEOUT, **kwargs):
+        # Must be set before HTTPAdapter.__init__ builds the pool manager
+        self.stats = stats
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout: Optional[object] = None, **kwargs):
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type('TimedHTTPConnectionPool', (HTTPConnectionPool,), {
+                'ConnectionCls': _timed_connection(HTTPConnection, self.stats),
+            }),
+            'https': type('TimedHTTPSConnectionPool', (HTTPSConnectionPool,), {
+                'ConnectionCls': _timed_connection(HTTPSConnection, self.stats),
+            }),
+        }
+
+def create_session(pool_size: int, stats: TransportStats, headers: Dict[str, str],
+                   timeout: Tuple[float, float] = DEFAULT_TIMEOUT) -> requests.Session:
+    """
+    Create a keep-alive session with a bounded connection pool.
+
+    Args:
+        pool_size: Maximum number of connections kept open per host
+        stats: Counters to report connection and request timings to
+        headers: Headers sent with every request
+        timeout: Default (connect, read) timeout in seconds
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    adapter = TimedHTTPAdapter(stats, timeout, pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(headers)
+    return session
@@ -0,0 +1,168 @@
+"""
+Lightweight timing instrumentation for the fetch and render pipeline
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+class Instrumentation:
+    """
+    Collects timed spans and HTTP request records while enabled.
+
+    Disabled by default, in which case every call returns straight away, so
+    the hooks can stay in hot paths. The report is a Chrome trace-event
+    document (loadable in chrome://tracing or Perfetto) extended with
+    per-stage and per-request summaries.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._spans: List[Dict] = []
+        self._requests: List[Dict] = []
+
+    def enable(self) -> None:
+        """Start recording, discarding anything recorded before."""
+        with self._lock:
+            self.enabled = True
+            self._origin = time.perf_counter()
+            self._spans = []
+            self._requests = []
+
+    def _add(self, name: str, start: float, duration: float, attrs: Dict) -> None:
+        with self._lock:
+            self._spans.append({'name': name, 'start': start - self._origin, 'duration': duration,
+                                'thread': threading.get_ident(), 'attrs': attrs})
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[Dict]:
+        """
+        Time the enclosed block as a span.
+
+        Args:
+            name (str): Stage name, spans with the same name are summed in the report
+            **attrs: Extra values stored with the span
+
+        Yields:
+            Dict: The span attributes, which the block may add to
+        """
+        if not self.enabled:
+            yield attrs
+            return
+        start = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            self._add(name, start, time.perf_counter() - start, attrs)
+
+    def add_span(self, name: str, duration: float, **attrs) -> None:
+        """
+        Record a span measured by the caller that ended just now.
+
+        Args:
+            name (str): Stage name
+            duration (float): Span length in seconds
+            **attrs: Extra values stored with the span
+        """
+        if self.enabled and duration > 0:
+            self._add(name, time.perf_counter() - duration, duration, attrs)
+
+    def record_request(self, method: str, url: str, status: int, latency: float, size: int,
+                       retries: int, sleep: float, cached: bool) -> None:
+        """
+        Record one logical HTTP request, including its retries.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            status (int): Final status code, 0 if no response was received
+            latency (float): Seconds spent waiting on the network over all attempts
+            size (int): Bytes of the final response body as received
+            retries (int): Attempts made after the first one
+            sleep (float): Seconds spent sleeping for rate limits and backoff
+            cached (bool): Whether the body was served from the HTTP cache after a 304
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._requests.append({'method': method, 'url': url, 'status': status,
+                                   'latency': round(latency, 6), 'bytes': size, 'retries': retries,
+                                   'sleep': round(sleep, 6), 'cached': cached})
+
+    def report(self) -> Dict:
+        """
+        Build the report of everything recorded since enable().
+
+        Returns:
+            Dict: ``total_time``, ``stages``, ``requests`` and Chrome ``traceEvents``
+        """
+        with self._lock:
+            spans = list(self._spans)
+            requests = list(self._requests)
+            total = time.perf_counter() - self._origin
+
+        stages = {}
+        for span in spans:
+            stage = stages.setdefault(span['name'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            stage['count'] += 1
+            stage['total'] += span['duration']
+            stage['max'] = max(stage['max'], span['duration'])
+        for stage in stages.values():
+            stage['total'] = round(stage['total'], 6)
+            stage['max'] = round(stage['max'], 6)
+
+        by_status = {}
+        for request in requests:
+            by_status[str(request['status'])] = by_status.get(str(request['status']), 0) + 1
+
+        return {
+            'total_time': round(total, 6),
+            'stages': stages,
+            'requests': {
+                'count': len(requests),
+                'bytes': sum(request['bytes'] for request in requests),
+                'latency': round(sum(request['latency'] for request in requests), 6),
+                'retries': sum(request['retries'] for request in requests),
+                'sleep': round(sum(request['sleep'] for request in requests), 6),
+                'cached': sum(1 for request in requests if request['cached']),
+                'by_status': by_status,
+                'items': requests,
+            },
+            'traceEvents': [
+                {'name': span['name'], 'ph': 'X', 'pid': os.getpid(), 'tid': span['thread'],
+                 'ts': round(span['start'] * 1e6), 'dur': round(span['duration'] * 1e6), 'args': span['attrs']}
+                for span in spans
+            ],
+        }
+
+    def write_report(self, path: str) -> Dict:
+        """
+        Write the report as JSON and print a one-line summary per stage.
+
+        Args:
+            path (str): Report file
+
+        Returns:
+            Dict: The written report
+        """
+        report = self.report()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, default=str)
+
+        print(f"\nProfile ({report['total_time']:.3f}s total) written to {path}:")
+        for name, stage in sorted(report['stages'].items(), key=lambda item: -item[1]['total']):
+            print(f" - {name}: {stage['total']:.3f}s over {stage['count']} span(s)")
+        requests = report['requests']
+        print(f" - requests: {requests['count']} ({requests['bytes']} bytes, {requests['retries']} retries, "
+              f"{requests['sleep']:.3f}s sleeping, statuses {requests['by_status']})")
+        return report
+
+# Process-wide instance used by every instrumented module
+metrics = Instrumentation()
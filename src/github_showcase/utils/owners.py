@@ -0,0 +1,65 @@
+"""
+Accounts whose repositories a page lists
+"""
+import re
+from typing import Iterable, List, NamedTuple, Union
+
+# Prefix marking an organization in an owner spec, e.g. ``org:kubernetes``
+ORG_PREFIX = 'org:'
+
+_SEPARATORS = re.compile(r'[\s,]+')
+
+class Owner(NamedTuple):
+    """A GitHub account to list repositories of; ``kind`` is ``user`` or ``org``."""
+    kind: str
+    login: str
+
+    def __str__(self) -> str:
+        return f"{ORG_PREFIX}{self.login}" if self.kind == 'org' else self.login
+
+def parse_owner(spec: str) -> Owner:
+    """
+    Parse an owner spec: a username, or ``org:<name>`` for an organization.
+
+    Args:
+        spec (str): Owner spec
+
+    Returns:
+        Owner: Parsed owner
+
+    Raises:
+        ValueError: If the spec names no account
+    """
+    spec = spec.strip()
+    if spec.lower().startswith(ORG_PREFIX):
+        owner = Owner('org', spec[len(ORG_PREFIX):].strip())
+    else:
+        owner = Owner('user', spec)
+    if not owner.login:
+        raise ValueError(f"Invalid repository owner '{spec}'")
+    return owner
+
+def parse_owners(specs: Union[str, Iterable[str]]) -> List[Owner]:
+    """
+    Parse owner specs separated by commas or whitespace, keeping the first occurrence of each account.
+
+    Args:
+        specs (Union[str, Iterable[str]]): One string or several of owner specs
+
+    Returns:
+        List[Owner]: Owners in the given order
+    """
+    if isinstance(specs, str):
+        specs = [specs]
+    owners = []
+    seen = set()
+    for spec in specs:
+        for part in _SEPARATORS.split(spec):
+            if not part:
+                continue
+            owner = parse_owner(part)
+            # Logins are unique across users and organizations, and case-insensitive
+            if owner.login.lower() not in seen:
+                seen.add(owner.login.lower())
+                owners.append(owner)
+    return owners
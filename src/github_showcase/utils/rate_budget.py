@@ -0,0 +1,149 @@
+"""
+Proactive request budgeting from GitHub rate-limit headers
+"""
+import threading
+import time
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlparse
+from ..config.settings import RATE_BUDGET_BURST, RATE_BUDGET_PACING_THRESHOLD
+
+# Quota of REST requests; GraphQL and search have their own, named by X-RateLimit-Resource
+DEFAULT_RESOURCE = 'core'
+
+def resource_for(url: str) -> str:
+    """
+    Tell which quota a request draws from before its response names it.
+
+    Args:
+        url (str): API endpoint URL
+
+    Returns:
+        str: ``graphql``, ``search`` or ``core``
+    """
+    path = urlparse(url).path
+    if path.rstrip('/').endswith('/graphql'):
+        return 'graphql'
+    if '/search/' in path:
+        return 'search'
+    return DEFAULT_RESOURCE
+
+class _Bucket:
+    """Token bucket of one rate-limit resource; guarded by the owning RateBudget's lock."""
+
+    def __init__(self, burst: int):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.rate: Optional[float] = None
+        self.tokens = float(burst)
+        self.refilled_at = time.time()
+        self.blocked_until = 0.0
+
+    def refill(self, now: float, burst: int) -> None:
+        if self.rate is not None:
+            self.tokens = min(self.tokens + (now - self.refilled_at) * self.rate, float(burst))
+        else:
+            self.tokens = float(burst)
+        self.refilled_at = now
+
+class RateBudget:
+    """
+    Token buckets fed by the X-RateLimit-* headers of every response, one per rate-limit resource.
+
+    GitHub counts REST (``core``), GraphQL and search requests against
+    separate quotas and names the one a response belongs to in
+    ``X-RateLimit-Resource``, so each gets its own bucket and a GraphQL
+    fetch never paces REST enrichment requests or the other way round.
+
+    While plenty of a quota is left requests go out unthrottled. Once
+    ``X-RateLimit-Remaining`` drops below ``pacing_threshold`` of the limit, the
+    bucket refills at ``remaining / seconds-until-reset`` so the rest of the
+    quota is spread over the window instead of being spent up front. A single
+    instance is meant to be shared by every thread talking to the API.
+
+    Raises:
+        ValueError: If ``burst`` is below 1 or ``pacing_threshold`` outside 0..1
+    """
+
+    def __init__(self, pacing_threshold: float = RATE_BUDGET_PACING_THRESHOLD,
+                 burst: int = RATE_BUDGET_BURST):
+        # A bucket holding less than one token could never let a request through
+        if burst < 1:
+            raise ValueError(f"RATE_BUDGET_BURST must be at least 1, got {burst}")
+        if not 0 <= pacing_threshold <= 1:
+            raise ValueError(f"RATE_BUDGET_PACING_THRESHOLD must be between 0 and 1, got {pacing_threshold}")
+        self.pacing_threshold = pacing_threshold
+        self.burst = burst
+        self._buckets: Dict[str, _Bucket] = {}
+        # Set by defer() without a resource, e.g. for secondary rate limits
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _bucket(self, resource: str) -> _Bucket:
+        if resource not in self._buckets:
+            self._buckets[resource] = _Bucket(self.burst)
+        return self._buckets[resource]
+
+    def update(self, headers: Mapping[str, str], resource: str = DEFAULT_RESOURCE) -> None:
+        """
+        Update the budget from the rate-limit headers of a response.
+
+        Args:
+            headers: Response headers
+            resource (str): Quota the request was sent against, overridden by ``X-RateLimit-Resource``
+        """
+        try:
+            limit = int(headers['X-RateLimit-Limit'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset_at = float(headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+
+        with self._lock:
+            now = time.time()
+            bucket = self._bucket(headers.get('X-RateLimit-Resource') or resource)
+            bucket.refill(now, self.burst)
+            bucket.limit, bucket.remaining, bucket.reset_at = limit, remaining, reset_at
+            if remaining <= 0:
+                bucket.blocked_until = max(bucket.blocked_until, reset_at)
+                bucket.rate = None
+            elif remaining < limit * self.pacing_threshold:
+                bucket.rate = remaining / max(reset_at - now, 1.0)
+                bucket.tokens = min(bucket.tokens, float(remaining))
+            else:
+                bucket.rate = None
+
+    def defer(self, seconds: float, resource: Optional[str] = None) -> None:
+        """Hold back requests against ``resource``, or every request when None, for the given time."""
+        with self._lock:
+            until = time.time() + seconds
+            if resource is None:
+                self._blocked_until = max(self._blocked_until, until)
+            else:
+                bucket = self._bucket(resource)
+                bucket.blocked_until = max(bucket.blocked_until, until)
+
+    def reserve(self, resource: str = DEFAULT_RESOURCE) -> float:
+        """
+        Try to take a token without blocking.
+
+        Args:
+            resource (str): Quota the request is sent against, see resource_for
+
+        Returns:
+            float: 0 if the request may go out now, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            now = time.time()
+            bucket = self._bucket(resource)
+            blocked_until = max(self._blocked_until, bucket.blocked_until)
+            if blocked_until > now:
+                return blocked_until - now
+            bucket.refill(now, self.burst)
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                return 0.0
+            if not bucket.rate or bucket.rate <= 0:
+                # Not pacing (no rate-limit headers seen yet): nothing to wait for
+                return 0.0
+            return (1 - bucket.tokens) / bucket.rate
@@ -4,14 +4,45 @@ Rate limit handling utilities for GitHub API
 import time
 import random
 import os
-from typing import Dict, Optional
+from typing import Dict, Generator, Optional, Tuple
 import requests
+from ..config.settings import HTTP_POOL_SIZE, MAX_RATE_LIMIT_WAIT
+from .http_cache import HttpCache
+from .http_session import DEFAULT_TIMEOUT, TransportStats, create_session
+from .instrumentation import metrics
+from .rate_budget import RateBudget, resource_for
+
+# Actions yielded by RateLimitHandler.request_steps
+WAIT = 'wait'
+SEND = 'send'
+
+class RateLimitExceeded(Exception):
+    """
+    Raised when waiting for the rate limit to reset would take longer than allowed.
+
+    Completed work is worth keeping at that point: a checkpointed fetch
+    resumes from the pages it already saved once ``reset_at`` has passed.
+    """
+
+    def __init__(self, message: str, reset_at: float):
+        super().__init__(message)
+        self.reset_at = reset_at
 
 class RateLimitHandler:
-    def __init__(self):
+    def __init__(self, cache: Optional[HttpCache] = None, pool_size: int = HTTP_POOL_SIZE,
+                 budget: Optional[RateBudget] = None, max_rate_limit_wait: float = MAX_RATE_LIMIT_WAIT,
+                 timeout: Tuple[float, float] = DEFAULT_TIMEOUT):
         self.base_delay = 1
         self.max_retries = 3
+        self.max_rate_limit_wait = max_rate_limit_wait
         self.jitter_range = (1, 5)
+        self.cache = cache
+        self.stats = TransportStats()
+        # One keep-alive session per handler; headers are built once and reused
+        # Every request gets the (connect, read) timeout, so a stalled connection is retried instead of hanging
+        self.session = create_session(pool_size, self.stats, self.get_headers(), timeout)
+        # Shared by all threads using this handler so one rate-limit hit pauses every worker
+        self.budget = budget if budget is not None else RateBudget()
 
     def get_headers(self) -> Dict[str, str]:
         """Get headers for GitHub API requests with authentication if available."""
@@ -21,7 +52,7 @@ class RateLimitHandler:
             headers['Authorization'] = f'Bearer {github_token}'
         return headers
 
-    def handle_rate_limit(self, response: requests.Response) -> Optional[int]:
+    def handle_rate_limit(self, response: requests.Response) -> Optional[float]:
         """
         Handle GitHub API rate limit response.
         
@@ -29,29 +60,162 @@ class RateLimitHandler:
             response: API response object
             
         Returns:
-            Optional[int]: Wait time in seconds if rate limited, None otherwise
+            Optional[float]: Wait time in seconds if rate limited, None otherwise
         """
-        if response.status_code == 403 and 'rate limit exceeded' in response.text.lower():
+        if response.status_code not in (403, 429):
+            return None
+
+        # Secondary rate limits tell us exactly how long to back off
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return int(retry_after) + random.uniform(0, 1)
+        if 'secondary rate limit' in response.text.lower():
+            return 60 + random.uniform(*self.jitter_range)
+
+        if 'rate limit exceeded' in response.text.lower():
             reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
             current_time = int(time.time())
             wait_time = max(reset_time - current_time, 0)
             
             if not os.getenv('GITHUB_TOKEN'):
-                raise Exception(
+                raise RateLimitExceeded(
                     "GitHub API rate limit exceeded. Please set GITHUB_TOKEN environment variable "
-                    "to increase rate limit."
+                    "to increase rate limit.",
+                    reset_at=time.time() + wait_time,
                 )
             
             jitter = random.uniform(*self.jitter_range)
             return wait_time + jitter
         return None
 
+    def limit_exceeded(self, wait: float) -> RateLimitExceeded:
+        """Build the error for a rate-limit wait beyond ``max_rate_limit_wait``."""
+        reset_at = time.time() + wait
+        return RateLimitExceeded(
+            f"GitHub API rate limit resets in {wait:.0f} seconds, longer than the "
+            f"{self.max_rate_limit_wait:.0f} seconds a request may wait; retry after "
+            f"{time.strftime('%H:%M:%S', time.localtime(reset_at))}",
+            reset_at=reset_at,
+        )
+
     def get_exponential_backoff(self, retry_count: int) -> float:
         """Calculate exponential backoff with jitter."""
         delay = self.base_delay * (2 ** retry_count)
         jitter = random.uniform(0, 1)
         return delay + jitter
 
+    def request_steps(self, url: str, method: str = 'GET', ok_statuses: Tuple[int, ...] = (200,),
+                      **kwargs) -> Generator[Tuple[str, object], object, requests.Response]:
+        """
+        Run the retry, backoff and rate-limit logic of one API request without doing any I/O.
+
+        The generator yields ``(WAIT, seconds)`` when the caller must sleep and
+        ``(SEND, kwargs)`` when it must send the request; the caller resumes it
+        with the response, or throws the ``RequestException`` the send raised.
+        Its return value is the final response. make_request drives it with
+        blocking calls, AsyncClient with non-blocking ones, so both follow the
+        exact same semantics.
+        
+        Args:
+            url: API endpoint URL
+            method: HTTP method
+            ok_statuses: Statuses returned to the caller instead of retried, e.g. 404 for optional resources
+            **kwargs: Additional arguments for requests
+            
+        Raises:
+            RateLimitExceeded: If the rate limit resets too late to wait for it
+            Exception: If request fails after all retries
+        """
+        headers = dict(kwargs.get('headers') or {})
+        use_cache = self.cache is not None and method == 'GET'
+        if use_cache:
+            headers.update(self.cache.conditional_headers(url))
+        kwargs['headers'] = headers
+
+        # Requests are paced against the quota they draw from, REST and GraphQL separately
+        resource = resource_for(url)
+        # Per-call totals for the instrumentation report
+        trace = {'status': 0, 'latency': 0.0, 'size': 0, 'retries': -1, 'sleep': 0.0, 'cached': False}
+        # Rate limits are waited out without using up retries, but only up to max_rate_limit_wait
+        limit_wait = 0.0
+        try:
+            retry_count = 0
+            while retry_count < self.max_retries:
+                trace['retries'] += 1
+                try:
+                    # Wait for the shared budget; defer() from any caller shows up here
+                    waited = 0.0
+                    wait = self.budget.reserve(resource)
+                    while wait > 0:
+                        if limit_wait + wait > self.max_rate_limit_wait:
+                            raise self.limit_exceeded(wait)
+                        yield WAIT, wait
+                        waited += wait
+                        limit_wait += wait
+                        wait = self.budget.reserve(resource)
+                    trace['sleep'] += waited
+                    metrics.add_span('sleep', waited, reason='rate_budget')
+                    start = time.perf_counter()
+                    response = yield SEND, kwargs
+                    elapsed = time.perf_counter() - start
+                    self.stats.record_request(elapsed, response.elapsed.total_seconds())
+                    self.budget.update(response.headers, resource)
+                    trace.update(status=response.status_code, size=len(response.content))
+                    trace['latency'] += elapsed
+                    
+                    # Unchanged since the cached copy; 304s don't count against the rate limit
+                    if response.status_code == 304 and use_cache:
+                        cached = self.cache.get(url)
+                        if cached is not None:
+                            trace['cached'] = True
+                            return cached
+                        # Entry was evicted after the request was built; refetch unconditionally
+                        headers.pop('If-None-Match', None)
+                        headers.pop('If-Modified-Since', None)
+                        retry_count += 1
+                        continue
+                    
+                    # Check for rate limit; the budget wait above sleeps it out before the next attempt
+                    wait_time = self.handle_rate_limit(response)
+                    if wait_time:
+                        if limit_wait + wait_time > self.max_rate_limit_wait:
+                            raise self.limit_exceeded(wait_time)
+                        print(f"Rate limit exceeded. Waiting {wait_time:.2f} seconds...")
+                        # An exhausted quota holds back its own resource, a secondary limit every request
+                        exhausted = response.headers.get('X-RateLimit-Remaining') == '0'
+                        held = response.headers.get('X-RateLimit-Resource', resource) if exhausted else None
+                        self.budget.defer(wait_time, held)
+                        continue
+                    
+                    if response.status_code == 200:
+                        if use_cache:
+                            self.cache.store(url, response)
+                        return response
+                    if response.status_code in ok_statuses:
+                        return response
+                        
+                    if response.status_code != 200:
+                        print(f"API Error! Status Code: {response.status_code}")
+                        print(f"Response: {response.text}")
+                    retry_count += 1
+                        
+                except requests.exceptions.RequestException as e:
+                    # Timeouts included: the stalled connection is dropped and the request goes out again
+                    retry_count += 1
+                    if retry_count == self.max_retries:
+                        raise Exception(f"Failed to make request after {self.max_retries} retries: {str(e)}")
+                    
+                    delay = self.get_exponential_backoff(retry_count - 1)
+                    reason = "timed out" if isinstance(e, requests.exceptions.Timeout) else "failed"
+                    print(f"Request {reason}, retrying in {delay:.2f} seconds... (Attempt {retry_count}/{self.max_retries})")
+                    yield WAIT, delay
+                    trace['sleep'] += delay
+                    metrics.add_span('sleep', delay, reason='backoff')
+            
+            raise Exception(f"Failed to make request after {self.max_retries} retries")
+        finally:
+            metrics.record_request(method, url, **trace)
+
     def make_request(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
         """
         Make an API request with rate limit handling and retries.
@@ -59,7 +223,7 @@ class RateLimitHandler:
         Args:
             url: API endpoint URL
             method: HTTP method
-            **kwargs: Additional arguments for requests
+            **kwargs: Additional arguments for requests, and ``ok_statuses`` for request_steps
             
         Returns:
             Response object
@@ -67,33 +231,18 @@ class RateLimitHandler:
         Raises:
             Exception: If request fails after all retries
         """
-        headers = self.get_headers()
-        kwargs['headers'] = headers
-
-        for retry_count in range(self.max_retries):
+        steps = self.request_steps(url, method, **kwargs)
+        value, error = None, None
+        while True:
             try:
-                response = requests.request(method, url, **kwargs)
-                
-                # Check for rate limit
-                wait_time = self.handle_rate_limit(response)
-                if wait_time:
-                    print(f"Rate limit exceeded. Waiting {wait_time:.2f} seconds...")
-                    time.sleep(wait_time)
-                    continue
-                
-                if response.status_code == 200:
-                    return response
-                    
-                if response.status_code != 200:
-                    print(f"API Error! Status Code: {response.status_code}")
-                    print(f"Response: {response.text}")
-                    
+                action, argument = steps.send(value) if error is None else steps.throw(error)
+            except StopIteration as done:
+                return done.value
+            value, error = None, None
+            if action == WAIT:
+                time.sleep(argument)
+                continue
+            try:
+                value = self.session.request(method, url, **argument)
             except requests.exceptions.RequestException as e:
-                if retry_count == self.max_retries - 1:
-                    raise Exception(f"Failed to make request after {self.max_retries} retries: {str(e)}")
-                
-                delay = self.get_exponential_backoff(retry_count)
-                print(f"Request failed, retrying in {delay:.2f} seconds... (Attempt {retry_count + 1}/{self.max_retries})")
-                time.sleep(delay)
-        
-        raise Exception(f"Failed to make request after {self.max_retries} retries") 
\ No newline at end of file
+                error = e
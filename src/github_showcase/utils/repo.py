@@ -0,0 +1,114 @@
+"""
+Slim repository record built from the GitHub API payload
+"""
+from html import escape
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+from ..config.settings import LANGUAGES_SHOWN
+from .blog_mapper import get_blog_link, BLOG_MAPPING
+
+class Repo(NamedTuple):
+    """
+    Repository fields the generator uses, plus values precomputed for rendering.
+
+    Only the first RAW_FIELDS come from GitHub; the rest are derived from them
+    by make_repo so every page rendering a repository reuses the same escaped
+    and lowercased strings. ``languages`` and ``readme`` stay empty unless the
+    repository went through the enrichment stage.
+    """
+    name: str
+    full_name: str
+    description: str
+    homepage: str
+    topics: Tuple[str, ...]
+    html_url: str
+    pushed_at: str
+    stargazers_count: int
+    languages: Tuple[str, ...]  # Most used first
+    readme: str  # Plain text excerpt of the README
+    # Derived
+    name_html: str
+    summary: str  # Description, or the README excerpt when there is none
+    summary_html: str
+    homepage_html: str
+    topics_html: Tuple[str, ...]
+    languages_html: Tuple[str, ...]  # The first LANGUAGES_SHOWN languages
+    blog_url: str  # Empty when the repository has no blog post
+    search_text: str  # Lowercased visible row text
+
+RAW_FIELDS = Repo._fields[:10]
+
+def make_repo(name: str, full_name: str, description: Optional[str], homepage: Optional[str],
+              topics: Optional[Iterable[str]], html_url: str, pushed_at: Optional[str],
+              stargazers_count: Optional[int] = 0, languages: Optional[Iterable[str]] = None,
+              readme: Optional[str] = None) -> Repo:
+    """
+    Build a repository record from its raw field values.
+
+    Args:
+        name (str): Repository name
+        full_name (str): ``owner/name``
+        description (Optional[str]): Description, may be None
+        homepage (Optional[str]): Website URL, may be None or empty
+        topics (Optional[Iterable[str]]): Topics
+        html_url (str): GitHub page URL
+        pushed_at (Optional[str]): ISO timestamp of the last push
+        stargazers_count (Optional[int]): Number of stars
+        languages (Optional[Iterable[str]]): Languages, most used first
+        readme (Optional[str]): README excerpt
+
+    Returns:
+        Repo: Repository record
+    """
+    description = description or ''
+    homepage = homepage or ''
+    topics = tuple(topics or ())
+    languages = tuple(languages or ())
+    readme = readme or ''
+    summary = description or readme
+    shown_languages = languages[:LANGUAGES_SHOWN]
+    blog_url = (get_blog_link(name) or '') if name in BLOG_MAPPING else ''
+    search_parts = [name, summary]
+    search_parts.extend(shown_languages)
+    if homepage:
+        search_parts.append('Website')
+    search_parts.extend(topics)
+    search_parts.append('Read Blog' if blog_url else 'Coming Soon')
+    return Repo(
+        name, full_name, description, homepage, topics, html_url, pushed_at or '',
+        stargazers_count or 0, languages, readme,
+        name_html=escape(name),
+        summary=summary,
+        summary_html=escape(summary),
+        homepage_html=escape(homepage),
+        topics_html=tuple(escape(topic) for topic in topics),
+        languages_html=tuple(escape(language) for language in shown_languages),
+        blog_url=blog_url,
+        search_text=' '.join(search_parts).lower(),
+    )
+
+def replace_raw(repo: Repo, **changes) -> Repo:
+    """
+    Rebuild a repository record with some raw fields changed, recomputing the derived ones.
+
+    Args:
+        repo (Repo): Repository record
+        **changes: New values by raw field name
+
+    Returns:
+        Repo: Updated repository record
+    """
+    values = dict(zip(RAW_FIELDS, repo))
+    values.update(changes)
+    return make_repo(**values)
+
+def repo_from_api(data: Dict) -> Repo:
+    """
+    Build a repository record from a REST-shaped API payload, dropping every other field.
+
+    Args:
+        data (Dict): Repository data as returned by a fetch backend
+
+    Returns:
+        Repo: Repository record
+    """
+    return make_repo(*(data.get(field) for field in RAW_FIELDS))
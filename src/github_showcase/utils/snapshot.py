@@ -0,0 +1,221 @@
+"""
+Local snapshots of the filtered repository set
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, List, Dict, Optional, Sequence
+from ..config.settings import SNAPSHOT_DIR, ENRICH_WORKERS
+from .instrumentation import metrics
+from .owners import parse_owners
+from .repo import Repo, RAW_FIELDS, make_repo
+
+if TYPE_CHECKING:
+    # The fetch stack pulls in requests; offline runs only need the store
+    from .async_client import AsyncClient
+    from .checkpoint import CheckpointStore
+    from .enrichment import EnrichmentCache
+    from .rate_limit import RateLimitHandler
+
+SNAPSHOT_VERSION = 3
+
+# Raw repository fields; the derived Repo fields are rebuilt on load
+SNAPSHOT_FIELDS = RAW_FIELDS
+
+def diff_repositories(old: List[Repo], new: List[Repo]) -> Dict[str, List[str]]:
+    """
+    Compare two repository sets by ``full_name``.
+
+    Args:
+        old (List[Repo]): Previous repositories
+        new (List[Repo]): Current repositories
+
+    Returns:
+        Dict[str, List[str]]: ``added``, ``removed`` and ``changed`` repository names
+    """
+    old_by_name = {repo.full_name: repo for repo in old}
+    new_by_name = {repo.full_name: repo for repo in new}
+    return {
+        'added': [name for name in new_by_name if name not in old_by_name],
+        'removed': [name for name in old_by_name if name not in new_by_name],
+        'changed': [
+            name for name, repo in new_by_name.items()
+            if name in old_by_name and
+               repo[:len(SNAPSHOT_FIELDS)] != old_by_name[name][:len(SNAPSHOT_FIELDS)]
+        ],
+    }
+
+def snapshot_key(username: str, sources: Optional[Sequence[str]] = None) -> str:
+    """
+    Name the snapshot of a page after its user and the owners it lists.
+
+    A page listing only the user's own repositories keeps the plain
+    username; any other set of sources adds a digest of the normalized
+    owner list, so ``--source`` runs never load or diff another set.
+
+    Args:
+        username (str): GitHub username the page is named after
+        sources (Optional[Sequence[str]]): Owner specs the page lists, defaults to ``username``
+
+    Returns:
+        str: Snapshot name
+    """
+    owners = sorted(str(owner).lower() for owner in parse_owners(sources or username))
+    if owners == [username.lower()]:
+        return username
+    # '+' cannot appear in a GitHub login, so these never clash with a plain username
+    return f"{username}+{hashlib.sha256(','.join(owners).encode('utf-8')).hexdigest()[:12]}"
+
+class SnapshotStore:
+    """
+    Filtered repository sets persisted per page as ``<snapshot_dir>/<snapshot key>.json``.
+
+    A snapshot holds the field names once and one row per repository, in
+    render order, so loading it is a single ``json.load`` plus one make_repo call per row.
+    """
+
+    def __init__(self, snapshot_dir: str = SNAPSHOT_DIR):
+        self.snapshot_dir = snapshot_dir
+        self._lock = threading.Lock()
+
+    def path(self, username: str, sources: Optional[Sequence[str]] = None) -> str:
+        """Get the snapshot file of a user's page listing ``sources``, see snapshot_key."""
+        return os.path.join(self.snapshot_dir, f"{snapshot_key(username, sources)}.json")
+
+    def load(self, username: str, sources: Optional[Sequence[str]] = None) -> Optional[List[Repo]]:
+        """
+        Load the last saved repositories of a user's page.
+
+        Args:
+            username (str): GitHub username
+            sources (Optional[Sequence[str]]): Owner specs the page lists, defaults to ``username``
+
+        Returns:
+            Optional[List[Repo]]: Repositories in render order, None if there is no usable snapshot
+        """
+        try:
+            with open(self.path(username, sources), 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if snapshot.get('version') != SNAPSHOT_VERSION or tuple(snapshot.get('fields', ())) != SNAPSHOT_FIELDS:
+            return None
+        return [make_repo(*row) for row in snapshot['rows']]
+
+    def save(self, username: str, repos: List[Repo], sources: Optional[Sequence[str]] = None) -> None:
+        """
+        Save the repositories of a user's page and report what changed since the previous snapshot.
+
+        Args:
+            username (str): GitHub username
+            repos (List[Repo]): Filtered repositories in render order
+            sources (Optional[Sequence[str]]): Owner specs the page lists, defaults to ``username``
+        """
+        previous = self.load(username, sources)
+        if previous is not None:
+            diff = diff_repositories(previous, repos)
+            print(f"Snapshot diff for {username}: " +
+                  ', '.join(f"{len(names)} {kind}" for kind, names in diff.items()))
+            for kind, names in diff.items():
+                for name in names:
+                    print(f" {'+' if kind == 'added' else '-' if kind == 'removed' else '~'} {name}")
+
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'username': username,
+            'sources': [str(owner) for owner in parse_owners(sources or username)],
+            'fields': list(SNAPSHOT_FIELDS),
+            'rows': [repo[:len(SNAPSHOT_FIELDS)] for repo in repos],
+        }
+        path = self.path(username, sources)
+        with self._lock:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+
+def load_repositories(username: str, rate_limiter: Optional['RateLimitHandler'], concurrency: int,
+                      backend: str, snapshots: Optional[SnapshotStore] = None,
+                      offline: bool = False, enrichment: Optional['EnrichmentCache'] = None,
+                      enrich_workers: int = ENRICH_WORKERS,
+                      checkpoints: Optional['CheckpointStore'] = None,
+                      sources: Optional[Sequence[str]] = None) -> List[Repo]:
+    """
+    Get the filtered repositories of a user's page, from the API or from its snapshot.
+
+    Fetched repositories are enriched when ``enrichment`` is given and then
+    saved to ``snapshots``, so offline runs render the enriched data too.
+
+    Args:
+        username (str): GitHub username the page and its snapshot are named after
+        rate_limiter (Optional[RateLimitHandler]): Handler to send requests through
+        concurrency (int): Maximum number of pages fetched at once
+        backend (str): Name of the fetch backend
+        snapshots (Optional[SnapshotStore]): Store to save to, or to load from when offline
+        offline (bool): Render from the snapshot without contacting GitHub
+        enrichment (Optional[EnrichmentCache]): Cache of languages and READMEs, None to skip enrichment
+        enrich_workers (int): Maximum number of repositories enriched at once
+        checkpoints (Optional[CheckpointStore]): Store of interrupted fetches to resume
+        sources (Optional[Sequence[str]]): Owner specs the page lists, defaults to ``username``
+
+    Returns:
+        List[Repo]: Repositories in render order
+    """
+    if offline:
+        with metrics.span('snapshot_load', username=username):
+            repos = snapshots.load(username, sources) if snapshots is not None else None
+        if repos is None:
+            raise Exception(f"No snapshot for {username}, run once without --offline first")
+        print(f"Loaded {len(repos)} repositories for {username} from snapshot")
+        return repos
+
+    from .github_api import get_all_repositories
+
+    repos = get_all_repositories(rate_limiter, concurrency=concurrency, backend=backend, username=username,
+                                 checkpoints=checkpoints, sources=sources)
+    if enrichment is not None:
+        from .enrichment import enrich_repositories
+        repos = enrich_repositories(repos, rate_limiter, enrichment, enrich_workers)
+    if snapshots is not None:
+        with metrics.span('snapshot_save', username=username):
+            snapshots.save(username, repos, sources)
+    return repos
+
+async def load_repositories_async(username: str, client: 'AsyncClient', concurrency: int, backend: str,
+                                  snapshots: Optional[SnapshotStore] = None, offline: bool = False,
+                                  enrichment: Optional['EnrichmentCache'] = None,
+                                  enrich_workers: int = ENRICH_WORKERS,
+                                  checkpoints: Optional['CheckpointStore'] = None,
+                                  sources: Optional[Sequence[str]] = None) -> List[Repo]:
+    """
+    Asynchronous counterpart of load_repositories fetching through an AsyncClient.
+
+    Args:
+        username (str): GitHub username
+        client (AsyncClient): Client to send requests through
+        concurrency (int): Maximum number of pages fetched at once
+        backend (str): Name of the fetch backend
+        snapshots (Optional[SnapshotStore]): Store to save to, or to load from when offline
+        offline (bool): Render from the snapshot without contacting GitHub
+        enrichment (Optional[EnrichmentCache]): Cache of languages and READMEs, None to skip enrichment
+        enrich_workers (int): Maximum number of repositories enriched at once
+        checkpoints (Optional[CheckpointStore]): Store of interrupted fetches to resume
+        sources (Optional[Sequence[str]]): Owner specs the page lists, defaults to ``username``
+
+    Returns:
+        List[Repo]: Repositories in render order
+    """
+    if offline:
+        return load_repositories(username, None, concurrency, backend, snapshots, offline=True, sources=sources)
+
+    repos = await client.get_all_repositories(username, concurrency=concurrency, backend=backend,
+                                              checkpoints=checkpoints, sources=sources)
+    if enrichment is not None:
+        from .enrichment import enrich_repositories_async
+        repos = await enrich_repositories_async(repos, client, enrichment, enrich_workers)
+    if snapshots is not None:
+        with metrics.span('snapshot_save', username=username):
+            snapshots.save(username, repos, sources)
+    return repos
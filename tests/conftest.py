@@ -0,0 +1,43 @@
+"""
+Shared test setup: the package from src/ and a local stand-in for the GitHub API
+"""
+import os
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'src'), os.path.join(ROOT, 'benchmarks')]
+
+from fake_github import FakeGitHub  # noqa: E402
+
+# The settings read GITHUB_API_URL at import time, so the server is up before any test imports the package
+FAKE = FakeGitHub({'alice': 250, 'bob': 40, 'empty': 0}, poll_interval=0)
+os.environ['GITHUB_API_URL'] = FAKE.start()
+# The GraphQL backend insists on a token; the fake server never checks it
+os.environ['GITHUB_TOKEN'] = 'test-token'
+
+def synthetic_repo(index: int):
+    """Build a repository record with typical field sizes and a topic mix spread over the filters."""
+    from github_showcase.utils.repo import repo_from_api
+    return repo_from_api({
+        'name': f"project-{index}",
+        'full_name': f"someone/project-{index}",
+        'description': f"Sample project {index} showing <Docker> & \"Kubernetes\" deployments on AWS",
+        'homepage': f"https://example.com/project-{index}" if index % 2 else None,
+        'html_url': f"https://github.com/someone/project-{index}",
+        'topics': ["aws", "docker", "k8s", "terraform", "ci-cd"][:index % 6],
+        'pushed_at': "2024-01-01T00:00:00Z",
+    })
+
+@pytest.fixture
+def synthetic_repos():
+    """Factory of ``count`` synthetic repositories, see synthetic_repo."""
+    return lambda count: [synthetic_repo(index) for index in range(count)]
+
+@pytest.fixture
+def fake_github() -> FakeGitHub:
+    """The fake API with its counters reset and rate limiting off."""
+    FAKE.rate_limit_every = 0
+    FAKE.retry_after = 0
+    FAKE.reset_counters()
+    return FAKE
@@ -0,0 +1,38 @@
+"""
+Tests for batch pages and their snapshots
+"""
+import pytest
+from github_showcase.core.batch import read_usernames
+from github_showcase.utils.repo import make_repo
+from github_showcase.utils.snapshot import SnapshotStore, load_repositories, snapshot_key
+
+def write_users(tmp_path, text):
+    path = tmp_path / 'users.txt'
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+def test_repeated_lines_are_read_once(tmp_path):
+    path = write_users(tmp_path, "alice\n# comment\n\nbob   org:acme\nalice\nbob org:acme\n")
+    assert read_usernames(path) == ['alice', 'bob org:acme']
+
+def test_two_lines_building_the_same_page_are_rejected(tmp_path):
+    path = write_users(tmp_path, "bob org:acme\nBob\n")
+    with pytest.raises(ValueError, match=r"users.txt:2: 'Bob' builds the same page as 'bob org:acme'"):
+        read_usernames(path)
+
+def test_snapshots_are_keyed_on_the_listed_owners():
+    assert snapshot_key('bob') == snapshot_key('bob', ['bob']) == 'bob'
+    keys = {snapshot_key('bob', sources) for sources in (['bob'], ['org:bob'], ['bob org:acme'], ['bob', 'org:acme'])}
+    # The same owners listed in another order or split across specs share a snapshot
+    assert len(keys) == 3
+    assert snapshot_key('bob', ['org:acme', 'bob']) == snapshot_key('bob', ['bob org:acme'])
+
+def test_offline_runs_load_the_snapshot_of_their_sources(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    repo = make_repo(name='infra', full_name='acme/infra', description='', homepage='', topics=[],
+                     html_url='https://github.com/acme/infra', pushed_at='2024-05-01T10:00:00Z')
+    store.save('bob', [repo], ['bob org:acme'])
+
+    assert load_repositories('bob', None, 1, 'rest', store, offline=True, sources=['bob org:acme']) == [repo]
+    with pytest.raises(Exception, match="No snapshot for bob"):
+        load_repositories('bob', None, 1, 'rest', store, offline=True)
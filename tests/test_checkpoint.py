@@ -0,0 +1,44 @@
+"""
+Tests for fetch checkpoints
+"""
+import os
+from github_showcase.utils.checkpoint import CheckpointStore, FetchCheckpoint
+from github_showcase.utils.github_api import get_all_repositories, open_checkpoint
+from github_showcase.utils.owners import Owner
+from github_showcase.utils.rate_limit import RateLimitHandler
+
+STALE = {'name': 'stale', 'full_name': 'alice/stale', 'description': None, 'homepage': None,
+         'html_url': 'https://github.com/alice/stale', 'pushed_at': '2024-01-01T00:00:00Z',
+         'stargazers_count': 0, 'topics': [], 'archived': False, 'private': False, 'fork': False}
+
+def test_listings_of_the_same_owner_get_their_own_checkpoint(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    paths = {open_checkpoint(store, owner, backend).path
+             for owner in (Owner('user', 'alice'), Owner('org', 'alice'))
+             for backend in ('rest', 'graphql')}
+    # The GraphQL query is the same for users and organizations
+    assert len(paths) == 3
+
+def test_a_user_listing_checkpoint_is_not_resumed_by_the_organization_listing(tmp_path, fake_github):
+    store = CheckpointStore(str(tmp_path))
+    interrupted = open_checkpoint(store, Owner('user', 'alice'), 'rest')
+    interrupted.resume()
+    interrupted.add_page(1, [STALE])
+    interrupted.update(last_page=1)
+
+    repos = get_all_repositories(RateLimitHandler(), backend='rest', sources=['org:alice'], checkpoints=store)
+
+    assert 'alice/stale' not in [repo.full_name for repo in repos]
+    assert repos == get_all_repositories(RateLimitHandler(), backend='rest', sources=['org:alice'])
+    # The interrupted user fetch is still there to be resumed
+    assert os.path.exists(os.path.join(interrupted.path, 'page-00001.json'))
+
+def test_a_checkpoint_saved_for_another_query_starts_over(tmp_path):
+    saved = FetchCheckpoint(str(tmp_path), query='query-a')
+    saved.resume()
+    saved.add_page(1, [STALE])
+    saved.update(last_page=1)
+
+    resumed = FetchCheckpoint(str(tmp_path), query='query-a').resume()
+    assert [repo['full_name'] for repo in resumed[1]] == ['alice/stale']
+    assert FetchCheckpoint(str(tmp_path), query='query-b').resume() == {}
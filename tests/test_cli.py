@@ -0,0 +1,26 @@
+"""
+Tests for command line parsing
+"""
+import pytest
+from github_showcase import cli
+from github_showcase.config import settings
+
+SWITCHES = [('--minify', 'minify', 'MINIFY_OUTPUT'), ('--inline-badges', 'inline_badges', 'INLINE_BADGES'),
+            ('--precompress', 'precompress', 'PRECOMPRESS_OUTPUT'), ('--enrich', 'enrich', 'ENRICH_REPOSITORIES')]
+
+@pytest.mark.parametrize('flag, dest, setting', SWITCHES)
+def test_switches_enabled_in_the_settings_can_be_turned_off(monkeypatch, flag, dest, setting):
+    monkeypatch.setattr(settings, setting, True)
+    assert getattr(cli.parse_args(['build']), dest) is True
+    assert getattr(cli.parse_args(['build', f"--no-{flag[2:]}"]), dest) is False
+
+    monkeypatch.setattr(settings, setting, False)
+    assert getattr(cli.parse_args(['batch', 'users.txt', flag]), dest) is True
+
+def test_switches_without_boolean_optional_action(monkeypatch):
+    # Python 3.8 has no BooleanOptionalAction
+    monkeypatch.delattr(cli.argparse, 'BooleanOptionalAction')
+    monkeypatch.setattr(settings, 'MINIFY_OUTPUT', True)
+    assert cli.parse_args(['build']).minify is True
+    assert cli.parse_args(['build', '--no-minify']).minify is False
+    assert cli.parse_args(['build', '--no-minify', '--minify']).minify is True
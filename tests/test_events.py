@@ -0,0 +1,21 @@
+"""
+Tests for polling the event feeds in watch mode
+"""
+from github_showcase.utils.events import EventPoller
+from github_showcase.utils.owners import Owner
+from github_showcase.utils.rate_limit import RateLimitHandler
+
+def test_only_events_on_watched_repositories_trigger_a_refresh(fake_github):
+    poller = EventPoller(RateLimitHandler(), [Owner('user', 'bob')])
+    assert poller.poll() == []
+
+    # Bob starring or pushing to someone else's repository does not change his page
+    fake_github.add_event('bob', 'WatchEvent', 'bob/project-1')
+    fake_github.add_event('bob', 'WatchEvent', 'torvalds/linux')
+    fake_github.add_event('bob', 'PushEvent', 'alice/project-2')
+    assert poller.poll() == []
+
+    fake_github.push('bob', 3)
+    fake_github.add_event('bob', 'CreateEvent', 'Bob/new-project')
+    assert poller.poll() == ['CreateEvent Bob/new-project', 'PushEvent bob/project-3']
+    assert poller.poll() == []
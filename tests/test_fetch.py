@@ -0,0 +1,106 @@
+"""
+Tests for the fetch drivers and the sans-I/O listing helpers they share
+"""
+import asyncio
+import pytest
+from github_showcase.utils.async_client import AsyncClient
+from github_showcase.utils.checkpoint import CheckpointStore
+from github_showcase.utils.github_api import (
+    RestListing, fetch_page, fetch_steps, get_all_repositories, open_checkpoint, repos_url
+)
+from github_showcase.utils.graphql_api import GRAPHQL_URL, GraphQLListing
+from github_showcase.utils.owners import Owner
+from github_showcase.utils.rate_limit import RateLimitHandler
+
+ALICE = Owner('user', 'alice')
+
+def fetch(engine, **kwargs):
+    if engine == 'asyncio':
+        async def run():
+            async with AsyncClient() as client:
+                return await client.get_all_repositories('alice', **kwargs)
+        return asyncio.run(run())
+    return get_all_repositories(RateLimitHandler(), username='alice', **kwargs)
+
+def interrupt_rest(checkpoints):
+    """Save the first two of alice's three REST pages, as a failed run would."""
+    handler = RateLimitHandler()
+    listing = RestListing(ALICE, open_checkpoint(checkpoints, ALICE, 'rest'))
+    listing.add_first_page(handler.make_request(repos_url(ALICE, 1)))
+    listing.add_page(2, fetch_page(handler, ALICE, 2))
+    return listing.last_page
+
+def interrupt_graphql(checkpoints):
+    """Save the first GraphQL page of alice's listing, as a failed run would."""
+    listing = GraphQLListing(ALICE, open_checkpoint(checkpoints, ALICE, 'graphql'))
+    response = RateLimitHandler().make_request(GRAPHQL_URL, method='POST', json=listing.next_query())
+    listing.add_page(response.json())
+    return 3
+
+@pytest.mark.parametrize('engine', ['threads', 'asyncio'])
+@pytest.mark.parametrize('backend, interrupt', [('rest', interrupt_rest), ('graphql', interrupt_graphql)])
+def test_an_interrupted_fetch_resumes_where_it_stopped(tmp_path, fake_github, engine, backend, interrupt):
+    expected = fetch(engine, backend=backend)
+    checkpoints = CheckpointStore(str(tmp_path))
+    last_page = interrupt(checkpoints)
+    fake_github.reset_counters()
+
+    assert fetch(engine, backend=backend, checkpoints=checkpoints) == expected
+    # REST saved pages 1-2 and fetches page 3; GraphQL saved page 1 and follows the cursor for 2-3
+    assert fake_github.counters['requests'] == (1 if backend == 'rest' else last_page - 1)
+    assert not list(tmp_path.iterdir())
+
+@pytest.mark.parametrize('backend', ['rest', 'graphql'])
+def test_both_engines_produce_the_same_rows(fake_github, backend):
+    sources = ['alice', 'org:bob']
+    assert fetch('asyncio', backend=backend, sources=sources) == fetch('threads', backend=backend, sources=sources)
+
+def test_fetch_steps_filter_and_merge_what_the_driver_sends(tmp_path):
+    def raw(full_name, pushed_at, **flags):
+        return dict({'name': full_name.split('/')[1], 'full_name': full_name, 'description': None,
+                     'homepage': None, 'html_url': f"https://github.com/{full_name}", 'pushed_at': pushed_at,
+                     'stargazers_count': 0, 'topics': [], 'archived': False, 'private': False,
+                     'fork': False}, **flags)
+
+    steps = fetch_steps('alice', 'rest', CheckpointStore(str(tmp_path)), ['alice', 'org:acme'])
+    owner, checkpoint = steps.send(None)
+    assert owner == ALICE and checkpoint is not None
+    owner, _ = steps.send([raw('alice/old', '2023-01-01T00:00:00Z'),
+                           raw('alice/fork', '2024-06-01T00:00:00Z', fork=True)])
+    assert owner == Owner('org', 'acme')
+    with pytest.raises(StopIteration) as done:
+        steps.send([raw('acme/new', '2024-01-01T00:00:00Z')])
+    assert [repo.full_name for repo in done.value.value] == ['acme/new', 'alice/old']
+
+def test_fetch_steps_report_and_reraise_errors(tmp_path, capsys):
+    steps = fetch_steps('alice', 'rest', CheckpointStore(str(tmp_path)))
+    steps.send(None)
+    with pytest.raises(RuntimeError, match="boom"):
+        steps.throw(RuntimeError("boom"))
+    assert "Error fetching repositories of alice: boom" in capsys.readouterr().out
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown fetch backend"):
+        next(fetch_steps('alice', 'soap'))
+
+def test_async_pages_in_flight_are_saved_when_another_page_fails(tmp_path, fake_github, monkeypatch):
+    owner = Owner('user', 'alice')
+    fetch_page_original = AsyncClient.fetch_page
+
+    async def flaky_fetch_page(self, owner, page):
+        if page == 3:
+            raise RuntimeError("page 3 failed")
+        # Still in flight when page 3 fails
+        await asyncio.sleep(0.05)
+        return await fetch_page_original(self, owner, page)
+
+    monkeypatch.setattr(AsyncClient, 'fetch_page', flaky_fetch_page)
+    checkpoint = open_checkpoint(CheckpointStore(str(tmp_path)), owner, 'rest')
+
+    async def run():
+        async with AsyncClient() as client:
+            return await client.fetch_rest_repositories(owner, concurrency=2, checkpoint=checkpoint)
+
+    with pytest.raises(RuntimeError, match="page 3 failed"):
+        asyncio.run(run())
+    assert sorted(open_checkpoint(CheckpointStore(str(tmp_path)), owner, 'rest').resume()) == [1, 2]
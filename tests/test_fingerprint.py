@@ -0,0 +1,46 @@
+"""
+Tests for page fingerprints
+"""
+import os
+import shutil
+from github_showcase.core import fingerprint
+from github_showcase.core.fingerprint import compute_fingerprint
+from github_showcase.core.html_generator import generate_html_table
+from github_showcase.utils.repo import make_repo
+
+def sample_repo(**overrides):
+    fields = dict(name='infra', full_name='alice/infra', description='Terraform modules', homepage='',
+                  topics=['aws'], html_url='https://github.com/alice/infra', pushed_at='2024-05-01T10:00:00Z')
+    fields.update(overrides)
+    return make_repo(**fields)
+
+def test_star_counts_only_count_when_shown():
+    before, after = [sample_repo(stargazers_count=1)], [sample_repo(stargazers_count=2)]
+    # Without the stars option the page is the same, and so is its fingerprint
+    assert generate_html_table(before) == generate_html_table(after)
+    assert compute_fingerprint(before) == compute_fingerprint(after)
+    assert compute_fingerprint(before, {'stars': True}) != compute_fingerprint(after, {'stars': True})
+
+def test_blog_links_and_paging_settings_are_fingerprinted(monkeypatch):
+    repos = [sample_repo()]
+    baseline = compute_fingerprint(repos)
+    assert compute_fingerprint([repos[0]._replace(blog_url='https://blog.example/infra')]) != baseline
+
+    for setting, value in (('BLOG_BASE_URL', 'https://blog.example'), ('PAGE_SIZE', 7),
+                           ('PAGED_ROW_THRESHOLD', 3), ('LANGUAGES_SHOWN', 9)):
+        with monkeypatch.context() as patch:
+            patch.setattr(fingerprint, setting, value)
+            assert compute_fingerprint(repos) != baseline, setting
+
+def test_generator_digest_covers_the_repo_record_and_the_settings(monkeypatch, tmp_path):
+    # Point the digest at a copy of the package, then edit files outside core/
+    package_dir = tmp_path / 'github_showcase'
+    shutil.copytree(os.path.dirname(os.path.dirname(fingerprint.__file__)), package_dir)
+    monkeypatch.setattr(fingerprint, '__file__', str(package_dir / 'core' / 'fingerprint.py'))
+    digest = fingerprint._generator_digest.__wrapped__
+    baseline = digest()
+    for source in fingerprint.GENERATOR_SOURCES:
+        with open(package_dir / source, 'a', encoding='utf-8') as f:
+            f.write('\n# edited\n')
+        assert digest() != baseline, source
+        baseline = digest()
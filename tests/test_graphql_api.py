@@ -0,0 +1,70 @@
+"""
+Tests for the GraphQL backend against the local fake API
+"""
+import pytest
+from github_showcase.utils.github_api import get_all_repositories
+from github_showcase.utils.graphql_api import fetch_graphql_repositories, node_to_repo, parse_page
+from github_showcase.utils.owners import Owner
+from github_showcase.utils.rate_limit import RateLimitHandler
+
+NODE = {
+    'name': 'infra',
+    'nameWithOwner': 'alice/infra',
+    'description': 'Terraform modules',
+    'homepageUrl': 'https://example.com',
+    'url': 'https://github.com/alice/infra',
+    'pushedAt': '2024-05-01T10:00:00Z',
+    'stargazerCount': 7,
+    'isArchived': False,
+    'isFork': False,
+    'isPrivate': False,
+    'repositoryTopics': {'nodes': [{'topic': {'name': 'aws'}}, {'topic': {'name': 'terraform'}}]},
+}
+
+def payload(nodes, has_next: bool, cursor: str = 'c1') -> dict:
+    return {'data': {'repositoryOwner': {'repositories': {
+        'pageInfo': {'hasNextPage': has_next, 'endCursor': cursor},
+        'nodes': nodes,
+    }}}}
+
+def test_node_to_repo_uses_the_rest_field_names():
+    assert node_to_repo(NODE) == {
+        'name': 'infra',
+        'full_name': 'alice/infra',
+        'description': 'Terraform modules',
+        'homepage': 'https://example.com',
+        'html_url': 'https://github.com/alice/infra',
+        'pushed_at': '2024-05-01T10:00:00Z',
+        'stargazers_count': 7,
+        'topics': ['aws', 'terraform'],
+        'archived': False,
+        'fork': False,
+        'private': False,
+    }
+
+def test_parse_page_returns_the_next_cursor_only_when_there_is_a_next_page():
+    batch, cursor = parse_page(payload([NODE], has_next=True, cursor='abc'))
+    assert [repo['full_name'] for repo in batch] == ['alice/infra']
+    assert cursor == 'abc'
+    assert parse_page(payload([NODE], has_next=False))[1] is None
+
+def test_parse_page_raises_on_errors():
+    with pytest.raises(Exception, match="Could not resolve"):
+        parse_page({'data': None, 'errors': [{'message': "Could not resolve to a User"}]})
+    with pytest.raises(Exception, match="not found"):
+        parse_page({'data': {'repositoryOwner': None}})
+
+def test_cursor_pagination_fetches_every_page(fake_github):
+    repos = fetch_graphql_repositories(RateLimitHandler(), Owner('user', 'alice'))
+
+    expected = [repo for repo in fake_github.repos('alice') if not (repo['fork'] or repo['archived'])]
+    # 250 repositories less the ones filtered by the server take three pages of 100
+    assert fake_github.counters['requests'] == (len(expected) + 99) // 100
+    assert [repo['full_name'] for repo in repos] == [repo['full_name'] for repo in expected]
+
+@pytest.mark.parametrize('sources', [None, ['org:alice'], ['alice', 'org:bob']])
+def test_rest_and_graphql_produce_the_same_rows(fake_github, sources):
+    rest = get_all_repositories(RateLimitHandler(), backend='rest', username='alice', sources=sources)
+    graphql = get_all_repositories(RateLimitHandler(), backend='graphql', username='alice', sources=sources)
+    assert rest
+    assert graphql == rest
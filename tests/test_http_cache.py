@@ -0,0 +1,78 @@
+"""
+Tests for the on-disk HTTP cache
+"""
+import os
+import requests
+from github_showcase.utils.enrichment import LANGUAGES_URL
+from github_showcase.utils.http_cache import HttpCache
+from github_showcase.utils.rate_limit import RateLimitHandler
+
+def make_response(body: str, etag: str = '"v1"') -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body.encode('utf-8')
+    response.encoding = 'utf-8'
+    response.headers['ETag'] = etag
+    return response
+
+def test_not_modified_is_replayed_from_disk(tmp_path, fake_github):
+    handler = RateLimitHandler(cache=HttpCache(str(tmp_path), 2**20))
+    url = LANGUAGES_URL.format(full_name='alice/project-3')
+
+    first = handler.make_request(url)
+    second = handler.make_request(url)
+
+    assert fake_github.counters['requests'] == 2
+    assert fake_github.counters['not_modified'] == 1
+    assert not getattr(first, 'from_cache', False)
+    assert second.from_cache
+    assert second.json() == first.json()
+
+def test_entries_without_validator_are_not_stored(tmp_path):
+    cache = HttpCache(str(tmp_path), 2**20)
+    response = make_response('{}')
+    del response.headers['ETag']
+    cache.store('https://api.test/a', response)
+    assert cache.get('https://api.test/a') is None
+    assert os.listdir(tmp_path) == []
+
+def test_least_recently_used_entry_is_evicted_first(tmp_path):
+    body = 'x' * 100
+    probe = HttpCache(str(tmp_path / 'probe'), 2**20)
+    probe.store('https://api.test/a', make_response(body))
+    entry_size = os.path.getsize(probe._path('https://api.test/a'))
+
+    cache = HttpCache(str(tmp_path / 'cache'), 3 * entry_size)
+    for name in 'abc':
+        cache.store(f'https://api.test/{name}', make_response(body))
+    # Replaying 'a' makes 'b' the least recently used entry
+    assert cache.get('https://api.test/a') is not None
+    cache.store('https://api.test/d', make_response(body))
+
+    assert cache.get('https://api.test/b') is None
+    for name in 'acd':
+        assert cache.get(f'https://api.test/{name}') is not None
+
+def test_recency_survives_a_restart(tmp_path):
+    body = 'x' * 100
+    cache = HttpCache(str(tmp_path), 2**20)
+    for age, name in enumerate('abc'):
+        cache.store(f'https://api.test/{name}', make_response(body))
+        # Oldest first: 'a' was used longest ago
+        mtime = 1_000_000 + age
+        os.utime(cache._path(f'https://api.test/{name}'), (mtime, mtime))
+    entry_size = os.path.getsize(cache._path('https://api.test/a'))
+
+    reopened = HttpCache(str(tmp_path), 3 * entry_size)
+    reopened.store('https://api.test/d', make_response(body))
+
+    assert not os.path.exists(reopened._path('https://api.test/a'))
+    for name in 'bcd':
+        assert os.path.exists(reopened._path(f'https://api.test/{name}'))
+
+def test_overwriting_an_entry_keeps_the_tracked_size(tmp_path):
+    cache = HttpCache(str(tmp_path), 2**20)
+    for version in range(5):
+        cache.store('https://api.test/a', make_response('x' * 100, f'"v{version}"'))
+    assert cache._total == os.path.getsize(cache._path('https://api.test/a'))
+    assert cache.conditional_headers('https://api.test/a') == {'If-None-Match': '"v4"'}
@@ -0,0 +1,67 @@
+"""
+Tests for the shared rate budget
+"""
+import time
+import pytest
+from github_showcase.utils.rate_budget import RateBudget, resource_for
+
+def headers(limit: int, remaining: int, reset_in: float) -> dict:
+    return {
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(time.time() + reset_in),
+    }
+
+def test_requests_go_out_before_any_headers_arrive():
+    budget = RateBudget(burst=2)
+    assert [budget.reserve() for _ in range(5)] == [0.0] * 5
+
+@pytest.mark.parametrize('burst', [0, -1])
+def test_burst_below_one_is_rejected(burst):
+    with pytest.raises(ValueError, match="RATE_BUDGET_BURST"):
+        RateBudget(burst=burst)
+
+def test_pacing_threshold_outside_unit_range_is_rejected():
+    with pytest.raises(ValueError, match="RATE_BUDGET_PACING_THRESHOLD"):
+        RateBudget(pacing_threshold=1.5)
+
+def test_low_quota_is_paced_over_the_window():
+    budget = RateBudget(pacing_threshold=0.5, burst=1)
+    budget.update(headers(5000, 100, 1000))
+    assert budget.reserve() == 0.0
+    # 100 requests left for 1000 seconds: one every ~10 seconds
+    assert budget.reserve() == pytest.approx(10.0, rel=0.05)
+
+def test_exhausted_quota_waits_for_the_reset():
+    budget = RateBudget()
+    budget.update(headers(5000, 0, 60))
+    assert budget.reserve() == pytest.approx(60.0, abs=1.0)
+
+def test_each_resource_has_its_own_bucket():
+    budget = RateBudget()
+    budget.update(dict(headers(5000, 0, 60), **{'X-RateLimit-Resource': 'graphql'}))
+    assert budget.reserve('graphql') == pytest.approx(60.0, abs=1.0)
+    # REST requests, e.g. enrichment during a GraphQL fetch, are not held back
+    assert budget.reserve('core') == 0.0
+
+def test_the_request_resource_is_used_when_the_response_names_none():
+    budget = RateBudget()
+    budget.update(headers(5000, 0, 60), resource='graphql')
+    assert budget.reserve('graphql') > 0
+    assert budget.reserve() == 0.0
+
+def test_defer_without_a_resource_holds_back_every_request():
+    budget = RateBudget()
+    budget.defer(30, 'graphql')
+    assert budget.reserve('core') == 0.0
+    budget.defer(30)
+    assert budget.reserve('core') == pytest.approx(30.0, abs=1.0)
+
+@pytest.mark.parametrize('url, resource', [
+    ('https://api.github.com/graphql', 'graphql'),
+    ('https://ghe.example.com/api/graphql', 'graphql'),
+    ('https://api.github.com/search/repositories?q=x', 'search'),
+    ('https://api.github.com/users/alice/repos?page=2', 'core'),
+])
+def test_resource_for(url, resource):
+    assert resource_for(url) == resource
@@ -0,0 +1,85 @@
+"""
+Tests for request timeouts and retries
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from github_showcase.utils.async_client import AsyncClient
+from github_showcase.utils.rate_limit import RateLimitHandler
+
+class StallingServer:
+    """Local server whose first ``stalls`` responses hang longer than the client's read timeout."""
+
+    def __init__(self, stalls: int, stall_seconds: float = 2.0):
+        self.stalls = stalls
+        self.stall_seconds = stall_seconds
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    stall = server.requests <= server.stalls
+                if stall:
+                    time.sleep(server.stall_seconds)
+                body = json.dumps({'ok': True}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/resource"
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+@pytest.fixture
+def stalling_server():
+    server = StallingServer(stalls=1)
+    yield server
+    server.stop()
+
+def quick_handler() -> RateLimitHandler:
+    handler = RateLimitHandler(timeout=(1, 0.3))
+    handler.base_delay = 0
+    return handler
+
+def test_stalled_response_times_out_and_is_retried(stalling_server):
+    start = time.perf_counter()
+    response = quick_handler().make_request(stalling_server.url)
+
+    assert response.json() == {'ok': True}
+    assert stalling_server.requests == 2
+    assert time.perf_counter() - start < stalling_server.stall_seconds
+
+def test_async_client_applies_the_same_timeout(stalling_server):
+    async def fetch():
+        async with AsyncClient(quick_handler()) as client:
+            return await client.request(stalling_server.url)
+
+    assert asyncio.run(fetch()).json() == {'ok': True}
+    assert stalling_server.requests == 2
+
+def test_gives_up_after_the_retries():
+    server = StallingServer(stalls=10)
+    try:
+        with pytest.raises(Exception, match="retries"):
+            quick_handler().make_request(server.url)
+        assert server.requests == 3
+    finally:
+        server.stop()
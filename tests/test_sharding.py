@@ -0,0 +1,49 @@
+"""
+Tests for sharded output
+"""
+import os
+import pytest
+from github_showcase.core.fingerprint import FingerprintStore
+from github_showcase.core import postprocess
+from github_showcase.core.sharding import plan_shards, render_shards, write_index_page
+
+def read_pages(out_dir):
+    pages = {}
+    for root, _, names in os.walk(out_dir):
+        for name in names:
+            if name.endswith('.html'):
+                with open(os.path.join(root, name), encoding='utf-8') as f:
+                    pages[os.path.relpath(os.path.join(root, name), out_dir)] = f.read()
+    return pages
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_shards_are_written_once_and_then_left_alone(tmp_path, synthetic_repos, workers):
+    repos = synthetic_repos(60)
+    out_dir = str(tmp_path / 'site')
+    fingerprints = FingerprintStore(str(tmp_path / 'fingerprints.json'))
+
+    first = render_shards(repos, out_dir, 0, workers, fingerprints)
+    assert first['written'] and not first['unchanged']
+    # Fingerprints recorded for worker processes reach the store too
+    assert all(fingerprints.get(path) for path in first['written'])
+
+    second = render_shards(repos, out_dir, 0, workers, FingerprintStore(str(tmp_path / 'fingerprints.json')))
+    assert not second['written']
+    assert sorted(second['unchanged']) == sorted(first['written'])
+
+def test_process_pool_writes_the_same_pages(tmp_path, synthetic_repos):
+    repos = synthetic_repos(60)
+    for workers in (1, 2):
+        render_shards(repos, str(tmp_path / str(workers)), 0, workers,
+                      FingerprintStore(str(tmp_path / f"{workers}.json")))
+    assert read_pages(str(tmp_path / '1')) == read_pages(str(tmp_path / '2'))
+
+def test_index_page_inlines_badges_when_asked(tmp_path, monkeypatch, synthetic_repos):
+    monkeypatch.setattr(postprocess, 'fetch_badge', lambda url, cache_dir=None: b'<svg/>')
+    shards = plan_shards(synthetic_repos(5))
+
+    write_index_page(str(tmp_path), shards, {'badges': True})
+
+    html = (tmp_path / 'index.html').read_text(encoding='utf-8')
+    assert 'img.shields.io' not in html
+    assert 'data:image/svg+xml;base64,' in html
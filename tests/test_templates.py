@@ -0,0 +1,34 @@
+"""
+Tests for the page markup
+"""
+from github_showcase.core.html_generator import generate_html_table
+from github_showcase.core.templates import render_row
+from github_showcase.utils.repo import make_repo
+
+def sample_repo(**overrides):
+    fields = dict(name='infra', full_name='alice/infra', description='Terraform <modules>',
+                  homepage='https://example.com', topics=['aws', 'Terraform'],
+                  html_url='https://github.com/alice/infra', pushed_at='2024-05-01T10:00:00Z')
+    fields.update(overrides)
+    return make_repo(**fields)
+
+def test_row_escapes_text_and_lists_topics():
+    row = render_row(sample_repo())
+    assert 'Terraform &lt;modules&gt;' in row
+    assert '<span class="tag">aws</span><span class="tag">Terraform</span>' in row
+
+def test_rows_carry_no_tag_attribute():
+    # Filtering reads the row index bitmasks, the rows themselves need no tag list
+    row = render_row(sample_repo())
+    assert row.lstrip().startswith('<tr>')
+    assert 'data-tags' not in generate_html_table([sample_repo()], mode='full')
+
+def test_stars_are_shown_only_when_requested():
+    repo = sample_repo(stargazers_count=42)
+    assert 'class="stars"' not in render_row(repo)
+    assert '★ 42' in render_row(repo, stars=True)
+    for mode in ('full', 'paged'):
+        assert '★ 42' not in generate_html_table([repo], mode=mode)
+    # Paged rows carry the count in the row index instead of the markup
+    assert ',42,[' in generate_html_table([repo], mode='paged', stars=True)
+    assert ',0,[' in generate_html_table([repo], mode='paged')